@@ -24,3 +24,13 @@ class AgentBase(ABC):
     def run_scenario(self, scenario: TestScenario) -> AgentOutput:
         """Run the agent on a given test scenario and return its output."""
         ...
+
+    def cancel(self, scenario: TestScenario) -> None:
+        """Called when ``run_scenario`` for ``scenario`` has missed its deadline.
+
+        Agents that can abort in-flight work (close a stream, kill a request)
+        should override this; the default does nothing. ``scenario`` is the
+        object that call was given, and the executor gives every call its own
+        copy, so in-flight state should be keyed by ``id(scenario)``: the
+        scenario ID repeats across concurrent trials.
+        """
@@ -0,0 +1,20 @@
+"""Agent that answers generated scenarios (``eval-runner --generate``) with their synthetic responses."""
+
+from __future__ import annotations
+
+from eval_caregiver.agent.base import AgentBase, AgentOutput
+from eval_caregiver.scenarios.generator import ScenarioGenerator
+from eval_caregiver.schemas.scenarios import TestScenario
+
+
+class GeneratedAgent(AgentBase):
+    """Returns the synthetic response for a generated scenario by regenerating its case.
+
+    Nothing is stored per scenario, so it serves corpora of any size.
+    """
+
+    def __init__(self, generator: ScenarioGenerator) -> None:
+        self._generator = generator
+
+    def run_scenario(self, scenario: TestScenario) -> AgentOutput:
+        return self._generator.case(self._generator.index_of(scenario.scenario_id)).response
@@ -0,0 +1,127 @@
+"""HTTP agent adapter with a shared keep-alive connection pool."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import queue
+import threading
+import time
+from urllib.parse import urlsplit
+
+from eval_caregiver.agent.base import AgentBase, AgentOutput
+from eval_caregiver.agent.protocol import agent_request, parse_agent_reply
+from eval_caregiver.schemas.scenarios import TestScenario
+
+# Statuses worth retrying: the agent is overloaded or briefly unavailable.
+_RETRY_STATUSES = {429, 502, 503, 504}
+
+
+class AgentHTTPError(RuntimeError):
+    """The agent endpoint returned an error status or could not be reached."""
+
+
+class HttpAgent(AgentBase):
+    """Posts each scenario to an HTTP endpoint and validates the JSON reply.
+
+    The request body is :func:`~eval_caregiver.agent.protocol.agent_request`;
+    the reply must use the ``data/responses`` layout. Connections are HTTP/1.1
+    keep-alive and pooled across worker threads, at most ``max_connections``
+    requests are in flight at once, and connection errors and retryable
+    statuses (429, 502, 503, 504) are retried up to ``retries`` times with
+    exponential backoff. A request that times out is not retried, so a call
+    never takes much longer than ``timeout``, and no connection slot is held
+    while backing off.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        max_connections: int = 8,
+        timeout: float = 60.0,
+        retries: int = 2,
+        backoff: float = 0.5,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Agent URL must be http:// or https://, got {url!r}")
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be >= 1, got {max_connections}")
+        self.url = url
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path or "/"
+        if parts.query:
+            self._path += f"?{parts.query}"
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+        self._headers = {"Content-Type": "application/json", "Accept": "application/json", **(headers or {})}
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        self.connections_opened = 0
+        self._lock = threading.Lock()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                self.connections_opened += 1
+            return self._connection_class(self._host, self._port, timeout=self._timeout)
+
+    def _post(self, body: bytes) -> tuple[int, bytes]:
+        conn = self._connection()
+        try:
+            conn.request("POST", self._path, body=body, headers=self._headers)
+            response = conn.getresponse()
+            data = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            self._idle.put(conn)
+        return response.status, data
+
+    def run_scenario(self, scenario: TestScenario) -> AgentOutput:
+        body = json.dumps(agent_request(scenario)).encode()
+        error = ""
+        for attempt in range(self._retries + 1):
+            if attempt:
+                time.sleep(self._backoff * 2 ** (attempt - 1))
+            try:
+                with self._slots:
+                    status, data = self._post(body)
+            except TimeoutError as e:
+                raise AgentHTTPError(
+                    f"Agent request for {scenario.scenario_id!r} timed out after {self._timeout:.2f}s"
+                ) from e
+            except (OSError, http.client.HTTPException) as e:
+                error = f"{type(e).__name__}: {e}"
+                continue
+            if status in _RETRY_STATUSES:
+                error = f"HTTP {status}"
+                continue
+            if status != 200:
+                raise AgentHTTPError(
+                    f"Agent returned HTTP {status} for {scenario.scenario_id!r}: {data[:200]!r}"
+                )
+            return parse_agent_reply(data, scenario.scenario_id)
+        raise AgentHTTPError(
+            f"Agent request for {scenario.scenario_id!r} failed after {self._retries + 1} attempt(s): {error}"
+        )
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
@@ -0,0 +1,133 @@
+"""Packed, memory-mapped store of recorded agent responses.
+
+A pack file holds every response from a ``data/responses``-style directory in
+one file::
+
+    header  MAGIC (4 bytes) | version u32 | index offset u64 | index length u64
+    data    the response JSON documents, back to back
+    index   JSON object {scenario_id: [offset, length]}
+
+The reader maps the file read-only, so opening a pack is one ``open`` plus
+reading the index, a record is reached by slicing the map without copying the
+rest of the file, and worker processes that open the same pack share its pages
+through the OS page cache. Only the requested record is decoded.
+
+Build a pack with ``python -m eval_caregiver.agent.packed_store data/responses -o responses.pack``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+from eval_caregiver.agent.base import AgentOutput
+from eval_caregiver.agent.response_store import (
+    DEFAULT_MAX_CACHED,
+    BaseResponseStore,
+    response_from_json,
+)
+from eval_caregiver.schemas.ingest import validate_json
+
+MAGIC = b"ECRP"
+PACK_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sIQQ")
+
+
+def pack_responses(responses_dir: Path, output_path: Path) -> int:
+    """Pack every ``<scenario_id>.json`` in ``responses_dir`` into ``output_path``; return the count.
+
+    The pack is written to a temporary file and renamed into place, so readers
+    that already have the old pack mapped keep a consistent view.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=output_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"\0" * _HEADER.size)
+            index: dict[str, list[int]] = {}
+            for path in sorted(Path(responses_dir).glob("*.json")):
+                data = path.read_bytes()
+                index[path.stem] = [f.tell(), len(data)]
+                f.write(data)
+            index_offset = f.tell()
+            index_bytes = json.dumps(index, separators=(",", ":")).encode()
+            f.write(index_bytes)
+            f.seek(0)
+            f.write(_HEADER.pack(MAGIC, PACK_FORMAT_VERSION, index_offset, len(index_bytes)))
+        os.replace(tmp, output_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return len(index)
+
+
+class PackedResponseStore(BaseResponseStore):
+    """Responses served from a memory-mapped pack file."""
+
+    def __init__(self, path: Path, *, max_cached: int = DEFAULT_MAX_CACHED) -> None:
+        super().__init__(max_cached=max_cached)
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_offset, index_length = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != PACK_FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(
+                f"{self.path} is not a version {PACK_FORMAT_VERSION} response pack "
+                f"(magic={magic!r}, version={version})"
+            )
+        self._view = memoryview(self._map)
+        self._index = validate_json(
+            dict[str, tuple[int, int]], self._view[index_offset:index_offset + index_length].tobytes()
+        )
+
+    def raw(self, scenario_id: str) -> memoryview:
+        """The undecoded JSON bytes of one response, as a view into the map."""
+        offset, length = self._index[scenario_id]
+        return self._view[offset:offset + length]
+
+    def _load(self, scenario_id: str) -> AgentOutput:
+        return response_from_json(self.raw(scenario_id).tobytes())
+
+    def __contains__(self, scenario_id: object) -> bool:
+        return scenario_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        """Release the mapping; outstanding ``raw`` views must be released first."""
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self) -> PackedResponseStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Pack recorded responses into one memory-mappable file")
+    parser.add_argument("responses_dir", type=str, help="Directory of <scenario_id>.json responses")
+    parser.add_argument("-o", "--output", type=str, required=True, help="Pack file to write")
+    args = parser.parse_args(argv)
+
+    count = pack_responses(Path(args.responses_dir), Path(args.output))
+    print(f"Packed {count} responses into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
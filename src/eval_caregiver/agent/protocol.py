@@ -0,0 +1,41 @@
+"""Wire format shared by the out-of-process agent adapters.
+
+Requests carry only what the agent may see: the scenario ID and the simulated
+caregiver state. Expected answers, grader names and scenario descriptions stay
+on the eval side (see INTEGRATION.md, "Boundaries Between Eval and Agent").
+Replies use the ``data/responses/<scenario_id>.json`` layout.
+"""
+
+from __future__ import annotations
+
+from eval_caregiver.agent.base import AgentOutput
+from eval_caregiver.agent.response_store import response_from_dict, response_from_json
+from eval_caregiver.schemas.scenarios import TestScenario
+
+
+class AgentProtocolError(RuntimeError):
+    """The agent replied with something that is not a valid response."""
+
+
+def agent_request(scenario: TestScenario) -> dict:
+    """The request body sent to an agent for ``scenario``."""
+    return {"scenario_id": scenario.scenario_id, "caregiver_setup": scenario.caregiver_setup}
+
+
+def parse_agent_reply(raw: object, scenario_id: str) -> AgentOutput:
+    """Validate an agent's reply into ``AgentOutput``.
+
+    ``raw`` is either a decoded JSON value or the undecoded body, which is
+    validated straight from its bytes.
+    """
+    if isinstance(raw, (bytes, bytearray, str)):
+        try:
+            return response_from_json(raw)
+        except ValueError as e:
+            raise AgentProtocolError(f"Invalid reply for {scenario_id!r}: {e}") from e
+    if not isinstance(raw, dict):
+        raise AgentProtocolError(f"Reply for {scenario_id!r} is not a JSON object")
+    try:
+        return response_from_dict(raw)
+    except (KeyError, ValueError) as e:
+        raise AgentProtocolError(f"Invalid reply for {scenario_id!r}: {e}") from e
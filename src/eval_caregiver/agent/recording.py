@@ -0,0 +1,124 @@
+"""Record-and-replay wrapper for agents (cassettes).
+
+A cassette directory holds one subdirectory per agent version, each laid out
+exactly like ``data/responses``::
+
+    <cassette_dir>/<agent_version>/<scenario_id>.json
+
+so a recorded run can be replayed by ``MockAgent(responses=ResponseStore(...))``
+as well as by :class:`RecordingAgent`. Each file also stores the hash of the
+scenario definition it was recorded for; a cassette whose scenario has since
+changed is treated as missing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from eval_caregiver.agent.base import AgentBase, AgentOutput
+from eval_caregiver.agent.response_store import ResponseFile, response_to_dict
+from eval_caregiver.schemas.ingest import read_json
+from eval_caregiver.schemas.scenarios import TestScenario
+
+MODES = ("auto", "replay", "record")
+
+
+def scenario_hash(scenario: TestScenario) -> str:
+    """Stable SHA-256 of a scenario definition."""
+    canonical = json.dumps(scenario.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class CassetteFile(ResponseFile):
+    """A recorded response plus the scenario and agent version it was recorded for."""
+
+    scenario_hash: str = ""
+    agent_version: str = ""
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when no up-to-date cassette exists for a scenario."""
+
+
+class RecordingAgent(AgentBase):
+    """Wraps an agent, saving each output to a cassette and replaying it on later runs.
+
+    Modes:
+        auto:   replay when an up-to-date cassette exists, otherwise run and record.
+        replay: never call the wrapped agent; a missing or stale cassette is an error.
+        record: always run the wrapped agent and overwrite the cassette.
+    """
+
+    def __init__(
+        self,
+        agent: AgentBase | None,
+        cassette_dir: Path,
+        *,
+        agent_version: str,
+        mode: str = "auto",
+    ) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode: {mode!r}. Available: {list(MODES)}")
+        if agent is None and mode != "replay":
+            raise ValueError(f"An agent to record is required in {mode!r} mode")
+        self._agent = agent
+        self.directory = Path(cassette_dir) / agent_version
+        self.agent_version = agent_version
+        self.mode = mode
+        self.replayed = 0
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    def cassette_path(self, scenario: TestScenario) -> Path:
+        return self.directory / f"{scenario.scenario_id}.json"
+
+    def _replay(self, scenario: TestScenario) -> AgentOutput | None:
+        try:
+            cassette = read_json(CassetteFile, self.cassette_path(scenario))
+        except FileNotFoundError:
+            return None
+        if cassette.scenario_hash != scenario_hash(scenario):
+            return None
+        return cassette.to_output()
+
+    def _record(self, scenario: TestScenario, output: AgentOutput) -> None:
+        raw = response_to_dict(output)
+        raw["scenario_hash"] = scenario_hash(scenario)
+        raw["agent_version"] = self.agent_version
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(raw, f, indent=2)
+            os.replace(tmp, self.cassette_path(scenario))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def run_scenario(self, scenario: TestScenario) -> AgentOutput:
+        if self.mode != "record":
+            output = self._replay(scenario)
+            if output is not None:
+                with self._lock:
+                    self.replayed += 1
+                return output
+            if self.mode == "replay":
+                raise CassetteMissError(
+                    f"No up-to-date cassette for scenario_id={scenario.scenario_id!r} "
+                    f"in {self.directory}"
+                )
+
+        output = self._agent.run_scenario(scenario)
+        self._record(scenario, output)
+        with self._lock:
+            self.recorded += 1
+        return output
+
+    def cancel(self, scenario: TestScenario) -> None:
+        if self._agent is not None:
+            self._agent.cancel(scenario)
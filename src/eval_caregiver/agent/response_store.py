@@ -0,0 +1,126 @@
+"""Lazily loaded, LRU-bounded store of recorded agent responses."""
+
+from __future__ import annotations
+
+import threading
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from eval_caregiver.agent.base import AgentOutput
+from eval_caregiver.schemas.caregiver import StructuredIntakeRecord
+from eval_caregiver.schemas.conversation import AgentActionLog, ConversationTranscript
+from eval_caregiver.schemas.ingest import read_json, validate_json
+
+DEFAULT_MAX_CACHED = 256
+
+
+class ResponseFile(BaseModel):
+    """The ``data/responses/<scenario_id>.json`` layout; extra keys are ignored."""
+
+    transcript: ConversationTranscript
+    intake_record: StructuredIntakeRecord
+    action_log: AgentActionLog
+
+    def to_output(self) -> AgentOutput:
+        return AgentOutput(
+            transcript=self.transcript, intake_record=self.intake_record, action_log=self.action_log
+        )
+
+
+def response_from_dict(raw: dict) -> AgentOutput:
+    """Validate one recorded response in the ``data/responses`` JSON layout."""
+    return AgentOutput(
+        transcript=ConversationTranscript.model_validate(raw["transcript"]),
+        intake_record=StructuredIntakeRecord.model_validate(raw["intake_record"]),
+        action_log=AgentActionLog.model_validate(raw["action_log"]),
+    )
+
+
+def response_to_dict(output: AgentOutput) -> dict:
+    """Serialise a response in the ``data/responses/<scenario_id>.json`` layout."""
+    return {
+        "transcript": output.transcript.model_dump(mode="json"),
+        "intake_record": output.intake_record.model_dump(mode="json"),
+        "action_log": output.action_log.model_dump(mode="json"),
+    }
+
+
+def response_from_json(data: bytes | bytearray | str) -> AgentOutput:
+    """Validate one recorded response straight from its JSON bytes."""
+    return validate_json(ResponseFile, data).to_output()
+
+
+def load_response(path: Path) -> AgentOutput:
+    """Parse and validate one recorded response file."""
+    return read_json(ResponseFile, path).to_output()
+
+
+class BaseResponseStore(Mapping[str, AgentOutput]):
+    """Read-only mapping of scenario ID to response that parses on demand.
+
+    A response is parsed and validated the first time it is looked up, and at
+    most ``max_cached`` parsed responses are kept, least recently used first out.
+    Subclasses provide the ID index and how to load one record.
+    """
+
+    def __init__(self, *, max_cached: int = DEFAULT_MAX_CACHED) -> None:
+        if max_cached < 1:
+            raise ValueError(f"max_cached must be >= 1, got {max_cached}")
+        self._max_cached = max_cached
+        self._cache: OrderedDict[str, AgentOutput] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getitem__(self, scenario_id: str) -> AgentOutput:
+        with self._lock:
+            output = self._cache.get(scenario_id)
+            if output is not None:
+                self._cache.move_to_end(scenario_id)
+                self.hits += 1
+                return output
+            self.misses += 1
+        output = self._load(scenario_id)
+        with self._lock:
+            self._cache[scenario_id] = output
+            self._cache.move_to_end(scenario_id)
+            while len(self._cache) > self._max_cached:
+                self._cache.popitem(last=False)
+        return output
+
+    @property
+    def cached_ids(self) -> list[str]:
+        """IDs of currently parsed responses, least recently used first."""
+        with self._lock:
+            return list(self._cache)
+
+    @abstractmethod
+    def _load(self, scenario_id: str) -> AgentOutput:
+        """Parse one response; raise ``KeyError`` for an unknown ID."""
+        ...
+
+
+class ResponseStore(BaseResponseStore):
+    """Responses from a directory of ``<scenario_id>.json`` files; construction only lists it."""
+
+    def __init__(self, responses_dir: Path, *, max_cached: int = DEFAULT_MAX_CACHED) -> None:
+        super().__init__(max_cached=max_cached)
+        self._paths: dict[str, Path] = {
+            path.stem: path for path in sorted(Path(responses_dir).glob("*.json"))
+        }
+
+    def _load(self, scenario_id: str) -> AgentOutput:
+        return load_response(self._paths[scenario_id])
+
+    def __contains__(self, scenario_id: object) -> bool:
+        return scenario_id in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
@@ -0,0 +1,79 @@
+"""Agents that stream conversation turns as they happen."""
+
+from __future__ import annotations
+
+import threading
+from abc import abstractmethod
+from collections.abc import Generator
+
+from eval_caregiver.agent.base import AgentBase, AgentOutput
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.schemas.conversation import ConversationTurn
+from eval_caregiver.schemas.scenarios import TestScenario
+
+# Yields each turn as it happens and returns the finished output.
+TurnStream = Generator[ConversationTurn, None, AgentOutput]
+
+
+def drain(stream: TurnStream) -> AgentOutput:
+    """Consume a turn stream and return its final output."""
+    while True:
+        try:
+            next(stream)
+        except StopIteration as stop:
+            return stop.value
+
+
+class StreamingAgentBase(AgentBase):
+    """An agent whose conversation can be graded while it is still running.
+
+    ``stream_scenario`` is a generator: it yields every ``ConversationTurn`` as
+    soon as it exists and returns the complete ``AgentOutput``. The executor
+    may close the generator early once the scenario's outcome is decided;
+    implementations can catch ``GeneratorExit`` to stop generating.
+    """
+
+    @abstractmethod
+    def stream_scenario(self, scenario: TestScenario) -> TurnStream:
+        ...
+
+    def run_scenario(self, scenario: TestScenario) -> AgentOutput:
+        return drain(self.stream_scenario(scenario))
+
+
+class ReplayStreamingAgent(StreamingAgentBase):
+    """Streams another agent's finished transcripts turn by turn, optionally paced.
+
+    With ``turn_delay`` it stands in for a live multi-turn agent, e.g. to
+    measure how much early termination saves.
+    """
+
+    def __init__(self, agent: AgentBase | None = None, *, turn_delay: float = 0.0) -> None:
+        self._agent = agent or MockAgent()
+        self._turn_delay = turn_delay
+        # One event per in-flight stream, keyed by id(scenario) so concurrent trials stay apart.
+        self._cancelled: dict[int, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.turns_streamed = 0
+
+    def stream_scenario(self, scenario: TestScenario) -> TurnStream:
+        with self._lock:
+            cancelled = self._cancelled[id(scenario)] = threading.Event()
+        try:
+            output = self._agent.run_scenario(scenario)
+            for turn in output.transcript.turns:
+                if cancelled.wait(self._turn_delay):
+                    break
+                with self._lock:
+                    self.turns_streamed += 1
+                yield turn
+            return output
+        finally:
+            with self._lock:
+                del self._cancelled[id(scenario)]
+
+    def cancel(self, scenario: TestScenario) -> None:
+        with self._lock:
+            event = self._cancelled.get(id(scenario))
+        if event is not None:
+            event.set()
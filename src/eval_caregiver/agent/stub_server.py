@@ -0,0 +1,132 @@
+"""Local stand-in HTTP agent that answers with recorded responses.
+
+Serves the ``HttpAgent`` wire protocol from any scenario-ID-to-response
+mapping (the ``MockAgent`` responses by default), for tests and for trying the
+HTTP adapter without a real agent::
+
+    python -m eval_caregiver.agent.stub_server --port 8765
+    eval-runner --agent-url http://127.0.0.1:8765/intake --no-model-graders
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from eval_caregiver.agent.base import AgentOutput
+from eval_caregiver.agent.mock_agent import default_store
+from eval_caregiver.agent.response_store import response_to_dict
+
+
+class StubAgentServer(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 server answering ``POST`` requests with recorded responses.
+
+    ``fail_next`` makes the next N requests return 503, for exercising retries,
+    and ``delay`` holds every reply back that many seconds, for timeouts.
+    ``connections`` and ``requests`` count what the server has seen.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        responses: Mapping[str, AgentOutput] | None = None,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.responses = responses if responses is not None else default_store()
+        self.fail_next = 0
+        self.delay = 0.0
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/intake"
+
+    def start(self) -> StubAgentServer:
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> StubAgentServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StubAgentServer
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body go out in separate writes; don't let Nagle hold the body back.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server._lock:
+            self.server.connections += 1
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _reply(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        with self.server._lock:
+            self.server.requests += 1
+            failing = self.server.fail_next > 0
+            if failing:
+                self.server.fail_next -= 1
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        if failing:
+            self._reply(503, {"error": "unavailable"})
+            return
+        scenario_id = request.get("scenario_id")
+        if scenario_id not in self.server.responses:
+            self._reply(404, {"error": f"no response for {scenario_id!r}"})
+            return
+        self._reply(200, response_to_dict(self.server.responses[scenario_id]))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve recorded responses over the HTTP agent protocol")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    args = parser.parse_args(argv)
+
+    server = StubAgentServer(address=(args.host, args.port))
+    print(f"Serving stand-in agent at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
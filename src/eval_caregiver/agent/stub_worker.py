@@ -0,0 +1,49 @@
+"""Stand-in agent worker for ``SubprocessAgent``: answers JSON-RPC requests with recorded responses.
+
+    python -m eval_caregiver.agent.stub_worker [--startup-delay SECONDS] [--crash-on SCENARIO_ID]
+
+``--startup-delay`` simulates model loading; ``--crash-on`` makes the process
+exit without replying when it receives that scenario, for restart tests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from eval_caregiver.agent.mock_agent import default_store
+from eval_caregiver.agent.response_store import response_to_dict
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve recorded responses over stdio JSON-RPC")
+    parser.add_argument("--startup-delay", type=float, default=0.0, help="Seconds to sleep before serving")
+    parser.add_argument("--crash-on", type=str, default=None, help="Exit abruptly on this scenario ID")
+    args = parser.parse_args(argv)
+
+    time.sleep(args.startup_delay)
+    responses = default_store()
+    for line in sys.stdin:
+        request = json.loads(line)
+        params = request.get("params") or {}
+        scenario_id = params.get("scenario_id")
+        if scenario_id == args.crash_on:
+            os._exit(1)
+        reply: dict = {"jsonrpc": "2.0", "id": request.get("id")}
+        if request.get("method") != "run_scenario":
+            reply["error"] = {"code": -32601, "message": f"Unknown method: {request.get('method')!r}"}
+        elif scenario_id not in responses:
+            reply["error"] = {"code": -32000, "message": f"No response for {scenario_id!r}"}
+        else:
+            reply["result"] = response_to_dict(responses[scenario_id])
+            reply["result"]["worker_pid"] = os.getpid()
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""Agent adapter backed by a pool of long-lived agent subprocesses.
+
+Each worker process is started once and then serves many scenarios over
+line-delimited JSON-RPC 2.0 on stdin/stdout::
+
+    -> {"jsonrpc": "2.0", "id": 1, "method": "run_scenario",
+        "params": {"scenario_id": "...", "caregiver_setup": {...}}}
+    <- {"jsonrpc": "2.0", "id": 1, "result": {"transcript": ..., "intake_record": ..., "action_log": ...}}
+    <- {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "..."}}
+
+One JSON object per line; anything the agent wants to log goes to stderr.
+Closing a worker's stdin asks it to exit.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import queue
+import subprocess
+import threading
+from collections.abc import Sequence
+
+from eval_caregiver.agent.base import AgentBase, AgentOutput
+from eval_caregiver.agent.protocol import AgentProtocolError, agent_request, parse_agent_reply
+from eval_caregiver.schemas.scenarios import TestScenario
+
+
+class AgentWorkerError(RuntimeError):
+    """A worker process crashed, was cancelled, or replied with a JSON-RPC error."""
+
+
+class _Worker:
+    """One agent subprocess; used by a single thread at a time."""
+
+    def __init__(self, command: Sequence[str], env: dict[str, str] | None) -> None:
+        self.process = subprocess.Popen(
+            list(command),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def call(self, request: dict) -> dict | None:
+        """Send one request and read its reply; ``None`` if the process died."""
+        try:
+            self.process.stdin.write(json.dumps(request) + "\n")
+            self.process.stdin.flush()
+            line = self.process.stdout.readline()
+        except (BrokenPipeError, OSError, ValueError):
+            return None
+        if not line:
+            return None
+        try:
+            reply = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise AgentProtocolError(f"Worker wrote a non-JSON line: {line[:200]!r}") from e
+        if not isinstance(reply, dict):
+            raise AgentProtocolError(f"Worker reply is not a JSON object: {line[:200]!r}")
+        return reply
+
+    def kill(self) -> None:
+        if self.alive:
+            self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def stop(self, timeout: float) -> None:
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        self.kill()
+
+
+class SubprocessAgent(AgentBase):
+    """Routes scenarios across a pool of warm agent worker processes.
+
+    Workers start on first use, so each pays its startup cost once and then
+    serves scenarios until :meth:`close`. A worker that dies is replaced and
+    the scenario is retried on the new worker once. ``cancel`` kills the
+    worker running a timed-out scenario, and a worker that breaks the
+    protocol is killed too; either is replaced on next use.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        *,
+        workers: int = 4,
+        env: dict[str, str] | None = None,
+        shutdown_timeout: float = 5.0,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self._command = list(command)
+        self._env = env
+        self._shutdown_timeout = shutdown_timeout
+        # Slots are None until a worker is started in them.
+        self._idle: queue.Queue[_Worker | None] = queue.Queue()
+        for _ in range(workers):
+            self._idle.put(None)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # In-flight calls, keyed by id(scenario) so concurrent trials stay apart.
+        self._busy: dict[int, _Worker] = {}
+        self._cancelled: set[int] = set()
+        self._all: list[_Worker] = []
+        self.started = 0
+        self.restarts = 0
+
+    def _start(self) -> _Worker:
+        worker = _Worker(self._command, self._env)
+        with self._lock:
+            self.started += 1
+            self._all.append(worker)
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            self.restarts += 1
+            if worker in self._all:
+                self._all.remove(worker)
+
+    def run_scenario(self, scenario: TestScenario) -> AgentOutput:
+        sid = scenario.scenario_id
+        call = id(scenario)
+        worker = self._idle.get()
+        try:
+            for attempt in range(2):
+                if worker is not None and not worker.alive:
+                    self._retire(worker)
+                    worker = None
+                if worker is None:
+                    worker = self._start()
+                with self._lock:
+                    self._busy[call] = worker
+                request_id = next(self._ids)
+                try:
+                    reply = worker.call(
+                        {
+                            "jsonrpc": "2.0",
+                            "id": request_id,
+                            "method": "run_scenario",
+                            "params": agent_request(scenario),
+                        }
+                    )
+                finally:
+                    with self._lock:
+                        self._busy.pop(call, None)
+                        cancelled = call in self._cancelled
+                        self._cancelled.discard(call)
+                if reply is None:
+                    # The process is gone (or going); reap it and start a fresh one.
+                    self._retire(worker)
+                    worker = None
+                if cancelled:
+                    raise AgentWorkerError(f"Worker running {sid!r} was killed after the scenario was cancelled")
+                if reply is not None:
+                    break
+            else:
+                raise AgentWorkerError(f"Worker exited while running {sid!r} (twice)")
+            if reply.get("id") != request_id:
+                raise AgentProtocolError(f"Reply id {reply.get('id')!r} does not match request id {request_id}")
+        except AgentProtocolError:
+            # The worker's replies are out of step with its requests; a later
+            # call would read stale output, so never hand it out again.
+            self._retire(worker)
+            worker = None
+            raise
+        finally:
+            self._idle.put(worker)
+
+        if "error" in reply:
+            error = reply["error"] or {}
+            raise AgentWorkerError(f"Agent error for {sid!r}: {error.get('message', error)}")
+        return parse_agent_reply(reply.get("result"), sid)
+
+    def cancel(self, scenario: TestScenario) -> None:
+        with self._lock:
+            worker = self._busy.get(id(scenario))
+            if worker is None:
+                return
+            self._cancelled.add(id(scenario))
+        worker.process.kill()
+
+    def close(self) -> None:
+        """Ask every worker to exit and reap it."""
+        with self._lock:
+            workers, self._all = self._all, []
+        for worker in workers:
+            worker.stop(self._shutdown_timeout)
+
+    def __enter__(self) -> SubprocessAgent:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
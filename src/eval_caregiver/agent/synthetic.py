@@ -0,0 +1,226 @@
+"""Latency-injecting synthetic agent for benchmarking executor concurrency.
+
+``SyntheticLatencyAgent`` returns another agent's responses (``MockAgent`` by
+default) after a delay drawn from a configurable latency model, and fails a
+configurable fraction of calls. Delays are seeded per scenario and attempt,
+so a benchmark is reproducible, and ``cancel`` cuts a pending delay short.
+
+``python -m eval_caregiver.agent.synthetic -n 500 -w 1 4 16 --latency lognormal:0.2:0.8``
+reports throughput and scenario latency percentiles per worker count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from eval_caregiver.agent.base import AgentBase, AgentOutput
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.schemas.ingest import read_json
+from eval_caregiver.schemas.scenarios import TestScenario
+
+
+class LatencyModel(Protocol):
+    def sample(self, scenario_id: str, rng: random.Random) -> float:
+        """Delay in seconds for one call."""
+        ...
+
+
+@dataclass
+class FixedLatency:
+    """Every call takes ``seconds``."""
+
+    seconds: float
+
+    def sample(self, scenario_id: str, rng: random.Random) -> float:
+        return self.seconds
+
+
+@dataclass
+class LognormalLatency:
+    """Right-skewed delays with the given median and log-space standard deviation."""
+
+    median: float
+    sigma: float = 0.5
+
+    def sample(self, scenario_id: str, rng: random.Random) -> float:
+        return rng.lognormvariate(math.log(self.median), self.sigma)
+
+
+@dataclass
+class ReplayedLatency:
+    """Recorded per-scenario durations, e.g. from a ``--durations`` file.
+
+    Scenarios without a recording fall back to ``default``.
+    """
+
+    durations: dict[str, float]
+    default: LatencyModel
+
+    @classmethod
+    def from_file(cls, path: str | Path, default: LatencyModel) -> ReplayedLatency:
+        """Read a JSON object of scenario ID to seconds, as ``DurationHistory.save`` writes it."""
+        return cls(read_json(dict[str, float], Path(path)), default)
+
+    def sample(self, scenario_id: str, rng: random.Random) -> float:
+        seconds = self.durations.get(scenario_id)
+        return seconds if seconds is not None else self.default.sample(scenario_id, rng)
+
+
+def parse_latency(spec: str) -> LatencyModel:
+    """Parse ``fixed:SECONDS``, ``lognormal:MEDIAN[:SIGMA]`` or ``replay:PATH[:FALLBACK_SECONDS]``."""
+    kind, _, rest = spec.partition(":")
+    args = rest.split(":") if rest else []
+    try:
+        if kind == "fixed" and len(args) == 1:
+            return FixedLatency(float(args[0]))
+        if kind == "lognormal" and len(args) in (1, 2):
+            return LognormalLatency(*(float(a) for a in args))
+        if kind == "replay" and len(args) in (1, 2):
+            fallback = float(args[1]) if len(args) == 2 else 0.0
+            return ReplayedLatency.from_file(args[0], FixedLatency(fallback))
+    except ValueError as e:
+        raise ValueError(f"Invalid latency spec {spec!r}: {e}") from e
+    raise ValueError(
+        f"Unknown latency spec: {spec!r}. "
+        "Available: fixed:SECONDS, lognormal:MEDIAN[:SIGMA], replay:PATH[:FALLBACK_SECONDS]"
+    )
+
+
+class SyntheticAgentError(RuntimeError):
+    """An injected agent failure."""
+
+
+class SyntheticLatencyAgent(AgentBase):
+    """Delays and occasionally fails another agent's responses.
+
+    Args:
+        agent: Source of responses (default: ``MockAgent()``).
+        latency: Default latency model.
+        per_scenario: Latency models for specific scenario IDs.
+        failure_rate: Fraction of calls that raise ``SyntheticAgentError``
+            after their delay.
+        seed: Seed for delays and failures.
+    """
+
+    def __init__(
+        self,
+        agent: AgentBase | None = None,
+        *,
+        latency: LatencyModel | None = None,
+        per_scenario: dict[str, LatencyModel] | None = None,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        if not 0 <= failure_rate <= 1:
+            raise ValueError(f"failure_rate must be in [0, 1], got {failure_rate}")
+        self._agent = agent or MockAgent()
+        self._latency = latency or FixedLatency(0.0)
+        self._per_scenario = dict(per_scenario or {})
+        self._failure_rate = failure_rate
+        self._seed = seed
+        self._lock = threading.Lock()
+        self._attempts: dict[str, int] = defaultdict(int)
+        # One event per in-flight call, keyed by id(scenario) so concurrent trials stay apart.
+        self._cancelled: dict[int, threading.Event] = {}
+
+    def run_scenario(self, scenario: TestScenario) -> AgentOutput:
+        sid = scenario.scenario_id
+        with self._lock:
+            attempt = self._attempts[sid]
+            self._attempts[sid] += 1
+            cancelled = self._cancelled[id(scenario)] = threading.Event()
+        rng = random.Random(f"{self._seed}:{sid}:{attempt}")
+        delay = self._per_scenario.get(sid, self._latency).sample(sid, rng)
+
+        try:
+            if cancelled.wait(max(0.0, delay)):
+                raise SyntheticAgentError(f"Cancelled after missing its deadline: {sid}")
+        finally:
+            with self._lock:
+                del self._cancelled[id(scenario)]
+        if rng.random() < self._failure_rate:
+            raise SyntheticAgentError(f"Injected failure for scenario_id={sid!r} (attempt {attempt})")
+        return self._agent.run_scenario(scenario)
+
+    def cancel(self, scenario: TestScenario) -> None:
+        with self._lock:
+            event = self._cancelled.get(id(scenario))
+        if event is not None:
+            event.set()
+        self._agent.cancel(scenario)
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    # Imported here: the generator and executor are only needed for the benchmark.
+    from eval_caregiver.agent.generated_agent import GeneratedAgent
+    from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+    from eval_caregiver.graders.code_based.compliance_remediation import ComplianceRemediationGrader
+    from eval_caregiver.graders.code_based.geo_restriction import GeoRestrictionGrader
+    from eval_caregiver.runner.executor import EvalExecutor
+    from eval_caregiver.runner.scheduling import DurationHistory
+    from eval_caregiver.scenarios.generator import ScenarioGenerator
+
+    parser = argparse.ArgumentParser(description="Benchmark executor throughput against a synthetic agent")
+    parser.add_argument("-n", "--count", type=int, default=200, help="Generated scenarios per run (default: 200)")
+    parser.add_argument(
+        "-w", "--workers", type=int, nargs="+", default=[1, 4, 16], help="Worker counts to compare"
+    )
+    parser.add_argument(
+        "--latency",
+        type=str,
+        default="lognormal:0.05:0.8",
+        help="fixed:SECONDS, lognormal:MEDIAN[:SIGMA] or replay:PATH[:FALLBACK_SECONDS] "
+        "(default: lognormal:0.05:0.8)",
+    )
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Injected failure rate (default: 0)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for scenarios and delays (default: 0)")
+    args = parser.parse_args(argv)
+
+    generator = ScenarioGenerator(seed=args.seed)
+    scenarios = list(generator.scenarios(args.count))
+    graders = [ComplianceGapGrader(), ComplianceRemediationGrader(), GeoRestrictionGrader()]
+    latency = parse_latency(args.latency)
+
+    print(f"{'workers':>8} {'scen/s':>9} {'p50 s':>8} {'p95 s':>8} {'p99 s':>8} {'failed':>7}")
+    for workers in args.workers:
+        # A fresh agent per run so every worker count sees the same delays and failures.
+        agent = SyntheticLatencyAgent(
+            GeneratedAgent(generator), latency=latency, failure_rate=args.failure_rate, seed=args.seed
+        )
+        history = DurationHistory()
+        executor = EvalExecutor(
+            agent=agent,
+            graders={g.name: g for g in graders},
+            skip_model_graders=True,
+            max_workers=workers,
+            history=history,
+        )
+        started = time.perf_counter()
+        results = executor.run_scenarios(scenarios)
+        elapsed = time.perf_counter() - started
+        failed = sum(1 for r in results if any(reason.startswith("Agent error") for reason in r.review_reasons))
+        durations = sorted(history.as_dict().values())
+        print(
+            f"{workers:>8} {len(scenarios) / elapsed:>9.1f} {_percentile(durations, 0.5):>8.3f} "
+            f"{_percentile(durations, 0.95):>8.3f} {_percentile(durations, 0.99):>8.3f} {failed:>7}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -28,5 +28,6 @@ class Grader(ABC):
         - intake_record: StructuredIntakeRecord
         - action_log: AgentActionLog
         - scenario: TestScenario
+        - timeout: float | None, seconds left before the executor gives up on this call
         """
         ...
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from eval_caregiver.graders.incremental import IncrementalGrader, TurnState
+from eval_caregiver.schemas.conversation import ConversationTurn
+from eval_caregiver.schemas.grader_results import GraderResult
+from eval_caregiver.schemas.scenarios import TestScenario
+
+# Phrases with which an agent tells the caregiver nothing is missing.
+_ALL_CLEAR_PHRASES = ("fully compliant", "no compliance gaps", "no outstanding compliance")
+
+
+class _ComplianceMentionState(TurnState):
+    def __init__(self, grader_name: str, expected: list[str]) -> None:
+        self._grader_name = grader_name
+        self._pending = {gap.lower(): gap for gap in expected}
+        self._expected = expected
+        self._first_mention: dict[str, int] = {}
+        self._false_all_clear: int | None = None
+
+    def observe(self, turn: ConversationTurn) -> None:
+        if turn.role != "agent" or not self._pending or self._false_all_clear is not None:
+            return
+        content = turn.content.lower()
+        for key in [key for key in self._pending if key in content]:
+            self._first_mention[self._pending.pop(key)] = turn.turn_number
+        if self._pending and any(phrase in content for phrase in _ALL_CLEAR_PHRASES):
+            self._false_all_clear = turn.turn_number
+
+    @property
+    def outcome(self) -> bool | None:
+        if self._false_all_clear is not None:
+            return False
+        return True if not self._pending else None
+
+    def result(self) -> GraderResult:
+        if not self._expected:
+            return GraderResult(
+                grader_name=self._grader_name,
+                passed=True,
+                score=1.0,
+                details="No compliance gaps expected; none required.",
+            )
+        score = len(self._first_mention) / len(self._expected)
+        details_parts = [f"Mentioned: {self._first_mention}"]
+        if self._pending:
+            details_parts.append(f"Never mentioned: {sorted(self._pending.values())}")
+        if self._false_all_clear is not None:
+            details_parts.append(f"Declared the caregiver compliant at turn {self._false_all_clear}")
+        return GraderResult(
+            grader_name=self._grader_name,
+            passed=not self._pending and self._false_all_clear is None,
+            score=score,
+            details="; ".join(details_parts),
+        )
+
+
+class ComplianceMentionGrader(IncrementalGrader):
+    """Checks that the agent raised every expected compliance gap in the conversation.
+
+    Fails as soon as the agent tells the caregiver they are compliant while an
+    expected gap is still unmentioned.
+    """
+
+    @property
+    def name(self) -> str:
+        return "compliance_gap_mentioned"
+
+    def begin(self, scenario: TestScenario) -> TurnState:
+        return _ComplianceMentionState(self.name, list(scenario.expected_compliance_gaps))
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from eval_caregiver.graders.incremental import IncrementalGrader, TurnState
+from eval_caregiver.schemas.conversation import ConversationTurn
+from eval_caregiver.schemas.grader_results import GraderResult
+from eval_caregiver.schemas.scenarios import TestScenario
+
+SCHEDULING_PHRASES = ("schedule", "book ", "booked", "sign you up", "enroll", "appointment")
+
+
+class _SchedulingOfferState(TurnState):
+    def __init__(self, grader_name: str, required: bool) -> None:
+        self._grader_name = grader_name
+        self._required = required
+        self._offered_at: int | None = None
+
+    def observe(self, turn: ConversationTurn) -> None:
+        if self._offered_at is not None or turn.role != "agent":
+            return
+        content = turn.content.lower()
+        if any(phrase in content for phrase in SCHEDULING_PHRASES):
+            self._offered_at = turn.turn_number
+
+    @property
+    def outcome(self) -> bool | None:
+        if not self._required or self._offered_at is not None:
+            return True
+        return None
+
+    def result(self) -> GraderResult:
+        if not self._required:
+            return GraderResult(
+                grader_name=self._grader_name,
+                passed=True,
+                score=1.0,
+                details="No compliance gaps expected; scheduling not required.",
+            )
+        if self._offered_at is None:
+            return GraderResult(
+                grader_name=self._grader_name,
+                passed=False,
+                score=0.0,
+                details="Agent never offered to schedule remediation",
+            )
+        return GraderResult(
+            grader_name=self._grader_name,
+            passed=True,
+            score=1.0,
+            details=f"Scheduling offered at turn {self._offered_at}",
+        )
+
+
+class SchedulingOfferGrader(IncrementalGrader):
+    """Checks that the agent offered to schedule remediation when compliance gaps exist."""
+
+    @property
+    def name(self) -> str:
+        return "scheduling_offered_in_conversation"
+
+    def begin(self, scenario: TestScenario) -> TurnState:
+        return _SchedulingOfferState(self.name, required=bool(scenario.expected_compliance_gaps))
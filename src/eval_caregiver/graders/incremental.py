@@ -0,0 +1,50 @@
+"""Graders that update per conversation turn, for streaming agents."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from eval_caregiver.graders.base import Grader
+from eval_caregiver.schemas.conversation import ConversationTranscript, ConversationTurn
+from eval_caregiver.schemas.grader_results import GraderResult
+from eval_caregiver.schemas.scenarios import TestScenario
+
+
+class TurnState(ABC):
+    """Per-scenario grading state, fed one turn at a time."""
+
+    @abstractmethod
+    def observe(self, turn: ConversationTurn) -> None:
+        """Update the state with the next turn."""
+        ...
+
+    @property
+    def outcome(self) -> bool | None:
+        """``True``/``False`` once no later turn can change the verdict, else ``None``."""
+        return None
+
+    @abstractmethod
+    def result(self) -> GraderResult:
+        """The grader result for the turns seen so far."""
+        ...
+
+
+class IncrementalGrader(Grader):
+    """A grader that can follow a conversation as it happens.
+
+    The executor calls :meth:`begin` once per scenario and feeds every turn a
+    streaming agent yields to the returned state, so grading overlaps with
+    generation. ``grade`` replays a finished transcript through the same
+    state, so these graders also work with ordinary agents.
+    """
+
+    @abstractmethod
+    def begin(self, scenario: TestScenario) -> TurnState:
+        ...
+
+    def grade(self, **kwargs) -> GraderResult:
+        transcript: ConversationTranscript = kwargs["transcript"]
+        state = self.begin(kwargs["scenario"])
+        for turn in transcript.turns:
+            state.observe(turn)
+        return state.result()
@@ -3,13 +3,70 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Protocol
+
+from pydantic import BaseModel
 
 from eval_caregiver.agent.base import AgentOutput
-from eval_caregiver.schemas.grader_results import ScenarioResult
+from eval_caregiver.schemas.ingest import read_json
 from eval_caregiver.schemas.scenarios import TestScenario
 
 
+class GraderOutcome(Protocol):
+    """What a review file needs from one grader result."""
+
+    @property
+    def grader_name(self) -> str: ...
+    @property
+    def passed(self) -> bool: ...
+    @property
+    def score(self) -> float: ...
+    @property
+    def details(self) -> str: ...
+
+
+class ReviewableResult(Protocol):
+    """What a review file needs from a scenario result, e.g. a ``ScenarioRecord`` or ``ScenarioResult``."""
+
+    @property
+    def review_reasons(self) -> Sequence[str]: ...
+    @property
+    def grader_results(self) -> Sequence[GraderOutcome]: ...
+
+
+class ReviewTurn(BaseModel):
+    role: str
+    content: str
+    turn: int
+
+
+class ReviewGraderEntry(BaseModel):
+    grader: str
+    passed: bool
+    score: float
+    details: str = ""
+
+
+class ReviewFile(BaseModel):
+    """A review file as written by :class:`ManualReviewGenerator`, possibly labeled by a human."""
+
+    scenario_id: str
+    scenario_name: str
+    scenario_description: str = ""
+    review_reasons: list[str] = []
+    transcript: list[ReviewTurn] = []
+    grader_results: list[ReviewGraderEntry] = []
+    human_label: str | bool | None = None
+    human_notes: str = ""
+
+
+def load_review(path: Path) -> ReviewFile:
+    """Parse and validate one review file."""
+    return read_json(ReviewFile, path)
+
+
 class ManualReviewGenerator:
     """Generates human-readable review files for scenarios that need manual review."""
 
@@ -19,20 +76,23 @@ class ManualReviewGenerator:
     def generate(
         self,
         scenario: TestScenario,
-        agent_output: AgentOutput,
-        scenario_result: ScenarioResult,
+        agent_output: AgentOutput | None,
+        scenario_result: ReviewableResult,
     ) -> Path:
-        """Generate a review file and return its path."""
+        """Generate a review file and return its path.
+
+        ``agent_output`` is ``None`` when the agent never answered (e.g. it timed out).
+        """
         self._output_dir.mkdir(parents=True, exist_ok=True)
 
         review_data = {
             "scenario_id": scenario.scenario_id,
             "scenario_name": scenario.name,
             "scenario_description": scenario.description,
-            "review_reasons": scenario_result.review_reasons,
+            "review_reasons": list(scenario_result.review_reasons),
             "transcript": [
                 {"role": turn.role, "content": turn.content, "turn": turn.turn_number}
-                for turn in agent_output.transcript.turns
+                for turn in (agent_output.transcript.turns if agent_output else [])
             ],
             "grader_results": [
                 {
@@ -50,3 +110,7 @@ class ManualReviewGenerator:
         filepath = self._output_dir / f"review_{scenario.scenario_id}.json"
         filepath.write_text(json.dumps(review_data, indent=2))
         return filepath
+
+    def load_reviews(self) -> list[ReviewFile]:
+        """Every review file in the output directory, e.g. to collect human labels."""
+        return [load_review(path) for path in sorted(self._output_dir.glob("review_*.json"))]
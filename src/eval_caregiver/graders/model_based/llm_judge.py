@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from dataclasses import dataclass
 
 import anthropic
 
-from eval_caregiver.schemas.grader_results import GraderResult, RubricCriterionScore
+from eval_caregiver.graders.base import Grader
+from eval_caregiver.schemas.grader_results import GraderResult, JudgeUsage, RubricCriterionScore
 
 DEFAULT_MODEL = "claude-opus-4-6"
 
@@ -21,6 +24,29 @@ class RubricCriterion:
     max_score: int = 2
 
 
+class RubricGrader(Grader):
+    """Base class for LLM-as-judge graders.
+
+    The Anthropic client is created on first use and then reused for every
+    scenario and trial this grader judges.
+    """
+
+    def __init__(self, client: anthropic.Anthropic | None = None) -> None:
+        self._client = client
+        self._client_lock = threading.Lock()
+
+    @property
+    def is_model_based(self) -> bool:
+        return True
+
+    def judge_client(self) -> anthropic.Anthropic:
+        """Return the shared judge client, creating it on first call."""
+        with self._client_lock:
+            if self._client is None:
+                self._client = anthropic.Anthropic()
+            return self._client
+
+
 def evaluate_with_rubric(
     *,
     grader_name: str,
@@ -28,6 +54,8 @@ def evaluate_with_rubric(
     context: str,
     criteria: list[RubricCriterion],
     model: str = DEFAULT_MODEL,
+    timeout: float | None = None,
+    client: anthropic.Anthropic | None = None,
 ) -> GraderResult:
     """Evaluate a transcript against a rubric using an LLM judge.
 
@@ -37,6 +65,8 @@ def evaluate_with_rubric(
         context: Additional context about what's being evaluated.
         criteria: List of rubric criteria to score.
         model: Claude model to use for evaluation.
+        timeout: Seconds before the judge request is abandoned; ``None`` uses the client default.
+        client: Anthropic client to reuse; a new one is created when omitted.
 
     Returns:
         GraderResult with per-criterion scores.
@@ -71,11 +101,20 @@ Respond in JSON format:
 
 Respond ONLY with the JSON object, no other text."""
 
-    client = anthropic.Anthropic()
+    request_options = {} if timeout is None else {"timeout": timeout}
+    client = client or anthropic.Anthropic()
+    started = time.perf_counter()
     response = client.messages.create(
         model=model,
         max_tokens=1024,
         messages=[{"role": "user", "content": prompt}],
+        **request_options,
+    )
+    usage = JudgeUsage(
+        model=model,
+        input_tokens=response.usage.input_tokens,
+        output_tokens=response.usage.output_tokens,
+        latency_s=time.perf_counter() - started,
     )
 
     response_text = response.content[0].text
@@ -104,4 +143,5 @@ Respond ONLY with the JSON object, no other text."""
         score=normalized_score,
         details=f"LLM judge score: {total_score}/{total_max}",
         criterion_scores=criterion_scores,
+        judge_usage=usage,
     )
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from eval_caregiver.graders.base import Grader
 from eval_caregiver.graders.model_based.llm_judge import (
     RubricCriterion,
+    RubricGrader,
     evaluate_with_rubric,
 )
 from eval_caregiver.schemas.conversation import ConversationTranscript
@@ -29,17 +29,13 @@ CRITERIA = [
 ]
 
 
-class SafetyMapSuggestionsGrader(Grader):
+class SafetyMapSuggestionsGrader(RubricGrader):
     """Evaluates the quality of safety map consultation and area suggestions."""
 
     @property
     def name(self) -> str:
         return "safe_area_suggestion_quality"
 
-    @property
-    def is_model_based(self) -> bool:
-        return True
-
     def grade(self, **kwargs) -> GraderResult:
         transcript: ConversationTranscript = kwargs["transcript"]
 
@@ -48,4 +44,6 @@ class SafetyMapSuggestionsGrader(Grader):
             transcript_text=transcript.full_text,
             context="Evaluate how the agent used safety map data to suggest alternative geographic areas to an over-restricted caregiver.",
             criteria=CRITERIA,
+            timeout=kwargs.get("timeout"),
+            client=self.judge_client(),
         )
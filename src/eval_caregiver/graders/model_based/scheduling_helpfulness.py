@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from eval_caregiver.graders.base import Grader
 from eval_caregiver.graders.model_based.llm_judge import (
     RubricCriterion,
+    RubricGrader,
     evaluate_with_rubric,
 )
 from eval_caregiver.schemas.conversation import ConversationTranscript
@@ -29,17 +29,13 @@ CRITERIA = [
 ]
 
 
-class SchedulingHelpfulnessGrader(Grader):
+class SchedulingHelpfulnessGrader(RubricGrader):
     """Evaluates how helpfully the agent handled compliance scheduling."""
 
     @property
     def name(self) -> str:
         return "scheduling_helpfulness"
 
-    @property
-    def is_model_based(self) -> bool:
-        return True
-
     def grade(self, **kwargs) -> GraderResult:
         transcript: ConversationTranscript = kwargs["transcript"]
 
@@ -48,4 +44,6 @@ class SchedulingHelpfulnessGrader(Grader):
             transcript_text=transcript.full_text,
             context="Evaluate how the agent handled compliance gap discovery and scheduling remediation.",
             criteria=CRITERIA,
+            timeout=kwargs.get("timeout"),
+            client=self.judge_client(),
         )
@@ -5,37 +5,51 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from eval_caregiver.runner.quality_gates import QualityGateReport
-from eval_caregiver.schemas.grader_results import ScenarioResult
+from pydantic import BaseModel
+
+from eval_caregiver.runner.baseline import RunDiff, ScenarioChange
+from eval_caregiver.runner.quality_gates import QualityGateReport, QualityGateResult
+from eval_caregiver.runner.records import AnyScenarioResult, GraderRecord, ScenarioRecord
+from eval_caregiver.runner.score_matrix import ScoreMatrix
+from eval_caregiver.runner.trials import TrialSummary
+from eval_caregiver.schemas.grader_results import JudgeUsage, RubricCriterionScore
+from eval_caregiver.schemas.ingest import read_json
 
 
 def generate_json_report(
-    results: list[ScenarioResult],
+    results: list[AnyScenarioResult],
     gate_report: QualityGateReport,
     output_path: str = "output/eval_report.json",
+    trials: list[TrialSummary] | None = None,
+    matrix: ScoreMatrix | None = None,
+    diff: RunDiff | None = None,
 ) -> Path:
-    """Generate a JSON evaluation report."""
+    """Generate a JSON evaluation report.
+
+    With ``trials``, ``results`` are the per-scenario aggregates and a
+    ``trials`` section adds pass rate, pass@k and score variance. Totals and
+    breakdowns come from ``matrix``, built from ``results`` if not given.
+    A ``diff`` against a baseline run is written as ``baseline_diff``.
+    """
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
+    matrix = matrix if matrix is not None else ScoreMatrix.from_results(results)
+    totals = matrix.totals()
 
     report = {
         "summary": {
-            "total_scenarios": len(results),
-            "passed": sum(1 for r in results if r.passed),
-            "failed": sum(1 for r in results if not r.passed),
-            "needs_review": sum(1 for r in results if r.needs_manual_review),
+            "total_scenarios": totals["total"],
+            "passed": totals["passed"],
+            "failed": totals["failed"],
+            "needs_review": totals["needs_review"],
             "quality_gates_passed": gate_report.all_passed,
+            "stopped_early": gate_report.early_stop is not None,
+        },
+        "quality_gates": [_gate_entry(gr) for gr in gate_report.gate_results],
+        "breakdowns": {
+            "collections": _rounded(matrix.by_collection()),
+            "graders": _rounded(matrix.by_grader()),
         },
-        "quality_gates": [
-            {
-                "metric": gr.gate.metric,
-                "threshold": gr.gate.threshold,
-                "actual": round(gr.actual_value, 4),
-                "passed": gr.passed,
-                "description": gr.gate.description,
-            }
-            for gr in gate_report.gate_results
-        ],
         "scenarios": [
             {
                 "scenario_id": r.scenario_id,
@@ -59,6 +73,7 @@ def generate_json_report(
                             }
                             for cs in gr.criterion_scores
                         ],
+                        **({"judge_usage": gr.judge_usage.model_dump()} if gr.judge_usage else {}),
                     }
                     for gr in r.grader_results
                 ],
@@ -67,5 +82,167 @@ def generate_json_report(
         ],
     }
 
+    if trials:
+        report["trials"] = [
+            {
+                "scenario_id": t.scenario_id,
+                "trials": len(t.trials),
+                "passes": t.passes,
+                "pass_rate": round(t.pass_rate, 4),
+                "pass_at_k": round(t.pass_at_k(), 4),
+                "score_mean": round(t.score_mean, 4),
+                "score_variance": round(t.score_variance, 6),
+            }
+            for t in trials
+        ]
+
+    if gate_report.sample is not None:
+        report["sample"] = {
+            "confidence": gate_report.sample.confidence,
+            "rounds": gate_report.sample.rounds,
+            "sampled_scenarios": gate_report.sample.sampled_scenarios,
+            "population_scenarios": gate_report.sample.population_scenarios,
+        }
+
+    if gate_report.bootstrap is not None:
+        report["bootstrap"] = {
+            "confidence": gate_report.bootstrap.confidence,
+            "resamples": gate_report.bootstrap.resamples,
+            "seed": gate_report.bootstrap.seed,
+        }
+
+    if gate_report.baseline is not None:
+        report["baseline_comparison"] = {
+            "source": gate_report.baseline.source,
+            "confidence": gate_report.baseline.confidence,
+            "resamples": gate_report.baseline.resamples,
+            "gates": [
+                {
+                    "metric": c.gate.metric,
+                    "baseline": round(c.baseline_value, 4),
+                    "current": round(c.current_value, 4),
+                    "delta": round(c.delta, 4),
+                    "ci": [round(c.ci_low, 4), round(c.ci_high, 4)],
+                    "p_value": round(c.p_value, 4),
+                    "pairs": c.pairs,
+                    "significant": c.significant,
+                }
+                for c in gate_report.baseline.gates
+            ],
+        }
+
+    if diff is not None:
+        report["baseline_diff"] = {
+            "source": diff.source,
+            "epsilon": diff.epsilon,
+            "compared_scenarios": diff.compared,
+            "gates": [
+                {
+                    "metric": g.metric,
+                    "baseline": round(g.base_value, 4) if g.base_value is not None else None,
+                    "current": round(g.value, 4),
+                    "delta": round(g.delta, 4),
+                    "baseline_passed": g.base_passed,
+                    "passed": g.passed,
+                }
+                for g in diff.gates
+            ],
+            "newly_failing": [_change_entry(c) for c in diff.newly_failing],
+            "newly_passing": [_change_entry(c) for c in diff.newly_passing],
+            "score_changes": [_change_entry(c) for c in diff.changed],
+            "added": diff.added,
+            "removed": diff.removed,
+        }
+
+    if gate_report.early_stop is not None:
+        report["early_stop"] = {
+            "reason": gate_report.early_stop.reason,
+            "lost_gates": gate_report.early_stop.lost_gates,
+            "completed_scenarios": gate_report.early_stop.completed_scenarios,
+            "skipped_scenario_ids": gate_report.early_stop.skipped_scenario_ids,
+        }
+
     path.write_text(json.dumps(report, indent=2))
     return path
+
+
+def _rounded(breakdown: dict[str, dict[str, float]]) -> dict[str, dict[str, float]]:
+    return {key: {k: round(v, 4) for k, v in row.items()} for key, row in breakdown.items()}
+
+
+def _gate_entry(gr: QualityGateResult) -> dict:
+    """Serialize one gate result, including its interval when it has one."""
+    entry = {
+        "metric": gr.gate.metric,
+        "threshold": gr.gate.threshold,
+        "actual": round(gr.actual_value, 4),
+        "passed": gr.passed,
+        "description": gr.gate.description,
+    }
+    if gr.ci_low is not None and gr.ci_high is not None:
+        entry["ci"] = [round(gr.ci_low, 4), round(gr.ci_high, 4)]
+        entry["sample_size"] = gr.sample_size
+        entry["conclusive"] = gr.conclusive
+    return entry
+
+
+def _change_entry(change: ScenarioChange) -> dict:
+    return {
+        "scenario_id": change.scenario_id,
+        "baseline_passed": change.base_passed,
+        "passed": change.passed,
+        "graders": [
+            {
+                "grader_name": g.grader_name,
+                "baseline": round(g.base_score, 4) if g.base_score is not None else None,
+                "current": round(g.score, 4) if g.score is not None else None,
+                "delta": round(g.delta, 4),
+            }
+            for g in change.graders
+        ],
+    }
+
+
+class _ReportGrader(BaseModel):
+    grader_name: str
+    passed: bool
+    score: float
+    details: str = ""
+    criterion_scores: list[RubricCriterionScore] = []
+    judge_usage: JudgeUsage | None = None
+
+
+class _ReportScenario(BaseModel):
+    scenario_id: str
+    scenario_name: str
+    passed: bool
+    needs_manual_review: bool = False
+    review_reasons: list[str] = []
+    graders: list[_ReportGrader] = []
+
+
+class _Report(BaseModel):
+    scenarios: list[_ReportScenario] = []
+
+
+def load_json_report(path: str | Path) -> list[ScenarioRecord]:
+    """Reload the scenario results of a report written by :func:`generate_json_report`.
+
+    Useful for merging or comparing runs. Scores come back as written, i.e.
+    rounded to four decimal places.
+    """
+    report = read_json(_Report, Path(path))
+    return [
+        ScenarioRecord(
+            scenario_id=s.scenario_id,
+            scenario_name=s.scenario_name,
+            grader_results=tuple(
+                GraderRecord(g.grader_name, g.passed, g.score, g.details, tuple(g.criterion_scores), g.judge_usage)
+                for g in s.graders
+            ),
+            passed=s.passed,
+            needs_manual_review=s.needs_manual_review,
+            review_reasons=tuple(s.review_reasons),
+        )
+        for s in report.scenarios
+    ]
@@ -0,0 +1,44 @@
+"""Single-line live gate status for the terminal."""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import TextIO
+
+from eval_caregiver.runner.quality_gates import GateAccumulator
+
+
+class LiveStatus:
+    """Redraws ``GateAccumulator.status_line()`` in place as results arrive.
+
+    Pass an instance as the accumulator's ``listener``. Redraws are throttled
+    to one per ``interval`` seconds; :meth:`close` draws the final state and
+    ends the line.
+    """
+
+    def __init__(self, stream: TextIO | None = None, *, interval: float = 0.2) -> None:
+        self._stream = stream if stream is not None else sys.stderr
+        self._interval = interval
+        self._last_draw = float("-inf")
+        self._width = 0
+        self._accumulator: GateAccumulator | None = None
+
+    def __call__(self, accumulator: GateAccumulator) -> None:
+        self._accumulator = accumulator
+        now = time.monotonic()
+        if now - self._last_draw >= self._interval:
+            self._last_draw = now
+            self._draw(accumulator.status_line())
+
+    def close(self) -> None:
+        if self._accumulator is not None:
+            self._draw(self._accumulator.status_line())
+            self._stream.write("\n")
+            self._stream.flush()
+
+    def _draw(self, line: str) -> None:
+        # Pad over any leftover characters from a longer previous line.
+        self._stream.write("\r" + line.ljust(self._width))
+        self._stream.flush()
+        self._width = len(line)
@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+from eval_caregiver.runner.baseline import GraderChange, RunDiff
 from eval_caregiver.runner.quality_gates import QualityGateReport
-from eval_caregiver.schemas.grader_results import ScenarioResult
+from eval_caregiver.runner.records import AnyScenarioResult
+from eval_caregiver.runner.score_matrix import ScoreMatrix
+from eval_caregiver.runner.trials import TrialSummary
 
 
-def print_scorecard(results: list[ScenarioResult], gate_report: QualityGateReport) -> None:
+def print_scorecard(
+    results: list[AnyScenarioResult],
+    gate_report: QualityGateReport,
+    trials: list[TrialSummary] | None = None,
+    matrix: ScoreMatrix | None = None,
+) -> None:
     """Print a formatted scorecard to the terminal."""
-    total = len(results)
-    passed = sum(1 for r in results if r.passed)
-    failed = total - passed
-    needs_review = sum(1 for r in results if r.needs_manual_review)
+    trials_by_id = {t.scenario_id: t for t in trials or []}
+    matrix = matrix if matrix is not None else ScoreMatrix.from_results(results)
+    totals = matrix.totals()
+    total, passed, failed, needs_review = (
+        totals["total"], totals["passed"], totals["failed"], totals["needs_review"]
+    )
 
     print()
     print("=" * 70)
@@ -31,6 +41,13 @@ def print_scorecard(results: list[ScenarioResult], gate_report: QualityGateRepor
         marker = "[+]" if result.passed else "[-]"
         print(f"  {marker} {result.scenario_name} ({result.scenario_id})")
         print(f"      Status: {status}  |  Score: {result.overall_score:.2f}")
+        summary = trials_by_id.get(result.scenario_id)
+        if summary is not None:
+            k = len(summary.trials)
+            print(
+                f"      Trials: {summary.passes}/{k} passed  |  pass@{k}: {summary.pass_at_k():.2f}"
+                f"  |  Score variance: {summary.score_variance:.4f}"
+            )
 
         for gr in result.grader_results:
             gr_status = "pass" if gr.passed else "FAIL"
@@ -43,6 +60,19 @@ def print_scorecard(results: list[ScenarioResult], gate_report: QualityGateRepor
             print(f"      >> Manual review: {', '.join(result.review_reasons)}")
         print()
 
+    # Breakdowns
+    print("-" * 70)
+    print("  BREAKDOWN")
+    print("-" * 70)
+    for name, row in matrix.by_collection().items():
+        print(
+            f"  {name or '(no collection)'}: {row['passed']}/{row['scenarios']} passed"
+            f"  |  Mean score: {row['mean_score']:.2f}"
+        )
+    for name, row in matrix.by_grader().items():
+        print(f"  - {name}: {row['passed']}/{row['runs']} passed  |  Mean score: {row['mean_score']:.2f}")
+    print()
+
     # Quality gates
     print("-" * 70)
     print("  QUALITY GATES")
@@ -52,6 +82,49 @@ def print_scorecard(results: list[ScenarioResult], gate_report: QualityGateRepor
         marker = "[+]" if gr.passed else "[-]"
         print(f"  {marker} {gr.gate.metric}")
         print(f"      Threshold: {gr.gate.threshold:.2f}  |  Actual: {gr.actual_value:.4f}  |  {status}")
+        if gr.ci_low is not None and gr.ci_high is not None:
+            verdict = "" if gr.conclusive else "  (inconclusive)"
+            print(f"      CI: [{gr.ci_low:.4f}, {gr.ci_high:.4f}]  |  n={gr.sample_size}{verdict}")
+
+    if gate_report.sample is not None:
+        sample = gate_report.sample
+        print()
+        print(
+            f"  Sampled {sample.sampled_scenarios}/{sample.population_scenarios} scenarios "
+            f"in {sample.rounds} round(s) at {sample.confidence:.0%} confidence"
+        )
+
+    if gate_report.bootstrap is not None:
+        bootstrap = gate_report.bootstrap
+        print()
+        print(f"  Intervals: {bootstrap.resamples} bootstrap resamples at {bootstrap.confidence:.0%} confidence")
+
+    if gate_report.baseline is not None:
+        baseline = gate_report.baseline
+        print()
+        print("-" * 70)
+        print(f"  VS BASELINE ({baseline.source})" if baseline.source else "  VS BASELINE")
+        print("-" * 70)
+        for c in baseline.gates:
+            verdict = "significant" if c.significant else "not significant"
+            print(f"  {c.gate.metric}")
+            print(
+                f"      {c.baseline_value:.4f} -> {c.current_value:.4f}  |  "
+                f"Paired delta: {c.delta:+.4f} [{c.ci_low:+.4f}, {c.ci_high:+.4f}]"
+            )
+            print(f"      p={c.p_value:.4f}  |  pairs={c.pairs}  |  {verdict}")
+
+    if gate_report.early_stop is not None:
+        early_stop = gate_report.early_stop
+        print()
+        print("-" * 70)
+        print("  STOPPED EARLY (fail-fast)")
+        print("-" * 70)
+        print(f"  {early_stop.reason}")
+        print(
+            f"  Completed {early_stop.completed_scenarios} scenario(s); "
+            f"skipped {len(early_stop.skipped_scenario_ids)}"
+        )
 
     print()
     print("-" * 70)
@@ -59,3 +132,50 @@ def print_scorecard(results: list[ScenarioResult], gate_report: QualityGateRepor
     print(f"  OVERALL: {overall}")
     print("=" * 70)
     print()
+
+
+def print_baseline_diff(diff: RunDiff) -> None:
+    """Print only what changed against the baseline: gates, verdict flips and moved scores."""
+    print()
+    print("-" * 70)
+    print(f"  CHANGES VS BASELINE ({diff.source})")
+    print("-" * 70)
+    print(f"  {diff.compared} scenario(s) compared  |  epsilon {diff.epsilon:g}")
+    for g in diff.gates:
+        if g.base_value is None:
+            print(f"  gate {g.metric}: {g.value:.4f} (not in baseline)")
+            continue
+        verdict = "" if g.passed == g.base_passed else f"  {_verdict(g.base_passed)} -> {_verdict(g.passed)}"
+        print(f"  gate {g.metric}: {g.base_value:.4f} -> {g.value:.4f} ({g.delta:+.4f}){verdict}")
+    for title, changes in (
+        ("Newly failing", diff.newly_failing),
+        ("Newly passing", diff.newly_passing),
+        ("Score changes", diff.changed),
+    ):
+        if not changes:
+            continue
+        print(f"  {title} ({len(changes)}):")
+        for change in changes:
+            print(f"    {change.scenario_id}")
+            for g in change.graders:
+                print(f"      {g.grader_name}: {_grader_change(g)}")
+    if diff.added:
+        print(f"  New scenarios ({len(diff.added)}): {', '.join(diff.added)}")
+    if diff.removed:
+        print(f"  Missing scenarios ({len(diff.removed)}): {', '.join(diff.removed)}")
+    if diff.empty:
+        print("  No scenario changes")
+    print()
+
+
+def _verdict(passed: bool | None) -> str:
+    return "PASS" if passed else "FAIL"
+
+
+def _grader_change(g: GraderChange) -> str:
+    if g.base_score is None:
+        return f"new, {g.score:.4f} {_verdict(g.passed)}"
+    if g.score is None:
+        return f"not run (was {g.base_score:.4f} {_verdict(g.base_passed)})"
+    flip = "" if g.passed == g.base_passed else f"  {_verdict(g.base_passed)} -> {_verdict(g.passed)}"
+    return f"{g.base_score:.4f} -> {g.score:.4f} ({g.delta:+.4f}){flip}"
@@ -0,0 +1,264 @@
+"""Compare a run against a baseline run and keep only what changed.
+
+A baseline is a previous JSON report or a run in the run history. Reports
+are read incrementally: :class:`_JsonReader` decodes one value at a time
+with ``json.JSONDecoder.raw_decode`` over a sliding buffer, and top-level
+arrays are consumed element by element. Only each scenario's pass flag and
+grader scores are kept, indexed by scenario ID and grader name, so a
+baseline report never has to fit in memory as a whole.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from eval_caregiver.runner.history import RunHistory
+from eval_caregiver.runner.quality_gates import QualityGateReport
+from eval_caregiver.runner.records import AnyScenarioResult, GraderRecord, ScenarioRecord
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JsonReader:
+    """Decodes one JSON document from a text stream a value at a time."""
+
+    def __init__(self, stream: TextIO, chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping what has been consumed; False at end of input."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """The next non-whitespace character, or ``""`` at end of input."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def take(self, expected: str) -> None:
+        found = self.peek()
+        if found != expected:
+            raise ValueError(f"Expected {expected!r} in JSON stream, found {found or 'end of input'!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete value, reading more input until it fits in the buffer."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number that ends the buffer may continue in the next chunk.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def _iter_members(reader: _JsonReader) -> Iterator[tuple[str, Any]]:
+    """Yield ``(key, value)`` for a top-level object, one ``(key, item)`` per element of array values."""
+    reader.take("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.take(":")
+        if reader.peek() == "[":
+            reader.take("[")
+            if reader.peek() != "]":
+                while True:
+                    yield key, reader.value()
+                    if reader.peek() != ",":
+                        break
+                    reader.take(",")
+            reader.take("]")
+        else:
+            yield key, reader.value()
+        if reader.peek() != ",":
+            break
+        reader.take(",")
+    reader.take("}")
+
+
+@dataclass(slots=True)
+class BaselineScenario:
+    """What the diff needs from one baseline scenario."""
+
+    passed: bool
+    scores: dict[str, tuple[float, bool]] = field(default_factory=dict)
+
+
+@dataclass
+class Baseline:
+    """A baseline run indexed by scenario ID and grader name, with its gate values."""
+
+    source: str
+    scenarios: dict[str, BaselineScenario] = field(default_factory=dict)
+    gates: dict[str, tuple[float, bool]] = field(default_factory=dict)
+
+    def records(self) -> list[ScenarioRecord]:
+        """Score-only scenario records, e.g. for a ``ScoreMatrix``."""
+        return [
+            ScenarioRecord(
+                scenario_id,
+                scenario_id,
+                tuple(GraderRecord(name, passed, score) for name, (score, passed) in s.scores.items()),
+                s.passed,
+            )
+            for scenario_id, s in self.scenarios.items()
+        ]
+
+
+def load_baseline_report(path: str | Path, *, chunk_size: int = 1 << 16) -> Baseline:
+    """Index a JSON report written by ``generate_json_report``, streaming it from disk."""
+    baseline = Baseline(source=str(path))
+    with open(path, encoding="utf-8") as stream:
+        for key, value in _iter_members(_JsonReader(stream, chunk_size)):
+            if key == "scenarios":
+                baseline.scenarios[value["scenario_id"]] = BaselineScenario(
+                    passed=value["passed"],
+                    scores={g["grader_name"]: (g["score"], g["passed"]) for g in value.get("graders", ())},
+                )
+            elif key == "quality_gates":
+                baseline.gates[value["metric"]] = (value["actual"], value["passed"])
+    return baseline
+
+
+def load_baseline_run(history: RunHistory, ref: str) -> Baseline:
+    """Index a run from the run history; ``ref`` is anything ``RunHistory.resolve`` accepts."""
+    run_id = history.resolve(ref)
+    baseline = Baseline(source=f"{history.path} run {run_id}", gates=history.gate_values(run_id))
+    for record in history.load_run(run_id):
+        baseline.scenarios[record.scenario_id] = BaselineScenario(
+            passed=record.passed,
+            scores={gr.grader_name: (gr.score, gr.passed) for gr in record.grader_results},
+        )
+    return baseline
+
+
+@dataclass
+class GraderChange:
+    """One grader's score and verdict in the baseline and in this run (``None`` where it did not run)."""
+
+    grader_name: str
+    base_score: float | None
+    score: float | None
+    base_passed: bool | None
+    passed: bool | None
+
+    @property
+    def delta(self) -> float:
+        return (self.score or 0.0) - (self.base_score or 0.0)
+
+
+@dataclass
+class ScenarioChange:
+    """A scenario whose verdict flipped or whose grader scores moved beyond epsilon."""
+
+    scenario_id: str
+    base_passed: bool
+    passed: bool
+    graders: list[GraderChange] = field(default_factory=list)
+
+
+@dataclass
+class GateDelta:
+    """One gate's value in the baseline and in this run."""
+
+    metric: str
+    base_value: float | None
+    value: float
+    base_passed: bool | None
+    passed: bool
+
+    @property
+    def delta(self) -> float:
+        return self.value - (self.base_value if self.base_value is not None else self.value)
+
+
+@dataclass
+class RunDiff:
+    """What changed between a baseline run and this one."""
+
+    source: str
+    epsilon: float
+    compared: int = 0
+    gates: list[GateDelta] = field(default_factory=list)
+    newly_failing: list[ScenarioChange] = field(default_factory=list)
+    newly_passing: list[ScenarioChange] = field(default_factory=list)
+    changed: list[ScenarioChange] = field(default_factory=list)
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.newly_failing or self.newly_passing or self.changed or self.added or self.removed)
+
+
+def diff_against(
+    baseline: Baseline,
+    results: Sequence[AnyScenarioResult],
+    gate_report: QualityGateReport,
+    *,
+    epsilon: float = 1e-3,
+) -> RunDiff:
+    """Diff ``results`` against ``baseline``; scores within ``epsilon`` count as unchanged.
+
+    Report baselines hold scores rounded to four decimals, so ``epsilon``
+    should stay above 5e-5.
+    """
+    diff = RunDiff(source=baseline.source, epsilon=epsilon)
+    seen = set()
+    for r in results:
+        seen.add(r.scenario_id)
+        base = baseline.scenarios.get(r.scenario_id)
+        if base is None:
+            diff.added.append(r.scenario_id)
+            continue
+        diff.compared += 1
+        change = ScenarioChange(r.scenario_id, base.passed, r.passed)
+        current = {gr.grader_name: gr for gr in r.grader_results}
+        for grader_name in current.keys() | base.scores.keys():
+            gr = current.get(grader_name)
+            base_score, base_passed = base.scores.get(grader_name, (None, None))
+            score, passed = (gr.score, gr.passed) if gr is not None else (None, None)
+            moved = base_score is None or score is None or abs(score - base_score) > epsilon
+            if moved or passed != base_passed:
+                change.graders.append(GraderChange(grader_name, base_score, score, base_passed, passed))
+        change.graders.sort(key=lambda g: g.grader_name)
+        if base.passed and not r.passed:
+            diff.newly_failing.append(change)
+        elif r.passed and not base.passed:
+            diff.newly_passing.append(change)
+        elif change.graders:
+            diff.changed.append(change)
+    diff.removed = sorted(baseline.scenarios.keys() - seen)
+    diff.changed.sort(key=lambda c: min(g.delta for g in c.graders))
+    for gr in gate_report.gate_results:
+        base_value, base_passed = baseline.gates.get(gr.gate.metric, (None, None))
+        diff.gates.append(GateDelta(gr.gate.metric, base_value, gr.actual_value, base_passed, gr.passed))
+    return diff
@@ -3,20 +3,42 @@
 from __future__ import annotations
 
 import argparse
+import shlex
 import sys
+from pathlib import Path
 
+from eval_caregiver.agent.generated_agent import GeneratedAgent
+from eval_caregiver.agent.http_agent import HttpAgent
 from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.agent.packed_store import PackedResponseStore
+from eval_caregiver.agent.recording import MODES as CASSETTE_MODES
+from eval_caregiver.agent.recording import RecordingAgent
+from eval_caregiver.agent.subprocess_agent import SubprocessAgent
 from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.graders.code_based.compliance_mention import ComplianceMentionGrader
 from eval_caregiver.graders.code_based.compliance_remediation import ComplianceRemediationGrader
 from eval_caregiver.graders.code_based.geo_restriction import GeoRestrictionGrader
+from eval_caregiver.graders.code_based.scheduling_offer import SchedulingOfferGrader
 from eval_caregiver.graders.manual.review_generator import ManualReviewGenerator
 from eval_caregiver.graders.model_based.safety_map_suggestions import SafetyMapSuggestionsGrader
 from eval_caregiver.graders.model_based.scheduling_helpfulness import SchedulingHelpfulnessGrader
 from eval_caregiver.reporting.json_report import generate_json_report
-from eval_caregiver.reporting.scorecard import print_scorecard
+from eval_caregiver.reporting.live_status import LiveStatus
+from eval_caregiver.reporting.scorecard import print_baseline_diff, print_scorecard
+from eval_caregiver.runner.baseline import diff_against, load_baseline_report, load_baseline_run
 from eval_caregiver.runner.executor import EvalExecutor
-from eval_caregiver.runner.quality_gates import QualityGateEvaluator
-from eval_caregiver.scenarios.loader import get_all_scenarios, get_collection
+from eval_caregiver.runner.history import DEFAULT_HISTORY_PATH, RunHistory, current_commit
+from eval_caregiver.runner.history import main as history_main
+from eval_caregiver.runner.quality_gates import FailFastTracker, GateAccumulator, QualityGateEvaluator
+from eval_caregiver.runner.sampling import run_sampled
+from eval_caregiver.runner.score_matrix import ScoreMatrix
+from eval_caregiver.runner.scheduling import DurationHistory
+from eval_caregiver.runner.timeouts import TimeoutConfig
+from eval_caregiver.scenarios import loader
+from eval_caregiver.scenarios.bundle import load_bundle
+from eval_caregiver.scenarios.generator import ScenarioGenerator
+from eval_caregiver.scenarios.loader import get_scenario, query_scenarios
+from eval_caregiver.scenarios.streaming import JsonlScenarioSource, filter_scenarios
 
 
 def _build_grader_registry() -> dict:
@@ -25,6 +47,8 @@ def _build_grader_registry() -> dict:
         ComplianceGapGrader(),
         ComplianceRemediationGrader(),
         GeoRestrictionGrader(),
+        ComplianceMentionGrader(),
+        SchedulingOfferGrader(),
         SchedulingHelpfulnessGrader(),
         SafetyMapSuggestionsGrader(),
     ]
@@ -32,6 +56,10 @@ def _build_grader_registry() -> dict:
 
 
 def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["history"]:
+        return history_main(argv[1:])
+
     parser = argparse.ArgumentParser(
         prog="eval-runner",
         description="Run caregiver intake agent evaluation suite",
@@ -52,45 +80,406 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="Run only scenarios from this collection ID",
     )
+    parser.add_argument(
+        "-g", "--grader",
+        type=str,
+        default=None,
+        help="Run only scenarios that use this grader",
+    )
+    parser.add_argument(
+        "--required-only",
+        action="store_true",
+        help="Run only scenarios marked as required",
+    )
+    parser.add_argument(
+        "-s", "--scenario",
+        action="append",
+        default=None,
+        help="Run only this scenario ID (repeatable); overrides the other filters",
+    )
     parser.add_argument(
         "-o", "--output",
         type=str,
         default="output/eval_report.json",
         help="Path for the JSON report (default: output/eval_report.json)",
     )
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Show each quality gate's running value and projected outcome on stderr during the run",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop as soon as a quality gate can no longer pass and write a partial report",
+    )
+    mode.add_argument(
+        "--sample",
+        type=float,
+        default=None,
+        metavar="FRACTION",
+        help="Run a stratified sample of scenarios and decide gates from confidence intervals, "
+        "sampling more while a gate is inconclusive",
+    )
+    mode.add_argument(
+        "--trials",
+        type=int,
+        default=1,
+        metavar="K",
+        help="Run each scenario K times and gate on per-scenario aggregates (pass rate, pass@K)",
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level for gate intervals and baseline tests (default: 0.95)",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Report a bootstrap confidence interval for each gate from N resamples (e.g. 10000); "
+        "not with --sample, whose gates already come from confidence intervals",
+    )
+    baseline_source = parser.add_mutually_exclusive_group()
+    baseline_source.add_argument(
+        "--baseline",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="JSON report of a previous run: print only what changed against it and test each gate "
+        "for a significant change (the report is streamed, not loaded whole)",
+    )
+    baseline_source.add_argument(
+        "--baseline-run",
+        type=str,
+        default=None,
+        metavar="REF",
+        help="Like --baseline, for a run in the run history: a run ID, latest, latest~N or a commit prefix",
+    )
+    parser.add_argument(
+        "--diff-epsilon",
+        type=float,
+        default=1e-3,
+        help="Score changes up to this size are not reported in the baseline diff (default: 0.001)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for sampling, bootstrap resamples and --generate (default: 0)",
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Number of scenarios to run concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--scenario-timeout",
+        type=float,
+        default=None,
+        help="Seconds allowed per scenario (agent plus all graders)",
+    )
+    parser.add_argument(
+        "--agent-timeout",
+        type=float,
+        default=None,
+        help="Seconds allowed per agent call",
+    )
+    parser.add_argument(
+        "--grader-timeout",
+        type=float,
+        default=None,
+        help="Seconds allowed per grader call",
+    )
+    parser.add_argument(
+        "--run-budget",
+        type=float,
+        default=None,
+        help="Seconds allowed for the whole run; scenarios not started in time fail as timed out",
+    )
+    parser.add_argument(
+        "--durations",
+        type=str,
+        default="output/scenario_durations.json",
+        help="Per-scenario duration history used to start the slowest scenarios first "
+        "(default: output/scenario_durations.json)",
+    )
+    parser.add_argument(
+        "--history",
+        type=str,
+        default=DEFAULT_HISTORY_PATH,
+        help="SQLite run history that every run is appended to unless --no-history is given; "
+        f"query it with `eval-runner history` (default: {DEFAULT_HISTORY_PATH})",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record this run in the run history",
+    )
+    parser.add_argument(
+        "--label",
+        type=str,
+        default="",
+        help="Free-form label stored with the run in the run history",
+    )
+    parser.add_argument(
+        "--scenarios-file",
+        type=str,
+        default=None,
+        help="Stream scenarios from a JSONL file (optionally .gz) instead of the bundled collections; "
+        "--fail-fast, --sample and --trials read the whole file into memory first",
+    )
+    # Each of these chooses the agent under test; they cannot be combined.
+    agent_source = parser.add_mutually_exclusive_group()
+    agent_source.add_argument(
+        "--generate",
+        type=int,
+        default=None,
+        metavar="COUNT",
+        help="Generate COUNT scenarios (seeded by --seed) and run those matching -c, -g, -s and "
+        "--required-only against their synthetic responses",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=None,
+        help="With --generate, the fraction of synthetic responses that are deliberately flawed (default: 0)",
+    )
+    parser.add_argument(
+        "--responses-pack",
+        type=str,
+        default=None,
+        help="Serve mock responses from a packed response file "
+        "(build one with python -m eval_caregiver.agent.packed_store)",
+    )
+    agent_source.add_argument(
+        "--agent-url",
+        type=str,
+        default=None,
+        help="Evaluate the agent behind this HTTP endpoint instead of the mock agent",
+    )
+    parser.add_argument(
+        "--agent-connections",
+        type=int,
+        default=8,
+        help="Maximum concurrent keep-alive connections to --agent-url (default: 8)",
+    )
+    agent_source.add_argument(
+        "--agent-command",
+        type=str,
+        default=None,
+        help="Evaluate a CLI agent: start this command as a pool of persistent stdio JSON-RPC workers",
+    )
+    parser.add_argument(
+        "--agent-processes",
+        type=int,
+        default=None,
+        help="Number of --agent-command worker processes (default: --workers)",
+    )
+    parser.add_argument(
+        "--cassettes",
+        type=str,
+        default=None,
+        help="Record agent outputs to this cassette directory and replay them on later runs",
+    )
+    parser.add_argument(
+        "--cassette-mode",
+        choices=CASSETTE_MODES,
+        default="auto",
+        help="auto: replay if recorded, else record; replay: never call the agent; "
+        "record: always call and overwrite (default: auto)",
+    )
+    parser.add_argument(
+        "--agent-version",
+        type=str,
+        default="mock",
+        help="Agent version that cassettes are recorded under (default: mock)",
+    )
+    parser.add_argument(
+        "--no-bundle",
+        action="store_true",
+        help="Parse the JSON data files directly instead of using the compiled data bundle",
+    )
     args = parser.parse_args(argv)
+    if args.sample is not None and not 0 < args.sample <= 1:
+        parser.error(f"--sample must be a fraction in (0, 1], got {args.sample}")
+    if args.trials < 1:
+        parser.error(f"--trials must be at least 1, got {args.trials}")
+    if args.error_rate is not None and args.generate is None:
+        parser.error("--error-rate only applies to --generate")
+    if args.bootstrap and args.sample is not None:
+        parser.error("--bootstrap cannot be combined with --sample: sampled gates come from their own intervals")
+
+    # Load the compiled bundle (rebuilt automatically when any data file changed)
+    responses = None
+    if not args.no_bundle:
+        bundle = load_bundle(loader.data_dir())
+        loader.use_collections(bundle.collections)
+        responses = bundle.response_store()
+    if args.responses_pack is not None:
+        responses = PackedResponseStore(args.responses_pack)
 
     # Load scenarios
-    if args.collection:
-        collection = get_collection(args.collection)
-        scenarios = collection.scenarios
+    agent = None
+    if args.generate is not None:
+        try:
+            generator = ScenarioGenerator(seed=args.seed, error_rate=args.error_rate or 0.0)
+        except ValueError as exc:
+            parser.error(str(exc))
+        agent = GeneratedAgent(generator)
+        scenarios = filter_scenarios(
+            generator.scenarios(args.generate),
+            collection=args.collection,
+            grader=args.grader,
+            required=True if args.required_only else None,
+            scenario_ids=args.scenario or None,
+        )
+        if args.fail_fast or args.sample is not None or args.trials > 1:
+            scenarios = list(scenarios)
+    elif args.scenarios_file is not None:
+        scenarios = JsonlScenarioSource(
+            args.scenarios_file,
+            collection=args.collection,
+            grader=args.grader,
+            required=True if args.required_only else None,
+            scenario_ids=args.scenario or None,
+        )
+        if args.fail_fast or args.sample is not None or args.trials > 1:
+            scenarios = list(scenarios)
+    elif args.scenario:
+        scenarios = [get_scenario(scenario_id) for scenario_id in args.scenario]
     else:
-        scenarios = get_all_scenarios()
+        scenarios = query_scenarios(
+            collection=args.collection,
+            grader=args.grader,
+            required=True if args.required_only else None,
+        )
+
+    # Load the baseline before running, so a bad path or run reference fails fast
+    baseline = None
+    if args.baseline is not None:
+        if not Path(args.baseline).is_file():
+            parser.error(f"baseline report not found: {args.baseline}")
+        baseline = load_baseline_report(args.baseline)
+    elif args.baseline_run is not None:
+        if not Path(args.history).is_file():
+            parser.error(f"no run history at {args.history}")
+        with RunHistory(args.history) as run_history:
+            try:
+                baseline = load_baseline_run(run_history, args.baseline_run)
+            except ValueError as exc:
+                parser.error(str(exc))
 
     # Build components
-    agent = MockAgent()
+    adapter: SubprocessAgent | HttpAgent | None = None
+    if agent is None and args.agent_command is not None:
+        agent = adapter = SubprocessAgent(
+            shlex.split(args.agent_command), workers=args.agent_processes or args.workers
+        )
+    if agent is None and args.agent_url is not None:
+        agent = adapter = HttpAgent(args.agent_url, max_connections=args.agent_connections)
+    if agent is None:
+        agent = MockAgent(responses=responses)
+    if args.cassettes is not None:
+        agent = RecordingAgent(
+            agent, args.cassettes, agent_version=args.agent_version, mode=args.cassette_mode
+        )
     graders = _build_grader_registry()
     review_generator = ManualReviewGenerator()
+    history = DurationHistory(args.durations)
     executor = EvalExecutor(
         agent=agent,
         graders=graders,
         skip_model_graders=args.no_model_graders,
         review_generator=review_generator,
+        timeouts=TimeoutConfig(
+            scenario=args.scenario_timeout,
+            agent=args.agent_timeout,
+            grader=args.grader_timeout,
+            run_budget=args.run_budget,
+        ),
+        max_workers=args.workers,
+        history=history,
     )
 
-    # Run evaluation
-    results = executor.run_scenarios(scenarios)
-
-    # Evaluate quality gates
+    # Run evaluation and quality gates
     gate_evaluator = QualityGateEvaluator()
-    gate_report = gate_evaluator.evaluate(results)
+    try:
+        trials = None
+        if args.trials > 1:
+            trials = executor.run_trials(scenarios, args.trials)
+            results = [t.aggregate() for t in trials]
+            matrix = ScoreMatrix.from_results(results)
+            gate_report = gate_evaluator.evaluate(matrix)
+        elif args.sample is not None:
+            results, gate_report = run_sampled(
+                executor,
+                scenarios,
+                fraction=args.sample,
+                evaluator=gate_evaluator,
+                confidence=args.confidence,
+                seed=args.seed,
+            )
+            matrix = ScoreMatrix.from_results(results)
+        else:
+            # Gates are folded in as results arrive, so no extra pass is needed afterwards.
+            live = LiveStatus() if args.live else None
+            tracker = (FailFastTracker if args.fail_fast else GateAccumulator)(listener=live)
+            try:
+                results = executor.run_scenarios(scenarios, tracker=tracker)
+            finally:
+                if live is not None:
+                    live.close()
+            matrix = ScoreMatrix.from_results(results)
+            gate_report = tracker.report()
+    finally:
+        # Stop agent worker processes and close pooled connections even if the run failed
+        if adapter is not None:
+            adapter.close()
+    if args.bootstrap:
+        gate_report = gate_evaluator.evaluate(
+            matrix,
+            early_stop=gate_report.early_stop,
+            bootstrap=args.bootstrap,
+            confidence=args.confidence,
+            seed=args.seed,
+        )
+    diff = None
+    if baseline is not None:
+        gate_report.baseline = gate_evaluator.compare(
+            matrix,
+            baseline.records(),
+            source=baseline.source,
+            resamples=args.bootstrap or 10_000,
+            confidence=args.confidence,
+            seed=args.seed,
+        )
+        diff = diff_against(baseline, results, gate_report, epsilon=args.diff_epsilon)
+    history.save()
 
     # Generate reports
-    report_path = generate_json_report(results, gate_report, args.output)
+    report_path = generate_json_report(results, gate_report, args.output, trials=trials, matrix=matrix, diff=diff)
     print(f"JSON report written to: {report_path}")
 
+    if not args.no_history:
+        with RunHistory(args.history) as run_history:
+            run_id = run_history.record_run(
+                results,
+                gate_report,
+                git_commit=current_commit(),
+                label=args.label,
+                report_path=str(report_path),
+            )
+        print(f"Run {run_id} recorded in: {args.history}")
+
     if args.scorecard:
-        print_scorecard(results, gate_report)
+        print_scorecard(results, gate_report, trials=trials, matrix=matrix)
+    if diff is not None:
+        print_baseline_diff(diff)
 
     return 0 if gate_report.all_passed else 1
 
@@ -2,10 +2,26 @@
 
 from __future__ import annotations
 
-from eval_caregiver.agent.base import AgentBase
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from eval_caregiver.agent.base import AgentBase, AgentOutput
+from eval_caregiver.agent.streaming import StreamingAgentBase
 from eval_caregiver.graders.base import Grader
+from eval_caregiver.graders.incremental import IncrementalGrader, TurnState
 from eval_caregiver.graders.manual.review_generator import ManualReviewGenerator
-from eval_caregiver.schemas.grader_results import ScenarioResult
+from eval_caregiver.runner.quality_gates import GateAccumulator
+from eval_caregiver.runner.records import GraderRecord, ScenarioRecord
+from eval_caregiver.runner.scheduling import DurationHistory, heuristic_cost
+from eval_caregiver.runner.timeouts import (
+    CallTimeoutError,
+    Deadline,
+    TimeoutConfig,
+    call_with_timeout,
+    effective_timeout,
+)
+from eval_caregiver.runner.trials import TrialSummary
 from eval_caregiver.schemas.scenarios import TestScenario
 
 
@@ -19,40 +35,163 @@ class EvalExecutor:
         *,
         skip_model_graders: bool = False,
         review_generator: ManualReviewGenerator | None = None,
+        timeouts: TimeoutConfig | None = None,
+        max_workers: int = 1,
+        history: DurationHistory | None = None,
+        end_early: bool = True,
     ) -> None:
         self._agent = agent
         self._graders = graders
         self._skip_model_graders = skip_model_graders
         self._review_generator = review_generator
+        self._timeouts = timeouts or TimeoutConfig()
+        self._max_workers = max(1, max_workers)
+        self._history = history
+        self._end_early = end_early
 
-    def run_scenario(self, scenario: TestScenario) -> ScenarioResult:
-        """Run a single scenario and return the result."""
-        output = self._agent.run_scenario(scenario)
-
-        grader_results = []
+    def active_grader_names(self, scenario: TestScenario) -> list[str]:
+        """Names of the graders that will actually run for a scenario."""
+        names = []
         for grader_name in scenario.grader_names:
             grader = self._graders.get(grader_name)
             if grader is None:
                 continue
             if self._skip_model_graders and grader.is_model_based:
                 continue
+            names.append(grader_name)
+        return names
+
+    def expected_duration(self, scenario: TestScenario, *, seconds_per_unit: float = 1.0) -> float:
+        """Recorded duration in seconds, or the grader heuristic times ``seconds_per_unit`` without history."""
+        if self._history is not None:
+            recorded = self._history.get(scenario.scenario_id)
+            if recorded is not None:
+                return recorded
+        return self._heuristic_cost(scenario) * seconds_per_unit
+
+    def _heuristic_cost(self, scenario: TestScenario) -> float:
+        active = self.active_grader_names(scenario)
+        model_graders = [name for name in active if self._graders[name].is_model_based]
+        return heuristic_cost(len(active), len(model_graders))
+
+    def _seconds_per_unit(self, scenarios: Sequence[TestScenario]) -> float:
+        """Recorded seconds per heuristic unit over the scenarios that have history (1.0 if none do)."""
+        if self._history is None:
+            return 1.0
+        seconds = units = 0.0
+        for scenario in scenarios:
+            recorded = self._history.get(scenario.scenario_id)
+            if recorded is not None:
+                seconds += recorded
+                units += self._heuristic_cost(scenario)
+        return seconds / units if units else 1.0
+
+    def schedule(self, scenarios: Sequence[TestScenario]) -> list[int]:
+        """Positions of ``scenarios`` in the order they should start: longest expected first.
+
+        Scenarios without history are estimated from their active graders and
+        put on the seconds scale of the ones that have it, so both sort together.
+        """
+        scale = self._seconds_per_unit(scenarios)
+        expected = [self.expected_duration(s, seconds_per_unit=scale) for s in scenarios]
+        return sorted(range(len(scenarios)), key=lambda i: -expected[i])
+
+    def run_scenario(self, scenario: TestScenario) -> ScenarioRecord:
+        """Run a single scenario and return the result."""
+        return self._run_scenario(scenario, Deadline(None))
 
-            result = grader.grade(
-                scenario=scenario,
-                transcript=output.transcript,
-                intake_record=output.intake_record,
-                action_log=output.action_log,
+    def _run_scenario(self, scenario: TestScenario, run_deadline: Deadline) -> ScenarioRecord:
+        """Run a scenario and record how long it took."""
+        started = time.perf_counter()
+        result = self._run_scenario_within(scenario, run_deadline)
+        if self._history is not None:
+            self._history.record(scenario.scenario_id, time.perf_counter() - started)
+        return result
+
+    def _run_scenario_within(self, scenario: TestScenario, run_deadline: Deadline) -> ScenarioRecord:
+        """Run a scenario within the per-scenario deadline and the remaining run budget."""
+        if run_deadline.expired:
+            return self._aborted(
+                scenario,
+                None,
+                self.active_grader_names(scenario),
+                "Timed out: run budget exhausted before the scenario started",
+            )
+
+        scenario_deadline = Deadline(self._timeouts.scenario)
+        agent_timeout = effective_timeout(self._timeouts.agent, scenario_deadline, run_deadline)
+        active = self.active_grader_names(scenario)
+        turn_states: dict[str, TurnState] = {}
+        ended_at: int | None = None
+        # A distinct object per call lets the agent tell concurrent trials apart on cancel.
+        call = scenario.model_copy()
+        try:
+            if isinstance(self._agent, StreamingAgentBase):
+                turn_states = {
+                    name: self._graders[name].begin(scenario)
+                    for name in active
+                    if isinstance(self._graders[name], IncrementalGrader)
+                }
+                output, ended_at = call_with_timeout(
+                    self._stream, agent_timeout, call, turn_states, len(turn_states) == len(active)
+                )
+            else:
+                output = call_with_timeout(self._agent.run_scenario, agent_timeout, call)
+        except CallTimeoutError:
+            self._agent.cancel(call)
+            return self._aborted(
+                scenario, None, active, f"Timed out: agent did not respond within {agent_timeout:.2f}s"
             )
-            grader_results.append(result)
+        except Exception as e:
+            return self._aborted(scenario, None, active, f"Agent error: {type(e).__name__}: {e}")
+
+        grader_results: list[GraderRecord] = []
+        skipped: list[str] = []
+        timed_out: list[str] = []
+        for grader_name in active:
+            if grader_name in turn_states:
+                state = turn_states[grader_name]
+                # An undecided grader on a cut-short stream was not run, not failed.
+                if ended_at is not None and state.outcome is None:
+                    skipped.append(grader_name)
+                else:
+                    grader_results.append(GraderRecord.from_result(state.result()))
+                continue
+            if output is None:
+                skipped.append(grader_name)
+                continue
+            grader = self._graders[grader_name]
+            grader_timeout = effective_timeout(self._timeouts.grader, scenario_deadline, run_deadline)
+            try:
+                result = call_with_timeout(
+                    grader.grade,
+                    grader_timeout,
+                    scenario=scenario,
+                    transcript=output.transcript,
+                    intake_record=output.intake_record,
+                    action_log=output.action_log,
+                    timeout=grader_timeout,
+                )
+            except CallTimeoutError:
+                # A slow grader fails on its own; the remaining graders still run.
+                details = f"Timed out: grader {grader_name!r} did not finish within {grader_timeout:.2f}s"
+                grader_results.append(GraderRecord(grader_name, False, 0.0, details))
+                timed_out.append(details)
+                continue
+            grader_results.append(GraderRecord.from_result(result))
 
         all_passed = all(r.passed for r in grader_results) if grader_results else True
 
         # Check if manual review is needed
-        review_reasons: list[str] = []
+        review_reasons: list[str] = list(timed_out)
         if grader_results:
             failing = [r for r in grader_results if not r.passed]
             if failing:
                 review_reasons.append(f"{len(failing)} grader(s) failed: {[r.grader_name for r in failing]}")
+                if ended_at is not None:
+                    review_reasons.append(
+                        f"Ended early after turn {ended_at}; graders not run: {skipped}"
+                    )
             # Flag disagreements between code and model graders
             code_results = [r for r in grader_results if not self._graders[r.grader_name].is_model_based]
             model_results = [r for r in grader_results if self._graders[r.grader_name].is_model_based]
@@ -64,13 +203,15 @@ class EvalExecutor:
 
         needs_review = len(review_reasons) > 0
 
-        scenario_result = ScenarioResult(
+        scenario_result = ScenarioRecord(
             scenario_id=scenario.scenario_id,
             scenario_name=scenario.name,
-            grader_results=grader_results,
+            grader_results=tuple(grader_results),
             passed=all_passed,
             needs_manual_review=needs_review,
-            review_reasons=review_reasons,
+            review_reasons=tuple(review_reasons),
+            collection=scenario.collection,
+            required=scenario.required,
         )
 
         if needs_review and self._review_generator:
@@ -78,6 +219,145 @@ class EvalExecutor:
 
         return scenario_result
 
-    def run_scenarios(self, scenarios: list[TestScenario]) -> list[ScenarioResult]:
-        """Run multiple scenarios and return all results."""
-        return [self.run_scenario(s) for s in scenarios]
+    def _stream(
+        self, scenario: TestScenario, turn_states: dict[str, TurnState], all_incremental: bool
+    ) -> tuple[AgentOutput | None, int | None]:
+        """Feed streamed turns to incremental graders as they arrive.
+
+        Returns ``(output, None)`` when the conversation finishes, or
+        ``(None, turn_number)`` when it was cut short because an incremental
+        grader had already failed, or every grader had already passed.
+        """
+        stream = self._agent.stream_scenario(scenario)
+        while True:
+            try:
+                turn = next(stream)
+            except StopIteration as stop:
+                return stop.value, None
+            for state in turn_states.values():
+                state.observe(turn)
+            if self._end_early and turn_states:
+                outcomes = [state.outcome for state in turn_states.values()]
+                if False in outcomes or (all_incremental and all(outcomes)):
+                    stream.close()
+                    return None, turn.turn_number
+
+    def _aborted(
+        self,
+        scenario: TestScenario,
+        output: AgentOutput | None,
+        grader_names: list[str],
+        reason: str,
+    ) -> ScenarioRecord:
+        """Build a failed, review-flagged result for a scenario that could not finish.
+
+        Every grader that was due to run scores 0.0, so an aborted scenario
+        counts against the quality gates instead of leaving them untouched.
+        """
+        scenario_result = ScenarioRecord(
+            scenario_id=scenario.scenario_id,
+            scenario_name=scenario.name,
+            grader_results=tuple(GraderRecord(name, False, 0.0, f"Not run: {reason}") for name in grader_names),
+            passed=False,
+            needs_manual_review=True,
+            review_reasons=(reason,),
+            collection=scenario.collection,
+            required=scenario.required,
+        )
+        if self._review_generator:
+            self._review_generator.generate(scenario, output, scenario_result)
+        return scenario_result
+
+    def iter_results(self, scenarios: Iterable[TestScenario]) -> Iterator[ScenarioRecord]:
+        """Run scenarios lazily, yielding each result as soon as it is graded.
+
+        With ``max_workers > 1`` results arrive in completion order, and when a
+        duration history is configured a sequence of scenarios is started
+        longest-expected-first. Closing the iterator early cancels every
+        scenario that has not started yet.
+        """
+        for _, result in self._iter_indexed(scenarios):
+            yield result
+
+    def _iter_indexed(self, scenarios: Iterable[TestScenario]) -> Iterator[tuple[int, ScenarioRecord]]:
+        """Yield ``(input position, result)`` pairs as scenarios finish."""
+        run_deadline = Deadline(self._timeouts.run_budget)
+        if self._max_workers == 1:
+            for index, scenario in enumerate(scenarios):
+                yield index, self._run_scenario(scenario, run_deadline)
+            return
+
+        if self._history is not None and isinstance(scenarios, Sequence):
+            source = ((i, scenarios[i]) for i in self.schedule(scenarios))
+        else:
+            source = enumerate(scenarios)
+
+        pool = ThreadPoolExecutor(max_workers=self._max_workers)
+        pending: dict[Future, int] = {}
+        window = self._max_workers * 2
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < window:
+                    try:
+                        index, scenario = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[pool.submit(self._run_scenario, scenario, run_deadline)] = index
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def run_scenarios(
+        self,
+        scenarios: Iterable[TestScenario],
+        *,
+        tracker: GateAccumulator | None = None,
+    ) -> list[ScenarioRecord]:
+        """Run multiple scenarios and return all results.
+
+        The scenarios are consumed once, so a streaming source is never held
+        in memory. A ``tracker`` observes every result as it arrives; given a
+        sequence of scenarios it also knows which graders are still to run, so
+        a ``FailFastTracker`` stops the run as soon as a quality gate can no
+        longer pass and ``tracker.early_stop`` then describes what was skipped.
+        """
+        if tracker is not None:
+            if isinstance(scenarios, Sequence):
+                tracker.start({s.scenario_id: self.active_grader_names(s) for s in scenarios})
+            else:
+                tracker.start()
+        indexed = []
+        stream = self._iter_indexed(scenarios)
+        try:
+            for index, result in stream:
+                indexed.append((index, result))
+                if tracker is not None:
+                    tracker.observe(result)
+                    if tracker.should_stop():
+                        break
+        finally:
+            stream.close()
+        indexed.sort(key=lambda pair: pair[0])
+        return [result for _, result in indexed]
+
+    def run_trials(self, scenarios: list[TestScenario], trials: int) -> list[TrialSummary]:
+        """Run every scenario ``trials`` times and group the results per scenario.
+
+        All trials go through the same worker pool, agent and grader instances,
+        so repeated trials add agent and judge work but no extra client setup.
+        """
+        if trials < 1:
+            raise ValueError(f"trials must be >= 1, got {trials}")
+        expanded = [scenario for scenario in scenarios for _ in range(trials)]
+        summaries = [TrialSummary(scenario_id=s.scenario_id, scenario_name=s.name) for s in scenarios]
+        for index, result in self._iter_indexed(expanded):
+            summaries[index // trials].trials.append(result)
+        return summaries
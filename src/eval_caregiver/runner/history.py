@@ -0,0 +1,457 @@
+"""Local SQLite history of evaluation runs.
+
+Every ``eval-runner`` run is appended to one database: run metadata, gate
+results, per-scenario and per-grader outcomes, rubric criterion scores and
+LLM judge usage. Indexes on scenario, grader and commit keep trend and
+regression queries to a few index lookups however many runs are stored.
+
+``eval-runner history --help`` lists the queries.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import subprocess
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from eval_caregiver.runner.quality_gates import QualityGateReport
+from eval_caregiver.runner.records import AnyScenarioResult, GraderRecord, ScenarioRecord
+from eval_caregiver.schemas.grader_results import JudgeUsage, RubricCriterionScore
+
+DEFAULT_HISTORY_PATH = "output/eval_history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    git_commit TEXT NOT NULL DEFAULT '',
+    label TEXT NOT NULL DEFAULT '',
+    report_path TEXT NOT NULL DEFAULT '',
+    total INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    needs_review INTEGER NOT NULL,
+    gates_passed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs (git_commit, run_id);
+
+CREATE TABLE IF NOT EXISTS gate_results (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    metric TEXT NOT NULL,
+    threshold REAL NOT NULL,
+    actual REAL NOT NULL,
+    passed INTEGER NOT NULL,
+    PRIMARY KEY (run_id, metric)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS scenario_results (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    scenario_id TEXT NOT NULL,
+    scenario_name TEXT NOT NULL,
+    collection TEXT NOT NULL DEFAULT '',
+    passed INTEGER NOT NULL,
+    overall_score REAL NOT NULL,
+    needs_review INTEGER NOT NULL,
+    review_reasons TEXT NOT NULL DEFAULT '[]',
+    PRIMARY KEY (run_id, scenario_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS scenario_results_scenario ON scenario_results (scenario_id, run_id);
+
+CREATE TABLE IF NOT EXISTS grader_results (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    scenario_id TEXT NOT NULL,
+    grader_name TEXT NOT NULL,
+    passed INTEGER NOT NULL,
+    score REAL NOT NULL,
+    details TEXT NOT NULL DEFAULT '',
+    judge_model TEXT,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    latency_s REAL,
+    PRIMARY KEY (run_id, scenario_id, grader_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS grader_results_grader ON grader_results (grader_name, run_id);
+CREATE INDEX IF NOT EXISTS grader_results_scenario ON grader_results (scenario_id, run_id);
+
+CREATE TABLE IF NOT EXISTS criterion_scores (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    scenario_id TEXT NOT NULL,
+    grader_name TEXT NOT NULL,
+    criterion TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    max_score INTEGER NOT NULL,
+    rationale TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (run_id, scenario_id, grader_name, criterion)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass
+class RunSummary:
+    """One stored run."""
+
+    run_id: int
+    started_at: str
+    git_commit: str
+    label: str
+    total: int
+    passed: int
+    needs_review: int
+    gates_passed: bool
+
+
+@dataclass
+class TrendPoint:
+    """One grader's score on a scenario in one run."""
+
+    run_id: int
+    started_at: str
+    git_commit: str
+    grader_name: str
+    score: float
+    passed: bool
+
+
+@dataclass
+class Regression:
+    """A grader score that dropped between two runs."""
+
+    scenario_id: str
+    grader_name: str
+    base_score: float
+    score: float
+    base_passed: bool
+    passed: bool
+
+    @property
+    def delta(self) -> float:
+        return self.score - self.base_score
+
+
+@dataclass
+class JudgeTotals:
+    """LLM judge calls, tokens and time for one grader in one run."""
+
+    grader_name: str
+    calls: int
+    input_tokens: int
+    output_tokens: int
+    latency_s: float
+
+
+def current_commit() -> str:
+    """HEAD of the git checkout in the working directory, or ``""`` outside one."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return completed.stdout.strip()
+
+
+class RunHistory:
+    """Append-only store of evaluation runs in a SQLite database at ``path``."""
+
+    def __init__(self, path: str | Path = DEFAULT_HISTORY_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> RunHistory:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def record_run(
+        self,
+        results: Sequence[AnyScenarioResult],
+        gate_report: QualityGateReport,
+        *,
+        git_commit: str = "",
+        label: str = "",
+        report_path: str = "",
+        started_at: str | None = None,
+    ) -> int:
+        """Store one run in a single transaction and return its run ID."""
+        started_at = started_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+        scenario_rows = []
+        grader_rows = []
+        criterion_rows = []
+        passed = needs_review = 0
+        with self._conn:
+            run_id = self._conn.execute(
+                "INSERT INTO runs (started_at, git_commit, label, report_path, total, passed, needs_review, "
+                "gates_passed) VALUES (?, ?, ?, ?, 0, 0, 0, ?)",
+                (started_at, git_commit, label, report_path, gate_report.all_passed),
+            ).lastrowid
+            for r in results:
+                passed += r.passed
+                needs_review += r.needs_manual_review
+                scenario_rows.append((
+                    run_id,
+                    r.scenario_id,
+                    r.scenario_name,
+                    getattr(r, "collection", ""),
+                    r.passed,
+                    r.overall_score,
+                    r.needs_manual_review,
+                    json.dumps(list(r.review_reasons)),
+                ))
+                for gr in r.grader_results:
+                    usage = gr.judge_usage
+                    grader_rows.append((
+                        run_id,
+                        r.scenario_id,
+                        gr.grader_name,
+                        gr.passed,
+                        gr.score,
+                        gr.details,
+                        usage.model if usage else None,
+                        usage.input_tokens if usage else None,
+                        usage.output_tokens if usage else None,
+                        usage.latency_s if usage else None,
+                    ))
+                    criterion_rows.extend(
+                        (run_id, r.scenario_id, gr.grader_name, cs.criterion, cs.score, cs.max_score, cs.rationale)
+                        for cs in gr.criterion_scores
+                    )
+            # Later duplicates of a scenario ID replace earlier ones, as in any ID-keyed index.
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO scenario_results VALUES (?, ?, ?, ?, ?, ?, ?, ?)", scenario_rows
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO grader_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", grader_rows
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO criterion_scores VALUES (?, ?, ?, ?, ?, ?, ?)", criterion_rows
+            )
+            self._conn.executemany(
+                "INSERT INTO gate_results VALUES (?, ?, ?, ?, ?)",
+                [
+                    (run_id, gr.gate.metric, gr.gate.threshold, gr.actual_value, gr.passed)
+                    for gr in gate_report.gate_results
+                ],
+            )
+            self._conn.execute(
+                "UPDATE runs SET total = ?, passed = ?, needs_review = ? WHERE run_id = ?",
+                (len(scenario_rows), passed, needs_review, run_id),
+            )
+        return run_id
+
+    def runs(self, *, limit: int = 20, git_commit: str | None = None) -> list[RunSummary]:
+        """Most recent runs first, optionally only those at a commit (prefix)."""
+        sql = "SELECT run_id, started_at, git_commit, label, total, passed, needs_review, gates_passed FROM runs"
+        params: tuple = ()
+        if git_commit:
+            sql += " WHERE git_commit >= ? AND git_commit < ?"
+            params = (git_commit, git_commit + "\uffff")
+        rows = self._conn.execute(sql + " ORDER BY run_id DESC LIMIT ?", (*params, limit))
+        return [RunSummary(*row[:7], gates_passed=bool(row[7])) for row in rows]
+
+    def resolve(self, ref: str) -> int:
+        """Run ID for ``ref``: a run ID, ``latest``, ``latest~N`` or a commit prefix.
+
+        An all-digit ref is a run ID when that run exists and a commit prefix otherwise.
+        """
+        row = None
+        if ref.isdigit():
+            row = self._conn.execute("SELECT run_id FROM runs WHERE run_id = ?", (int(ref),)).fetchone()
+        if ref == "latest" or (ref.startswith("latest~") and ref[7:].isdigit()):
+            offset = int(ref[7:]) if ref != "latest" else 0
+            row = self._conn.execute(
+                "SELECT run_id FROM runs ORDER BY run_id DESC LIMIT 1 OFFSET ?", (offset,)
+            ).fetchone()
+        elif row is None:
+            runs = self.runs(limit=1, git_commit=ref)
+            row = (runs[0].run_id,) if runs else None
+        if row is None:
+            raise ValueError(
+                f"Unknown run: {ref}. Available: a run ID, latest, latest~N or a commit prefix "
+                f"({self._count()} runs in {self.path})"
+            )
+        return row[0]
+
+    def load_run(self, run_id: int) -> list[ScenarioRecord]:
+        """Rebuild the scenario results of a stored run, in scenario ID order."""
+        graders: dict[str, list[GraderRecord]] = {}
+        criteria: dict[tuple[str, str], list[RubricCriterionScore]] = {}
+        for scenario_id, grader_name, criterion, score, max_score, rationale in self._conn.execute(
+            "SELECT scenario_id, grader_name, criterion, score, max_score, rationale "
+            "FROM criterion_scores WHERE run_id = ?",
+            (run_id,),
+        ):
+            criteria.setdefault((scenario_id, grader_name), []).append(
+                RubricCriterionScore(criterion=criterion, score=score, max_score=max_score, rationale=rationale)
+            )
+        for scenario_id, grader_name, passed, score, details, model, tokens_in, tokens_out, latency in (
+            self._conn.execute(
+                "SELECT scenario_id, grader_name, passed, score, details, judge_model, input_tokens, "
+                "output_tokens, latency_s FROM grader_results WHERE run_id = ?",
+                (run_id,),
+            )
+        ):
+            usage = None
+            if model is not None:
+                usage = JudgeUsage(model=model, input_tokens=tokens_in, output_tokens=tokens_out, latency_s=latency)
+            graders.setdefault(scenario_id, []).append(
+                GraderRecord(
+                    grader_name,
+                    bool(passed),
+                    score,
+                    details,
+                    tuple(criteria.get((scenario_id, grader_name), ())),
+                    usage,
+                )
+            )
+        return [
+            ScenarioRecord(
+                scenario_id=scenario_id,
+                scenario_name=name,
+                grader_results=tuple(graders.get(scenario_id, ())),
+                passed=bool(passed),
+                needs_manual_review=bool(needs_review),
+                review_reasons=tuple(json.loads(reasons)),
+                collection=collection,
+            )
+            for scenario_id, name, collection, passed, needs_review, reasons in self._conn.execute(
+                "SELECT scenario_id, scenario_name, collection, passed, needs_review, review_reasons "
+                "FROM scenario_results WHERE run_id = ? ORDER BY scenario_id",
+                (run_id,),
+            )
+        ]
+
+    def gate_values(self, run_id: int) -> dict[str, tuple[float, bool]]:
+        """Each gate's actual value and verdict in a run."""
+        rows = self._conn.execute("SELECT metric, actual, passed FROM gate_results WHERE run_id = ?", (run_id,))
+        return {metric: (actual, bool(passed)) for metric, actual, passed in rows}
+
+    def scenario_trend(self, scenario_id: str, *, grader: str | None = None, limit: int = 50) -> list[TrendPoint]:
+        """A scenario's grader scores over the ``limit`` most recent runs that graded it, oldest first."""
+        where = "scenario_id = ?"
+        params: tuple = (scenario_id,)
+        if grader is not None:
+            where += " AND grader_name = ?"
+            params += (grader,)
+        rows = self._conn.execute(
+            "WITH recent AS (SELECT DISTINCT run_id FROM grader_results "
+            f"WHERE {where} ORDER BY run_id DESC LIMIT ?), "
+            f"scores AS (SELECT * FROM grader_results WHERE {where}) "
+            "SELECT g.run_id, r.started_at, r.git_commit, g.grader_name, g.score, g.passed "
+            "FROM scores g JOIN recent USING (run_id) JOIN runs r ON r.run_id = g.run_id "
+            "ORDER BY g.run_id, g.grader_name",
+            (*params, limit, *params),
+        )
+        return [TrendPoint(*row[:5], passed=bool(row[5])) for row in rows]
+
+    def regressions(
+        self, base_run: int, run: int, *, limit: int = 10, epsilon: float = 1e-9
+    ) -> list[Regression]:
+        """The largest grader score drops from ``base_run`` to ``run``, worst first."""
+        rows = self._conn.execute(
+            "SELECT g.scenario_id, g.grader_name, b.score, g.score, b.passed, g.passed "
+            "FROM grader_results g JOIN grader_results b "
+            "ON b.run_id = ? AND b.scenario_id = g.scenario_id AND b.grader_name = g.grader_name "
+            "WHERE g.run_id = ? AND g.score < b.score - ? "
+            "ORDER BY g.score - b.score, g.scenario_id, g.grader_name LIMIT ?",
+            (base_run, run, epsilon, limit),
+        )
+        return [
+            Regression(scenario_id, grader_name, base_score, score, bool(base_passed), bool(passed))
+            for scenario_id, grader_name, base_score, score, base_passed, passed in rows
+        ]
+
+    def judge_totals(self, run_id: int) -> list[JudgeTotals]:
+        """LLM judge usage per model-based grader in a run."""
+        rows = self._conn.execute(
+            "SELECT grader_name, COUNT(*), SUM(input_tokens), SUM(output_tokens), SUM(latency_s) "
+            "FROM grader_results WHERE run_id = ? AND judge_model IS NOT NULL "
+            "GROUP BY grader_name ORDER BY grader_name",
+            (run_id,),
+        )
+        return [JudgeTotals(*row) for row in rows]
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="eval-runner history", description="Query the evaluation run history")
+    parser.add_argument(
+        "--db",
+        type=str,
+        default=DEFAULT_HISTORY_PATH,
+        help=f"Run history database (default: {DEFAULT_HISTORY_PATH})",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runs = commands.add_parser("runs", help="List recent runs")
+    runs.add_argument("--commit", type=str, default=None, help="Only runs at this commit (prefix)")
+    runs.add_argument("-n", "--limit", type=int, default=20, help="Number of runs (default: 20)")
+
+    trend = commands.add_parser("trend", help="A scenario's scores across runs")
+    trend.add_argument("scenario_id", type=str)
+    trend.add_argument("-g", "--grader", type=str, default=None, help="Only this grader")
+    trend.add_argument("-n", "--limit", type=int, default=50, help="Number of most recent runs (default: 50)")
+
+    regressions = commands.add_parser("regressions", help="Largest score drops between two runs")
+    regressions.add_argument("base", nargs="?", default="latest~1", help="Base run (default: latest~1)")
+    regressions.add_argument("run", nargs="?", default="latest", help="Compared run (default: latest)")
+    regressions.add_argument("-n", "--limit", type=int, default=10, help="Number of regressions (default: 10)")
+
+    judge = commands.add_parser("judge", help="LLM judge calls, tokens and time per grader in a run")
+    judge.add_argument("run", nargs="?", default="latest", help="Run (default: latest)")
+    args = parser.parse_args(argv)
+
+    if not Path(args.db).exists():
+        parser.error(f"no run history at {args.db}")
+    with RunHistory(args.db) as history:
+        try:
+            if args.command == "runs":
+                for run in history.runs(limit=args.limit, git_commit=args.commit):
+                    gates = "PASS" if run.gates_passed else "FAIL"
+                    print(
+                        f"{run.run_id:>6}  {run.started_at}  {run.git_commit[:10] or '-':<10}  "
+                        f"{run.passed}/{run.total} passed  gates {gates}  {run.label}".rstrip()
+                    )
+            elif args.command == "trend":
+                for point in history.scenario_trend(args.scenario_id, grader=args.grader, limit=args.limit):
+                    status = "PASS" if point.passed else "FAIL"
+                    print(
+                        f"{point.run_id:>6}  {point.started_at}  {point.git_commit[:10] or '-':<10}  "
+                        f"{point.grader_name}  {point.score:.4f}  {status}"
+                    )
+            elif args.command == "regressions":
+                base, run = history.resolve(args.base), history.resolve(args.run)
+                print(f"Run {run} vs run {base}")
+                for reg in history.regressions(base, run, limit=args.limit):
+                    flip = "  now failing" if reg.base_passed and not reg.passed else ""
+                    print(
+                        f"  {reg.scenario_id}  {reg.grader_name}  "
+                        f"{reg.base_score:.4f} -> {reg.score:.4f} ({reg.delta:+.4f}){flip}"
+                    )
+            else:
+                run = history.resolve(args.run)
+                for totals in history.judge_totals(run):
+                    print(
+                        f"{totals.grader_name}  {totals.calls} calls  {totals.input_tokens} in / "
+                        f"{totals.output_tokens} out tokens  {totals.latency_s:.2f}s"
+                    )
+        except ValueError as exc:
+            parser.error(str(exc))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
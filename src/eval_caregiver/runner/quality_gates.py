@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import math
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
+from statistics import NormalDist
 
-from eval_caregiver.schemas.grader_results import ScenarioResult
+import numpy as np
+
+from eval_caregiver.runner.bootstrap import bootstrap_interval, paired_test
+from eval_caregiver.runner.records import AnyScenarioResult
+from eval_caregiver.runner.score_matrix import ScoreMatrix
 
 
 @dataclass
@@ -23,6 +30,64 @@ class QualityGateResult:
     gate: QualityGate
     actual_value: float
     passed: bool
+    ci_low: float | None = None
+    ci_high: float | None = None
+    sample_size: int | None = None
+    conclusive: bool = True
+
+
+@dataclass
+class EarlyStop:
+    """Why and where a fail-fast run stopped before finishing every scenario."""
+
+    reason: str
+    lost_gates: list[str] = field(default_factory=list)
+    completed_scenarios: int = 0
+    skipped_scenario_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SampleInfo:
+    """How a sampled run drew its scenarios."""
+
+    confidence: float
+    rounds: int
+    sampled_scenarios: int
+    population_scenarios: int
+
+
+@dataclass
+class BootstrapInfo:
+    """How bootstrap gate intervals were computed."""
+
+    confidence: float
+    resamples: int
+    seed: int
+
+
+@dataclass
+class GateComparison:
+    """One gate's metric in this run against a baseline run, paired by scenario."""
+
+    gate: QualityGate
+    baseline_value: float
+    current_value: float
+    delta: float
+    ci_low: float
+    ci_high: float
+    p_value: float
+    pairs: int
+    significant: bool
+
+
+@dataclass
+class BaselineComparison:
+    """Paired significance tests of every gate against a baseline run."""
+
+    source: str
+    confidence: float
+    resamples: int
+    gates: list[GateComparison] = field(default_factory=list)
 
 
 @dataclass
@@ -30,6 +95,10 @@ class QualityGateReport:
     """Overall quality gate evaluation report."""
 
     gate_results: list[QualityGateResult] = field(default_factory=list)
+    early_stop: EarlyStop | None = None
+    sample: SampleInfo | None = None
+    bootstrap: BootstrapInfo | None = None
+    baseline: BaselineComparison | None = None
 
     @property
     def all_passed(self) -> bool:
@@ -68,27 +137,339 @@ class QualityGateEvaluator:
     def __init__(self, gates: list[QualityGate] | None = None) -> None:
         self._gates = gates if gates is not None else list(DEFAULT_GATES)
 
-    def evaluate(self, results: list[ScenarioResult]) -> QualityGateReport:
-        """Evaluate all quality gates against scenario results."""
+    def evaluate(
+        self,
+        results: Sequence[AnyScenarioResult] | ScoreMatrix,
+        *,
+        early_stop: EarlyStop | None = None,
+        bootstrap: int = 0,
+        confidence: float = 0.95,
+        seed: int = 0,
+    ) -> QualityGateReport:
+        """Evaluate all quality gates against scenario results (or their score matrix).
+
+        With ``bootstrap`` resamples, each gate also gets a percentile
+        bootstrap interval for its mean; the gate still passes on the point
+        estimate, and ``conclusive`` records whether the interval clears the
+        threshold on one side.
+        """
+        if bootstrap < 0:
+            raise ValueError(f"bootstrap must be >= 0, got {bootstrap}")
+        matrix = _as_matrix(results)
+        rng = np.random.default_rng(seed)
         gate_results = []
         for gate in self._gates:
             grader_name = _METRIC_TO_GRADER.get(gate.metric, gate.metric)
-            scores = self._collect_scores(results, grader_name)
-            avg_score = sum(scores) / len(scores) if scores else 1.0
+            avg_score = matrix.grader_mean(grader_name)
+            gate_result = QualityGateResult(
+                gate=gate,
+                actual_value=avg_score,
+                passed=avg_score >= gate.threshold,
+            )
+            if bootstrap:
+                scores = matrix.grader_scores(grader_name)
+                low, high = bootstrap_interval(scores, resamples=bootstrap, confidence=confidence, rng=rng)
+                gate_result.ci_low, gate_result.ci_high = low, high
+                gate_result.sample_size = len(scores)
+                gate_result.conclusive = low >= gate.threshold or high < gate.threshold
+            gate_results.append(gate_result)
+        return QualityGateReport(
+            gate_results=gate_results,
+            early_stop=early_stop,
+            bootstrap=BootstrapInfo(confidence=confidence, resamples=bootstrap, seed=seed) if bootstrap else None,
+        )
+
+    def compare(
+        self,
+        results: Sequence[AnyScenarioResult] | ScoreMatrix,
+        baseline: Sequence[AnyScenarioResult] | ScoreMatrix,
+        *,
+        source: str = "",
+        resamples: int = 10_000,
+        confidence: float = 0.95,
+        seed: int = 0,
+    ) -> BaselineComparison:
+        """Paired significance test of every gate metric against a ``baseline`` run.
+
+        Only scenarios graded in both runs are paired. A change is
+        significant when its p-value is below ``1 - confidence``.
+        """
+        if resamples < 1:
+            raise ValueError(f"resamples must be >= 1, got {resamples}")
+        matrix = _as_matrix(results)
+        baseline_matrix = _as_matrix(baseline)
+        rng = np.random.default_rng(seed)
+        comparison = BaselineComparison(source=source, confidence=confidence, resamples=resamples)
+        for gate in self._gates:
+            grader_name = _METRIC_TO_GRADER.get(gate.metric, gate.metric)
+            current, previous = matrix.paired_scores(baseline_matrix, grader_name)
+            test = paired_test(current, previous, resamples=resamples, confidence=confidence, rng=rng)
+            comparison.gates.append(
+                GateComparison(
+                    gate=gate,
+                    baseline_value=baseline_matrix.grader_mean(grader_name),
+                    current_value=matrix.grader_mean(grader_name),
+                    delta=test.delta,
+                    ci_low=test.ci_low,
+                    ci_high=test.ci_high,
+                    p_value=test.p_value,
+                    pairs=test.pairs,
+                    significant=test.p_value < 1 - confidence,
+                )
+            )
+        return comparison
+
+    def evaluate_sample(
+        self,
+        results: Sequence[AnyScenarioResult] | ScoreMatrix,
+        population: dict[str, int],
+        *,
+        confidence: float = 0.95,
+        weights: Sequence[float] | None = None,
+    ) -> QualityGateReport:
+        """Evaluate gates on a sample of scenarios using confidence intervals.
+
+        ``population`` maps grader names to how many scores a full run would
+        produce. ``weights`` gives each result's share of the population (one
+        per result, e.g. stratum size over stratum sample size) so a sample
+        that over-draws small strata still estimates the full-run mean; the
+        interval is centred on that weighted mean. A gate passes only if its
+        interval lies at or above the threshold and fails only if it lies
+        entirely below; otherwise the result is marked inconclusive (and
+        ``passed`` holds the point estimate).
+        """
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        matrix = _as_matrix(results)
+        row_weights = np.ones(len(matrix)) if weights is None else np.asarray(weights, dtype=float)
+        gate_results = []
+        for gate in self._gates:
+            grader_name = _METRIC_TO_GRADER.get(gate.metric, gate.metric)
+            scores = matrix.grader_scores(grader_name)
+            if scores.size:
+                avg_score = float(np.average(scores, weights=matrix.grader_rows(grader_name, row_weights)))
+            else:
+                avg_score = 1.0
+            low, high = wilson_interval(
+                avg_score if scores.size else 0.0, len(scores), population.get(grader_name, len(scores)), z
+            )
+            conclusive = low >= gate.threshold or high < gate.threshold
             gate_results.append(
                 QualityGateResult(
                     gate=gate,
                     actual_value=avg_score,
-                    passed=avg_score >= gate.threshold,
+                    passed=low >= gate.threshold if conclusive else avg_score >= gate.threshold,
+                    ci_low=low,
+                    ci_high=high,
+                    sample_size=len(scores),
+                    conclusive=conclusive,
                 )
             )
         return QualityGateReport(gate_results=gate_results)
 
-    def _collect_scores(self, results: list[ScenarioResult], grader_name: str) -> list[float]:
-        """Collect all scores for a specific grader across required scenarios."""
-        scores = []
-        for result in results:
-            for gr in result.grader_results:
-                if gr.grader_name == grader_name:
-                    scores.append(gr.score)
-        return scores
+
+def _as_matrix(results: Sequence[AnyScenarioResult] | ScoreMatrix) -> ScoreMatrix:
+    return results if isinstance(results, ScoreMatrix) else ScoreMatrix.from_results(results)
+
+
+def mean_confidence_interval(scores: Sequence[float], population: int, z: float) -> tuple[float, float]:
+    """Wilson score interval for the mean of ``scores`` in [0, 1].
+
+    A [0, 1] score never has more variance than a pass/fail outcome with the
+    same mean, so the Wilson interval is conservative for partial-credit
+    scores too and stays sensible when every sampled score is identical.
+    Scores are drawn without replacement from ``population`` values; the
+    finite-population correction inflates the effective sample size, so a
+    complete sample yields a zero-width interval.
+    """
+    n = len(scores)
+    return wilson_interval(float(np.mean(scores)) if n else 0.0, n, population, z)
+
+
+def wilson_interval(mean: float, n: int, population: int | None, z: float) -> tuple[float, float]:
+    """:func:`mean_confidence_interval` from a mean and count; ``population=None`` means unbounded."""
+    if n == 0:
+        return (1.0, 1.0) if population == 0 else (0.0, 1.0)
+    if population is not None and n >= population:
+        return mean, mean
+    fpc = (population - n) / (population - 1) if population is not None else 1.0
+    n_eff = n / fpc
+    z2 = z * z
+    denominator = 1 + z2 / n_eff
+    center = (mean + z2 / (2 * n_eff)) / denominator
+    half_width = z / denominator * math.sqrt(mean * (1 - mean) / n_eff + z2 / (4 * n_eff * n_eff))
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+@dataclass
+class RunningStats:
+    """Count, mean and variance of a stream of scores (Welford's algorithm)."""
+
+    count: int = 0
+    total: float = 0.0
+    _mean: float = 0.0
+    _m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+    @property
+    def mean(self) -> float:
+        # From the plain sum, so a finished run matches QualityGateEvaluator exactly.
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance; 0.0 until there are two scores."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+class GateAccumulator:
+    """Folds results into per-grader running statistics as they arrive.
+
+    Pass it to ``EvalExecutor.run_scenarios`` as ``tracker``; after the run,
+    :meth:`report` gives the same gate values as ``QualityGateEvaluator.evaluate``
+    without another pass over the results. ``listener`` is called after every
+    observed result, e.g. to redraw a live status line.
+
+    When the run's plan is known (``start`` with the graders each scenario will
+    run), projections also account for the scores still to come.
+    """
+
+    def __init__(
+        self,
+        gates: list[QualityGate] | None = None,
+        *,
+        confidence: float = 0.95,
+        listener: Callable[[GateAccumulator], None] | None = None,
+    ) -> None:
+        self._gates = gates if gates is not None else list(DEFAULT_GATES)
+        self._z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self._listener = listener
+        self._planned_run = False
+        self._planned: dict[str, list[str]] = {}
+        self._remaining: dict[str, int] = {}
+        self.stats: dict[str, RunningStats] = {}
+        self.completed = 0
+        self.early_stop: EarlyStop | None = None
+
+    @property
+    def gates(self) -> list[QualityGate]:
+        return list(self._gates)
+
+    def start(self, planned: dict[str, list[str]] | None = None) -> None:
+        """Reset for a run; ``planned`` maps scenario IDs to the graders that will run."""
+        self._planned_run = planned is not None
+        self._planned = dict(planned or {})
+        self._remaining = {}
+        for grader_names in self._planned.values():
+            for grader_name in grader_names:
+                self._remaining[grader_name] = self._remaining.get(grader_name, 0) + 1
+        self.stats = {}
+        self.completed = 0
+        self.early_stop = None
+
+    def observe(self, result: AnyScenarioResult) -> None:
+        """Fold a finished scenario into the running gate metrics."""
+        for grader_name in self._planned.pop(result.scenario_id, []):
+            self._remaining[grader_name] -= 1
+        for gr in result.grader_results:
+            stats = self.stats.get(gr.grader_name)
+            if stats is None:
+                stats = self.stats[gr.grader_name] = RunningStats()
+            stats.add(gr.score)
+        self.completed += 1
+        if self._listener is not None:
+            self._listener(self)
+
+    def should_stop(self) -> bool:
+        """Whether the run should end now; plain accumulators never stop it."""
+        return False
+
+    def gate_stats(self, gate: QualityGate) -> RunningStats:
+        return self.stats.get(_METRIC_TO_GRADER.get(gate.metric, gate.metric), RunningStats())
+
+    def current(self, gate: QualityGate) -> float:
+        """The gate metric so far (1.0 before its grader has produced a score)."""
+        stats = self.gate_stats(gate)
+        return stats.mean if stats.count else 1.0
+
+    def best_case(self, gate: QualityGate) -> float:
+        """Highest average the gate metric can still reach (1.0 while the plan is unknown)."""
+        if not self._planned_run:
+            return 1.0
+        grader_name = _METRIC_TO_GRADER.get(gate.metric, gate.metric)
+        stats = self.stats.get(grader_name, RunningStats())
+        remaining = self._remaining.get(grader_name, 0)
+        count = stats.count + remaining
+        if count == 0:
+            return 1.0
+        return (stats.total + remaining) / count
+
+    def projection(self, gate: QualityGate) -> str:
+        """``"pass"``, ``"fail"`` or ``"uncertain"`` from the interval around the current value.
+
+        ``"lost"`` when the planned remaining scores can no longer lift the
+        gate over its threshold; ``"pending"`` before any score has arrived.
+        """
+        if self.best_case(gate) < gate.threshold:
+            return "lost"
+        stats = self.gate_stats(gate)
+        if stats.count == 0:
+            return "pending"
+        population = None
+        if self._planned_run:
+            population = stats.count + self._remaining.get(_METRIC_TO_GRADER.get(gate.metric, gate.metric), 0)
+        low, high = wilson_interval(stats.mean, stats.count, population, self._z)
+        if low >= gate.threshold:
+            return "pass"
+        if high < gate.threshold:
+            return "fail"
+        return "uncertain"
+
+    def status_line(self) -> str:
+        """One line with every gate's current value and projected outcome."""
+        parts = [f"{self.completed} done"]
+        for gate in self._gates:
+            stats = self.gate_stats(gate)
+            parts.append(
+                f"{gate.metric} {self.current(gate):.3f} "
+                f"(n={stats.count}, sd={math.sqrt(stats.variance):.3f}) {self.projection(gate)}"
+            )
+        return " | ".join(parts)
+
+    def report(self, *, early_stop: EarlyStop | None = None) -> QualityGateReport:
+        """Final gate results from the accumulated statistics."""
+        gate_results = [
+            QualityGateResult(gate=gate, actual_value=self.current(gate), passed=self.current(gate) >= gate.threshold)
+            for gate in self._gates
+        ]
+        return QualityGateReport(gate_results=gate_results, early_stop=early_stop or self.early_stop)
+
+
+class FailFastTracker(GateAccumulator):
+    """Tracks gate metrics online and stops the run once a gate can no longer pass.
+
+    A gate is lost once its best achievable average -- every remaining
+    planned score being a perfect 1.0 -- falls below the threshold.
+    """
+
+    def lost_gates(self) -> list[QualityGate]:
+        """Gates whose threshold is no longer reachable."""
+        return [g for g in self._gates if self.best_case(g) < g.threshold]
+
+    def should_stop(self) -> bool:
+        """Record an ``EarlyStop`` and return True once any gate is lost."""
+        lost = self.lost_gates()
+        if not lost:
+            return False
+        self.early_stop = EarlyStop(
+            reason=f"Quality gate(s) can no longer pass: {[g.metric for g in lost]}",
+            lost_gates=[g.metric for g in lost],
+            completed_scenarios=self.completed,
+            skipped_scenario_ids=list(self._planned),
+        )
+        return True
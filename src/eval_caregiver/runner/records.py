@@ -0,0 +1,98 @@
+"""Compact result records used on the executor's hot path.
+
+The executor keeps one ``ScenarioRecord`` per scenario instead of a pydantic
+``ScenarioResult``: a slots dataclass with no validation, tuples instead of
+lists, and ``overall_score`` computed once when the record is built. Records
+expose the same attributes as the pydantic models, so gates, reports and the
+scorecard read either; convert with :meth:`ScenarioRecord.to_result` where the
+public models are needed (e.g. for ``model_dump``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from eval_caregiver.schemas.grader_results import GraderResult, JudgeUsage, RubricCriterionScore, ScenarioResult
+
+
+@dataclass(slots=True, frozen=True)
+class GraderRecord:
+    """One grader's verdict; mirrors ``GraderResult``."""
+
+    grader_name: str
+    passed: bool
+    score: float
+    details: str = ""
+    criterion_scores: tuple[RubricCriterionScore, ...] = ()
+    judge_usage: JudgeUsage | None = None
+
+    @classmethod
+    def from_result(cls, result: GraderResult) -> GraderRecord:
+        return cls(
+            result.grader_name,
+            result.passed,
+            result.score,
+            result.details,
+            tuple(result.criterion_scores),
+            result.judge_usage,
+        )
+
+    def to_result(self) -> GraderResult:
+        return GraderResult.model_construct(
+            grader_name=self.grader_name,
+            passed=self.passed,
+            score=self.score,
+            details=self.details,
+            criterion_scores=list(self.criterion_scores),
+            judge_usage=self.judge_usage,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ScenarioRecord:
+    """One scenario's graded outcome; mirrors ``ScenarioResult``.
+
+    Also carries the scenario's collection and ``required`` flag for
+    per-collection breakdowns; these are dropped by :meth:`to_result`.
+    """
+
+    scenario_id: str
+    scenario_name: str
+    grader_results: tuple[GraderRecord, ...] = ()
+    passed: bool = False
+    needs_manual_review: bool = False
+    review_reasons: tuple[str, ...] = ()
+    collection: str = ""
+    required: bool = True
+    overall_score: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        results = self.grader_results
+        score = sum(r.score for r in results) / len(results) if results else 0.0
+        object.__setattr__(self, "overall_score", score)
+
+    @classmethod
+    def from_result(cls, result: ScenarioResult) -> ScenarioRecord:
+        return cls(
+            result.scenario_id,
+            result.scenario_name,
+            tuple(GraderRecord.from_result(gr) for gr in result.grader_results),
+            result.passed,
+            result.needs_manual_review,
+            tuple(result.review_reasons),
+        )
+
+    def to_result(self) -> ScenarioResult:
+        """The public pydantic model, built without re-validating the fields."""
+        return ScenarioResult.model_construct(
+            scenario_id=self.scenario_id,
+            scenario_name=self.scenario_name,
+            grader_results=[gr.to_result() for gr in self.grader_results],
+            passed=self.passed,
+            needs_manual_review=self.needs_manual_review,
+            review_reasons=list(self.review_reasons),
+        )
+
+
+# What gates, reports and the scorecard accept: both forms expose the same fields.
+AnyScenarioResult = ScenarioRecord | ScenarioResult
@@ -0,0 +1,85 @@
+"""Stratified, escalating scenario sampling for quick gate checks."""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import defaultdict
+
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.runner.quality_gates import QualityGateEvaluator, QualityGateReport, SampleInfo
+from eval_caregiver.runner.records import ScenarioRecord
+from eval_caregiver.schemas.scenarios import TestScenario
+
+
+def stratify(
+    scenarios: list[TestScenario], executor: EvalExecutor
+) -> dict[tuple[str, tuple[str, ...]], list[TestScenario]]:
+    """Group scenarios by collection and the set of graders that will run on them."""
+    strata: dict[tuple[str, tuple[str, ...]], list[TestScenario]] = defaultdict(list)
+    for scenario in scenarios:
+        key = (scenario.collection, tuple(sorted(executor.active_grader_names(scenario))))
+        strata[key].append(scenario)
+    return dict(strata)
+
+
+def run_sampled(
+    executor: EvalExecutor,
+    scenarios: list[TestScenario],
+    *,
+    fraction: float,
+    evaluator: QualityGateEvaluator | None = None,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> tuple[list[ScenarioRecord], QualityGateReport]:
+    """Run a stratified sample of ``scenarios`` and decide gates from confidence intervals.
+
+    Every stratum contributes at least one scenario, so small strata are
+    over-represented; each result is weighted by its stratum's size over the
+    number drawn from it, so gate estimates target the full-run mean. While
+    any gate's interval still straddles its threshold, the per-stratum sample
+    size doubles and only the newly drawn scenarios are run; in the worst case
+    the whole suite runs and the intervals collapse to the exact values.
+    """
+    if not 0 < fraction <= 1:
+        raise ValueError(f"Sample fraction must be in (0, 1], got {fraction}")
+    evaluator = evaluator or QualityGateEvaluator()
+    rng = random.Random(seed)
+
+    strata = stratify(scenarios, executor)
+    shuffled = {key: rng.sample(members, len(members)) for key, members in strata.items()}
+    population: dict[str, int] = defaultdict(int)
+    for scenario in scenarios:
+        for grader_name in executor.active_grader_names(scenario):
+            population[grader_name] += 1
+
+    taken = {key: 0 for key in shuffled}
+    results: list[ScenarioRecord] = []
+    result_strata: list[tuple[str, tuple[str, ...]]] = []
+    rounds = 0
+    while True:
+        rounds += 1
+        batch = []
+        for key, members in shuffled.items():
+            target = max(1, math.ceil(len(members) * fraction * 2 ** (rounds - 1)))
+            drawn = members[taken[key]:target]
+            batch.extend(drawn)
+            result_strata.extend([key] * len(drawn))
+            taken[key] = min(target, len(members))
+        results.extend(executor.run_scenarios(batch))
+
+        weights = [len(shuffled[key]) / taken[key] for key in result_strata]
+        gate_report = evaluator.evaluate_sample(
+            results, dict(population), confidence=confidence, weights=weights
+        )
+        complete = all(taken[key] == len(members) for key, members in shuffled.items())
+        if complete or all(gr.conclusive for gr in gate_report.gate_results):
+            break
+
+    gate_report.sample = SampleInfo(
+        confidence=confidence,
+        rounds=rounds,
+        sampled_scenarios=len(results),
+        population_scenarios=len(scenarios),
+    )
+    return results, gate_report
@@ -0,0 +1,62 @@
+"""Duration history and longest-expected-first scenario ordering."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from eval_caregiver.schemas.ingest import read_json
+
+# Relative cost units for scenarios without history; EvalExecutor.schedule rescales
+# them to seconds using the scenarios that have recorded durations.
+_BASE_COST = 1.0
+_CODE_GRADER_COST = 0.1
+_MODEL_GRADER_COST = 10.0
+
+
+class DurationHistory:
+    """Per-scenario wall-clock durations, smoothed across runs and persisted as JSON."""
+
+    def __init__(self, path: str | Path | None = None, *, smoothing: float = 0.5) -> None:
+        self._path = Path(path) if path is not None else None
+        self._smoothing = smoothing
+        self._lock = threading.Lock()
+        self._durations: dict[str, float] = {}
+        if self._path is not None and self._path.exists():
+            self._durations = read_json(dict[str, float], self._path)
+
+    def get(self, scenario_id: str) -> float | None:
+        """Expected duration in seconds, or ``None`` if the scenario has never run."""
+        return self._durations.get(scenario_id)
+
+    def as_dict(self) -> dict[str, float]:
+        """A copy of every recorded duration."""
+        with self._lock:
+            return dict(self._durations)
+
+    def record(self, scenario_id: str, seconds: float) -> None:
+        """Fold a new observation into the scenario's moving average."""
+        with self._lock:
+            previous = self._durations.get(scenario_id)
+            if previous is None:
+                self._durations[scenario_id] = seconds
+            else:
+                self._durations[scenario_id] = (
+                    self._smoothing * seconds + (1 - self._smoothing) * previous
+                )
+
+    def save(self) -> Path | None:
+        """Write the history back to its file, if it has one."""
+        if self._path is None:
+            return None
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._path.write_text(json.dumps(self._durations, indent=2, sort_keys=True))
+        return self._path
+
+
+def heuristic_cost(grader_count: int, model_grader_count: int) -> float:
+    """Estimated cost of a scenario that has no recorded history."""
+    code_grader_count = grader_count - model_grader_count
+    return _BASE_COST + code_grader_count * _CODE_GRADER_COST + model_grader_count * _MODEL_GRADER_COST
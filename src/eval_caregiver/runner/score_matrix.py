@@ -0,0 +1,179 @@
+"""Columnar scenario × grader score matrix for gates, totals and breakdowns.
+
+Results are gathered into NumPy arrays in a single pass; every aggregate the
+gates, the JSON report and the scorecard need is then a vectorized reduction
+over those arrays rather than another walk over the result objects.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from eval_caregiver.runner.records import AnyScenarioResult
+
+
+class ScoreMatrix:
+    """Scores and pass flags of every grader run, one row per scenario.
+
+    ``scores[i, j]`` is grader ``j``'s score on scenario ``i``, or NaN if that
+    grader did not run there; ``passed`` holds the matching pass flags (False
+    where the grader did not run). Per-scenario columns hold the scenario's
+    own verdict, review flag, overall score, collection and ``required`` flag.
+    Results without a collection (e.g. pydantic ``ScenarioResult``) are
+    grouped under ``""`` and treated as required.
+    """
+
+    def __init__(
+        self,
+        scenario_ids: list[str],
+        grader_names: list[str],
+        scores: np.ndarray,
+        passed: np.ndarray,
+        scenario_passed: np.ndarray,
+        needs_review: np.ndarray,
+        overall: np.ndarray,
+        collections: np.ndarray,
+        required: np.ndarray,
+    ) -> None:
+        self.scenario_ids = scenario_ids
+        self.grader_names = grader_names
+        self._columns = {name: j for j, name in enumerate(grader_names)}
+        self.scores = scores
+        self.passed = passed
+        self.ran = ~np.isnan(scores)
+        self.scenario_passed = scenario_passed
+        self.needs_review = needs_review
+        self.overall = overall
+        self.collection_names, self.collection_codes = np.unique(collections, return_inverse=True)
+        self.required = required
+
+    @classmethod
+    def from_results(cls, results: Sequence[AnyScenarioResult]) -> ScoreMatrix:
+        """Gather ``results`` in one pass."""
+        n = len(results)
+        scenario_ids: list[str] = []
+        columns: dict[str, int] = {}
+        rows: list[int] = []
+        cols: list[int] = []
+        values: list[float] = []
+        flags: list[bool] = []
+        scenario_passed = np.zeros(n, dtype=bool)
+        needs_review = np.zeros(n, dtype=bool)
+        overall = np.zeros(n)
+        collections = np.empty(n, dtype=object)
+        required = np.ones(n, dtype=bool)
+        for i, result in enumerate(results):
+            scenario_ids.append(result.scenario_id)
+            scenario_passed[i] = result.passed
+            needs_review[i] = result.needs_manual_review
+            overall[i] = result.overall_score
+            collections[i] = getattr(result, "collection", "")
+            required[i] = getattr(result, "required", True)
+            for gr in result.grader_results:
+                rows.append(i)
+                cols.append(columns.setdefault(gr.grader_name, len(columns)))
+                values.append(gr.score)
+                flags.append(gr.passed)
+
+        scores = np.full((n, len(columns)), np.nan)
+        passed = np.zeros((n, len(columns)), dtype=bool)
+        scores[rows, cols] = values
+        passed[rows, cols] = flags
+        return cls(
+            scenario_ids,
+            list(columns),
+            scores,
+            passed,
+            scenario_passed,
+            needs_review,
+            overall,
+            collections.astype(str),
+            required,
+        )
+
+    def __len__(self) -> int:
+        return len(self.scenario_ids)
+
+    def grader_scores(self, grader_name: str) -> np.ndarray:
+        """Every score the grader produced, in scenario order."""
+        j = self._columns.get(grader_name)
+        if j is None:
+            return np.empty(0)
+        return self.scores[self.ran[:, j], j]
+
+    def grader_rows(self, grader_name: str, values: np.ndarray) -> np.ndarray:
+        """The entries of a per-scenario array lined up with :meth:`grader_scores`."""
+        j = self._columns.get(grader_name)
+        if j is None:
+            return np.empty(0)
+        return values[self.ran[:, j]]
+
+    def grader_mean(self, grader_name: str, *, default: float = 1.0) -> float:
+        """Mean score of one grader; ``default`` when it never ran."""
+        scores = self.grader_scores(grader_name)
+        return float(scores.mean()) if scores.size else default
+
+    def paired_scores(self, other: ScoreMatrix, grader_name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Scores of one grader on the scenarios it ran in both matrices, aligned by scenario ID."""
+        j = self._columns.get(grader_name)
+        k = other._columns.get(grader_name)
+        if j is None or k is None:
+            return np.empty(0), np.empty(0)
+        ours = self.ran[:, j]
+        theirs = other.ran[:, k]
+        _, i, o = np.intersect1d(
+            np.asarray(self.scenario_ids)[ours],
+            np.asarray(other.scenario_ids)[theirs],
+            return_indices=True,
+        )
+        return self.scores[ours, j][i], other.scores[theirs, k][o]
+
+    def totals(self) -> dict[str, int]:
+        """Scenario counts for the summary lines."""
+        total = len(self)
+        passed = int(self.scenario_passed.sum())
+        return {
+            "total": total,
+            "passed": passed,
+            "failed": total - passed,
+            "needs_review": int(self.needs_review.sum()),
+        }
+
+    def by_collection(self) -> dict[str, dict[str, float]]:
+        """Scenario count, passes, required scenarios and mean overall score per collection.
+
+        The mean only covers scenarios where at least one grader ran.
+        """
+        k = len(self.collection_names)
+        codes = self.collection_codes
+        graded = self.ran.any(axis=1)
+        counts = np.bincount(codes, minlength=k)
+        passes = np.bincount(codes, weights=self.scenario_passed, minlength=k)
+        required = np.bincount(codes, weights=self.required, minlength=k)
+        graded_counts = np.bincount(codes, weights=graded, minlength=k)
+        score_sums = np.bincount(codes, weights=np.where(graded, self.overall, 0.0), minlength=k)
+        return {
+            str(name): {
+                "scenarios": int(counts[c]),
+                "passed": int(passes[c]),
+                "required": int(required[c]),
+                "mean_score": float(score_sums[c] / graded_counts[c]) if graded_counts[c] else 0.0,
+            }
+            for c, name in enumerate(self.collection_names)
+        }
+
+    def by_grader(self) -> dict[str, dict[str, float]]:
+        """Runs, passes and mean score per grader."""
+        runs = self.ran.sum(axis=0)
+        passes = self.passed.sum(axis=0)
+        sums = np.where(self.ran, self.scores, 0.0).sum(axis=0)
+        return {
+            name: {
+                "runs": int(runs[j]),
+                "passed": int(passes[j]),
+                "mean_score": float(sums[j] / runs[j]) if runs[j] else 0.0,
+            }
+            for j, name in enumerate(self.grader_names)
+        }
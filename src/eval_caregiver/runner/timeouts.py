@@ -0,0 +1,80 @@
+"""Deadlines for agent calls, grader calls, scenarios and whole runs."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class CallTimeoutError(TimeoutError):
+    """Raised when a call does not finish before its deadline."""
+
+
+@dataclass
+class TimeoutConfig:
+    """Time limits in seconds; ``None`` means unbounded."""
+
+    scenario: float | None = None
+    agent: float | None = None
+    grader: float | None = None
+    run_budget: float | None = None
+
+
+class Deadline:
+    """A point in time after which work should be abandoned."""
+
+    def __init__(self, seconds: float | None) -> None:
+        self._expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self) -> float | None:
+        """Seconds left, or ``None`` for an unbounded deadline."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0.0
+
+
+def effective_timeout(limit: float | None, *deadlines: Deadline) -> float | None:
+    """Tightest of a per-call limit and the time left on enclosing deadlines."""
+    candidates = [limit] + [d.remaining() for d in deadlines]
+    bounded = [c for c in candidates if c is not None]
+    return min(bounded) if bounded else None
+
+
+def call_with_timeout(fn: Callable[..., T], timeout: float | None, /, *args: Any, **kwargs: Any) -> T:
+    """Call ``fn`` and give up waiting after ``timeout`` seconds.
+
+    Bounded calls run on a daemon thread so a hung call never blocks the caller
+    (or the worker slot it occupies); the abandoned thread finishes or dies with
+    the process. Callees that can abort themselves should also be told about the
+    deadline, e.g. through a ``timeout`` argument.
+    """
+    if timeout is None:
+        return fn(*args, **kwargs)
+    if timeout <= 0:
+        raise CallTimeoutError("deadline already passed")
+
+    outcome: dict[str, Any] = {}
+
+    def target() -> None:
+        try:
+            outcome["value"] = fn(*args, **kwargs)
+        except BaseException as exc:  # re-raised in the caller's thread
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise CallTimeoutError(f"call did not finish within {timeout:.2f}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
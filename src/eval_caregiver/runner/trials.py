@@ -0,0 +1,91 @@
+"""Repeated-trial aggregation for nondeterministic agents."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from math import comb
+from statistics import fmean, variance
+
+from eval_caregiver.runner.records import AnyScenarioResult, GraderRecord, ScenarioRecord
+
+
+def pass_at_k(n: int, c: int, k: int) -> float:
+    """Unbiased estimate of P(at least one of k trials passes) from c passes in n trials."""
+    if n == 0:
+        return 0.0
+    if n - c < k:
+        return 1.0
+    return 1.0 - comb(n - c, k) / comb(n, k)
+
+
+@dataclass
+class TrialSummary:
+    """All trials of one scenario and their aggregate statistics."""
+
+    scenario_id: str
+    scenario_name: str
+    trials: list[AnyScenarioResult] = field(default_factory=list)
+
+    @property
+    def passes(self) -> int:
+        return sum(1 for t in self.trials if t.passed)
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passes / len(self.trials) if self.trials else 0.0
+
+    def pass_at_k(self, k: int | None = None) -> float:
+        """pass@k over the recorded trials; ``k`` defaults to the number of trials."""
+        n = len(self.trials)
+        return pass_at_k(n, self.passes, n if k is None else k)
+
+    @property
+    def score_mean(self) -> float:
+        return fmean(t.overall_score for t in self.trials) if self.trials else 0.0
+
+    @property
+    def score_variance(self) -> float:
+        if len(self.trials) < 2:
+            return 0.0
+        return variance(t.overall_score for t in self.trials)
+
+    def aggregate(self) -> ScenarioRecord:
+        """Collapse the trials into one result for gates and reports.
+
+        Each grader's score is its mean across trials and it passes only if it
+        passed in every trial; the scenario is flagged for review when any
+        trial was, or when trials disagree.
+        """
+        by_grader: dict[str, list[GraderRecord]] = {}
+        for trial in self.trials:
+            for gr in trial.grader_results:
+                by_grader.setdefault(gr.grader_name, []).append(gr)
+
+        grader_results = tuple(
+            GraderRecord(
+                grader_name=grader_name,
+                passed=all(gr.passed for gr in runs),
+                score=fmean(gr.score for gr in runs),
+                details=f"Mean of {len(runs)} trial(s); passed in {sum(gr.passed for gr in runs)}",
+            )
+            for grader_name, runs in by_grader.items()
+        )
+
+        review_reasons: list[str] = []
+        if 0 < self.passes < len(self.trials):
+            review_reasons.append(f"Inconsistent across trials: {self.passes}/{len(self.trials)} passed")
+        for trial in self.trials:
+            for reason in trial.review_reasons:
+                if reason not in review_reasons:
+                    review_reasons.append(reason)
+
+        return ScenarioRecord(
+            scenario_id=self.scenario_id,
+            scenario_name=self.scenario_name,
+            grader_results=grader_results,
+            passed=self.passes == len(self.trials),
+            needs_manual_review=bool(review_reasons),
+            review_reasons=tuple(review_reasons),
+            collection=getattr(self.trials[0], "collection", "") if self.trials else "",
+            required=getattr(self.trials[0], "required", True) if self.trials else True,
+        )
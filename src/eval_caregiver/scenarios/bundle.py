@@ -0,0 +1,184 @@
+"""Pre-validated snapshot of all scenario and response data for fast cold starts.
+
+The bundle is a pickle of already-validated ``ScenarioCollection`` objects,
+keyed by file stem like the loader's manifest, plus each recorded response as
+its own pickled ``AgentOutput``. Loading it is one file read and no JSON parsing
+or pydantic validation; responses stay as bytes until looked up through an
+LRU-bounded :class:`BundleResponseStore`. It records each source file's mtime, size and SHA-256;
+a stat mismatch triggers a re-hash, and the bundle is rebuilt only when a
+source's content actually changed or files were added or removed.
+
+The pickle is only ever read from a cache path this module wrote, which is
+why it can be trusted without re-validation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from eval_caregiver.agent.base import AgentOutput
+from eval_caregiver.agent.response_store import DEFAULT_MAX_CACHED, BaseResponseStore, response_from_json
+from eval_caregiver.schemas.ingest import validate_json
+from eval_caregiver.schemas.scenarios import ScenarioCollection
+
+BUNDLE_FORMAT_VERSION = 2
+
+_SOURCE_GLOBS = ("scenarios/*.json", "responses/*.json")
+
+
+@dataclass
+class SourceStamp:
+    """Identity of one source file when the bundle was built."""
+
+    mtime_ns: int
+    size: int
+    sha256: str
+
+
+@dataclass
+class Bundle:
+    """Validated scenario collections and recorded responses from one data directory."""
+
+    data_dir: str
+    sources: dict[str, SourceStamp] = field(default_factory=dict)
+    collections: dict[str, ScenarioCollection] = field(default_factory=dict)
+    response_pickles: dict[str, bytes] = field(default_factory=dict)
+    format_version: int = BUNDLE_FORMAT_VERSION
+
+    def response_store(self, *, max_cached: int = DEFAULT_MAX_CACHED) -> BundleResponseStore:
+        """The recorded responses as a lazily unpickled, LRU-bounded mapping."""
+        return BundleResponseStore(self.response_pickles, max_cached=max_cached)
+
+
+class BundleResponseStore(BaseResponseStore):
+    """Responses from a bundle; each is unpickled on first lookup."""
+
+    def __init__(self, pickles: dict[str, bytes], *, max_cached: int = DEFAULT_MAX_CACHED) -> None:
+        super().__init__(max_cached=max_cached)
+        self._pickles = pickles
+
+    def _load(self, scenario_id: str) -> AgentOutput:
+        return pickle.loads(self._pickles[scenario_id])
+
+    def __contains__(self, scenario_id: object) -> bool:
+        return scenario_id in self._pickles
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._pickles)
+
+    def __len__(self) -> int:
+        return len(self._pickles)
+
+
+def default_cache_path(data_dir: Path) -> Path:
+    """Per-data-directory bundle location under ``$EVAL_CAREGIVER_CACHE_DIR`` or the user cache."""
+    cache_root = os.environ.get("EVAL_CAREGIVER_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache", "eval_caregiver"
+    )
+    key = hashlib.sha256(str(data_dir.resolve()).encode()).hexdigest()[:16]
+    return Path(cache_root) / f"bundle-{key}.pickle"
+
+
+def _source_paths(data_dir: Path) -> dict[str, Path]:
+    paths: dict[str, Path] = {}
+    for pattern in _SOURCE_GLOBS:
+        for path in sorted(data_dir.glob(pattern)):
+            paths[path.relative_to(data_dir).as_posix()] = path
+    return paths
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _stamp(path: Path, data: bytes | None = None) -> SourceStamp:
+    stat = path.stat()
+    digest = hashlib.sha256(data).hexdigest() if data is not None else _sha256(path)
+    return SourceStamp(mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha256=digest)
+
+
+def _build_bundle(data_dir: Path, paths: dict[str, Path]) -> Bundle:
+    """Parse and validate every source file."""
+    bundle = Bundle(data_dir=str(data_dir.resolve()))
+    for rel, path in paths.items():
+        # Read once: the same bytes are hashed and validated.
+        data = path.read_bytes()
+        bundle.sources[rel] = _stamp(path, data)
+        if rel.startswith("scenarios/"):
+            # Keyed by stem like the loader; ScenarioRegistry.from_collections checks it matches the ID.
+            bundle.collections[path.stem] = validate_json(ScenarioCollection, data)
+        else:
+            bundle.response_pickles[path.stem] = pickle.dumps(
+                response_from_json(data), protocol=pickle.HIGHEST_PROTOCOL
+            )
+    return bundle
+
+
+def _read_cached(cache_path: Path, data_dir: Path) -> Bundle | None:
+    try:
+        with cache_path.open("rb") as f:
+            bundle = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(bundle, Bundle) or bundle.format_version != BUNDLE_FORMAT_VERSION:
+        return None
+    if bundle.data_dir != str(data_dir.resolve()):
+        return None
+    return bundle
+
+
+def _write(bundle: Bundle, cache_path: Path) -> None:
+    """Atomically replace the cached bundle; an unwritable cache is not an error."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+
+
+def _is_current(bundle: Bundle, paths: dict[str, Path]) -> tuple[bool, bool]:
+    """Return ``(content unchanged, stamps need refreshing)`` for a cached bundle."""
+    if set(bundle.sources) != set(paths):
+        return False, False
+    restamped = False
+    for rel, path in paths.items():
+        cached = bundle.sources[rel]
+        stat = path.stat()
+        if stat.st_mtime_ns == cached.mtime_ns and stat.st_size == cached.size:
+            continue
+        stamp = _stamp(path)
+        if stamp.sha256 != cached.sha256:
+            return False, False
+        bundle.sources[rel] = stamp
+        restamped = True
+    return True, restamped
+
+
+def load_bundle(data_dir: Path, cache_path: Path | None = None) -> Bundle:
+    """Return the bundle for ``data_dir``, rebuilding the cache if any source changed."""
+    cache_path = cache_path or default_cache_path(data_dir)
+    paths = _source_paths(data_dir)
+
+    bundle = _read_cached(cache_path, data_dir)
+    if bundle is not None:
+        current, restamped = _is_current(bundle, paths)
+        if current:
+            if restamped:
+                _write(bundle, cache_path)
+            return bundle
+
+    bundle = _build_bundle(data_dir, paths)
+    _write(bundle, cache_path)
+    return bundle
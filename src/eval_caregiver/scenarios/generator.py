@@ -0,0 +1,335 @@
+"""Parametric scenario generator for scale and load testing.
+
+Expands a few templates (compliance gaps, geographic over-restriction,
+eligibility constraints) into any number of ``TestScenario`` variants, each
+paired with a synthetic agent response consistent with its expected gaps and
+concerns. Case ``i`` depends only on ``(seed, i)``, so a corpus can be streamed,
+regenerated, or partially rebuilt (e.g. by :class:`GeneratedAgent`) without
+holding it in memory.
+
+Run ``python -m eval_caregiver.scenarios.generator --count 100000 -o gen.jsonl.gz``
+to write a corpus for ``eval-runner --scenarios-file``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from eval_caregiver.agent.base import AgentOutput
+from eval_caregiver.agent.response_store import response_to_dict
+from eval_caregiver.schemas.caregiver import (
+    CaregiverProfile,
+    ComplianceRecord,
+    GeoPreferences,
+    StructuredIntakeRecord,
+)
+from eval_caregiver.schemas.conversation import AgentActionLog, ConversationTranscript, ConversationTurn
+from eval_caregiver.schemas.scenarios import TestScenario
+from eval_caregiver.scenarios.streaming import write_jsonl
+
+COMPLIANCE_ITEMS = ["Background Check", "CPR Certification", "First Aid", "TB Test"]
+COMPLIANCE_STATUSES = ["valid", "valid", "missing", "expired", "unknown"]
+# ``caregiver_setup`` field prefixes, as read by the simulator's ITEM_NAMES.
+_SETUP_KEYS = {
+    "Background Check": "background_check",
+    "CPR Certification": "cpr",
+    "First Aid": "first_aid",
+    "TB Test": "tb_test",
+}
+ZONES = [f"zone-{c}" for c in "abcdefgh"]
+OVER_RESTRICTED_EXCLUSIONS = 3
+
+KINDS = ("compliance", "geo", "eligibility")
+
+_COLLECTIONS = {
+    "compliance": "compliance_missing_cases",
+    "geo": "geo_over_restriction_cases",
+    "eligibility": "eligibility_improvement_cases",
+}
+
+_GRADERS = {
+    "compliance": ["compliance_gap_detection", "compliance_remediation"],
+    "geo": ["geo_restriction_detection", "safe_area_suggestion_quality"],
+    "eligibility": ["constraint_capture", "eligibility_impact_explanation", "options_offered"],
+}
+
+
+@dataclass
+class GeneratedCase:
+    """One generated scenario and the synthetic response the mock agent returns for it."""
+
+    scenario: TestScenario
+    response: AgentOutput
+    flawed: bool = False
+
+
+class ScenarioGenerator:
+    """Deterministic, seeded source of generated scenarios and responses.
+
+    ``error_rate`` is the fraction of responses that are deliberately flawed
+    (a gap or concern left out, no remediation or safety-map lookup) so the
+    graders and quality gates see realistic failures.
+    """
+
+    def __init__(
+        self,
+        *,
+        seed: int = 0,
+        kinds: tuple[str, ...] = KINDS,
+        error_rate: float = 0.0,
+    ) -> None:
+        unknown = [kind for kind in kinds if kind not in KINDS]
+        if unknown or not kinds:
+            raise ValueError(f"Unknown scenario kinds: {unknown}. Available: {list(KINDS)}")
+        if not 0 <= error_rate <= 1:
+            raise ValueError(f"error_rate must be in [0, 1], got {error_rate}")
+        self.seed = seed
+        self.kinds = tuple(kinds)
+        self.error_rate = error_rate
+
+    def scenario_id(self, index: int) -> str:
+        return f"gen_{self.seed}_{index:07d}"
+
+    def index_of(self, scenario_id: str) -> int:
+        """Inverse of :meth:`scenario_id`."""
+        prefix = f"gen_{self.seed}_"
+        if not scenario_id.startswith(prefix):
+            raise ValueError(f"{scenario_id!r} was not generated with seed {self.seed}")
+        return int(scenario_id[len(prefix):])
+
+    def case(self, index: int) -> GeneratedCase:
+        rng = random.Random(f"{self.seed}:{index}")
+        kind = self.kinds[index % len(self.kinds)]
+        flawed = rng.random() < self.error_rate
+        build = {"compliance": _compliance_case, "geo": _geo_case, "eligibility": _eligibility_case}[kind]
+        scenario, response = build(rng, self.scenario_id(index), flawed)
+        return GeneratedCase(scenario=scenario, response=response, flawed=flawed)
+
+    def cases(self, count: int, *, start: int = 0) -> Iterator[GeneratedCase]:
+        for index in range(start, start + count):
+            yield self.case(index)
+
+    def scenarios(self, count: int, *, start: int = 0) -> Iterator[TestScenario]:
+        for case in self.cases(count, start=start):
+            yield case.scenario
+
+
+def _scenario(scenario_id: str, kind: str, name: str, description: str, **fields) -> TestScenario:
+    return TestScenario(
+        scenario_id=scenario_id,
+        name=name,
+        description=description,
+        collection=_COLLECTIONS[kind],
+        required=True,
+        grader_names=list(_GRADERS[kind]),
+        **fields,
+    )
+
+
+def _profile(rng: random.Random, scenario_id: str, **fields) -> CaregiverProfile:
+    return CaregiverProfile(
+        caregiver_id=f"cg-{scenario_id}",
+        full_name=f"Generated Caregiver {scenario_id[-7:]}",
+        years_experience=rng.randint(0, 20),
+        **fields,
+    )
+
+
+def _transcript(scenario_id: str, lines: list[str]) -> ConversationTranscript:
+    return ConversationTranscript(
+        scenario_id=scenario_id,
+        turns=[
+            ConversationTurn(role="agent" if i % 2 == 0 else "caregiver", content=content, turn_number=i + 1)
+            for i, content in enumerate(lines)
+        ],
+    )
+
+
+def _compliance_case(
+    rng: random.Random, scenario_id: str, flawed: bool
+) -> tuple[TestScenario, AgentOutput]:
+    statuses = {item: rng.choice(COMPLIANCE_STATUSES) for item in COMPLIANCE_ITEMS}
+    gaps = [item for item, status in statuses.items() if status != "valid"]
+    scenario = _scenario(
+        scenario_id,
+        "compliance",
+        f"Generated compliance: {len(gaps)} gap(s)",
+        "Generated caregiver with randomised compliance statuses.",
+        caregiver_setup={f"{_SETUP_KEYS[item]}_status": s for item, s in statuses.items()},
+        expected_compliance_gaps=gaps,
+    )
+
+    found = gaps[:-1] if flawed and gaps else gaps
+    remediation = [] if flawed else [f"Schedule {gap} renewal" for gap in gaps]
+    intake = StructuredIntakeRecord(
+        caregiver=_profile(
+            rng,
+            scenario_id,
+            compliance=[ComplianceRecord(item_name=item, status=s) for item, s in statuses.items()],
+        ),
+        compliance_gaps=found,
+        remediation_actions=remediation,
+        overall_status="needs_review" if gaps else "complete",
+    )
+    actions = AgentActionLog(
+        scenario_id=scenario_id,
+        actions=["Reviewed compliance records"] + [f"Identified {gap} gap" for gap in found],
+        compliance_items_checked=list(COMPLIANCE_ITEMS),
+        scheduling_offered=bool(remediation),
+        remediation_steps_offered=remediation,
+    )
+    transcript = _transcript(
+        scenario_id,
+        [
+            "Let me review your compliance records.",
+            "Sure, go ahead.",
+            f"I found these gaps: {', '.join(found) or 'none'}.",
+        ],
+    )
+    return scenario, AgentOutput(transcript=transcript, intake_record=intake, action_log=actions)
+
+
+def _geo_case(rng: random.Random, scenario_id: str, flawed: bool) -> tuple[TestScenario, AgentOutput]:
+    zones = rng.sample(ZONES, len(ZONES))
+    preferred = zones[: rng.randint(1, 3)]
+    excluded = zones[len(preferred): len(preferred) + rng.randint(0, 5)]
+    over_restricted = len(excluded) >= OVER_RESTRICTED_EXCLUSIONS
+    concerns = ["over_restricted_zones", "limited_assignment_availability"] if over_restricted else []
+    scenario = _scenario(
+        scenario_id,
+        "geo",
+        f"Generated geo: {len(excluded)} excluded zone(s)",
+        "Generated caregiver with randomised preferred and excluded zones.",
+        caregiver_setup={"preferred_zones": preferred, "excluded_zones": excluded},
+        expected_geo_concerns=concerns,
+    )
+
+    suggestions = [f"{zone} (low risk)" for zone in excluded[:2]] if over_restricted and not flawed else []
+    intake = StructuredIntakeRecord(
+        caregiver=_profile(
+            rng,
+            scenario_id,
+            geo_preferences=GeoPreferences(
+                preferred_zones=preferred,
+                excluded_zones=excluded,
+                max_travel_minutes=rng.choice([15, 20, 30, 45, 60]),
+                has_own_transport=rng.random() < 0.5,
+            ),
+        ),
+        geo_concerns=concerns[:1] if flawed else concerns,
+        safe_area_suggestions=suggestions,
+        overall_status="needs_review" if over_restricted else "complete",
+    )
+    actions = AgentActionLog(
+        scenario_id=scenario_id,
+        actions=["Reviewed geographic preferences"],
+        safety_map_consulted=not flawed,
+    )
+    transcript = _transcript(
+        scenario_id,
+        [
+            "Let's review your geographic preferences.",
+            f"I prefer {', '.join(preferred)}.",
+            f"Noted. Suggested alternatives: {', '.join(suggestions) or 'none needed'}.",
+        ],
+    )
+    return scenario, AgentOutput(transcript=transcript, intake_record=intake, action_log=actions)
+
+
+def _eligibility_case(
+    rng: random.Random, scenario_id: str, flawed: bool
+) -> tuple[TestScenario, AgentOutput]:
+    low = rng.randint(16, 24)
+    rate_range = [low, low + rng.randint(3, 8)]
+    hours_range = [rng.choice([5, 10, 15]), rng.choice([25, 30, 40])]
+    desired_rate = rng.randint(low - 2, rate_range[1] + 8)
+    minimum_hours = rng.randint(5, 45)
+    scenario = _scenario(
+        scenario_id,
+        "eligibility",
+        f"Generated eligibility: ${desired_rate}/hr, {minimum_hours}+ hrs/week",
+        "Generated caregiver with randomised pay and hours constraints against a market range.",
+        caregiver_setup={
+            "desired_hourly_rate": desired_rate,
+            "minimum_weekly_hours": minimum_hours,
+            "market_typical_rate_range": rate_range,
+            "market_typical_hours_range": hours_range,
+        },
+    )
+
+    mismatched = desired_rate > rate_range[1] or minimum_hours > hours_range[1]
+    intake = StructuredIntakeRecord(
+        caregiver=_profile(rng, scenario_id),
+        overall_status="needs_review" if mismatched else "complete",
+    )
+    options = [] if flawed or not mismatched else ["Consider rate within market range", "Accept shorter shifts"]
+    actions = AgentActionLog(
+        scenario_id=scenario_id,
+        actions=["Captured pay and hours constraints"],
+        remediation_steps_offered=options,
+    )
+    transcript = _transcript(
+        scenario_id,
+        [
+            "What pay rate and weekly hours are you looking for?",
+            f"At least ${desired_rate}/hr and {minimum_hours} hours a week.",
+            f"Typical rates here are ${rate_range[0]}-{rate_range[1]}/hr for {hours_range[0]}-{hours_range[1]} hours.",
+        ],
+    )
+    return scenario, AgentOutput(transcript=transcript, intake_record=intake, action_log=actions)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate scenarios and synthetic responses")
+    parser.add_argument("-n", "--count", type=int, required=True, help="Number of scenarios to generate")
+    parser.add_argument("-o", "--output", type=str, required=True, help="Scenario JSONL path (.gz to compress)")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0)")
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=KINDS,
+        default=None,
+        help="Scenario template to use (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of synthetic responses that are deliberately flawed (default: 0)",
+    )
+    parser.add_argument(
+        "--responses-dir",
+        type=str,
+        default=None,
+        help="Also write each response as <scenario_id>.json in this directory",
+    )
+    args = parser.parse_args(argv)
+
+    generator = ScenarioGenerator(
+        seed=args.seed, kinds=tuple(args.kind or KINDS), error_rate=args.error_rate
+    )
+    if args.responses_dir is None:
+        count = write_jsonl(generator.scenarios(args.count), args.output)
+    else:
+        responses_dir = Path(args.responses_dir)
+        responses_dir.mkdir(parents=True, exist_ok=True)
+
+        def scenarios_writing_responses() -> Iterator[TestScenario]:
+            for case in generator.cases(args.count):
+                path = responses_dir / f"{case.scenario.scenario_id}.json"
+                path.write_text(json.dumps(response_to_dict(case.response)))
+                yield case.scenario
+
+        count = write_jsonl(scenarios_writing_responses(), args.output)
+    print(f"Wrote {count} scenarios to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
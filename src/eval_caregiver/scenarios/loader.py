@@ -1,59 +1,214 @@
-"""Scenario loader: registry of all scenario collections loaded from JSON."""
+"""Scenario loader: registry of all scenario collections loaded from JSON.
+
+Only a manifest of collection IDs and file paths is built at import time; each
+collection file is parsed and validated the first time it is accessed. Loaded
+scenarios are indexed by ID, collection, grader name and ``required`` flag so
+lookups and queries never rescan the corpus.
+"""
 
 from __future__ import annotations
 
-import json
+import threading
 from pathlib import Path
 
+from eval_caregiver.schemas.ingest import read_json
 from eval_caregiver.schemas.scenarios import ScenarioCollection, TestScenario
 
 _DATA_DIR = Path(__file__).resolve().parents[3] / "data"
 
 
-def _load_collections() -> dict[str, ScenarioCollection]:
-    """Scan data/scenarios/*.json and validate each as a ScenarioCollection."""
-    collections: dict[str, ScenarioCollection] = {}
-    scenarios_dir = _DATA_DIR / "scenarios"
-    for path in sorted(scenarios_dir.glob("*.json")):
-        raw = json.loads(path.read_text())
-        collection = ScenarioCollection.model_validate(raw)
-        collections[collection.collection_id] = collection
-    return collections
-
-
-_COLLECTIONS: dict[str, ScenarioCollection] = _load_collections()
+def _scan_manifest(scenarios_dir: Path) -> dict[str, Path]:
+    """Map collection IDs (file stems) to their JSON files without reading them."""
+    return {path.stem: path for path in sorted(scenarios_dir.glob("*.json"))}
+
+
+class ScenarioRegistry:
+    """Lazily loaded, indexed view over a directory of scenario collections."""
+
+    def __init__(self, manifest: dict[str, Path]) -> None:
+        self._manifest = manifest
+        self._collections: dict[str, ScenarioCollection] = {}
+        self._lock = threading.Lock()
+        # Index values are dicts used as insertion-ordered sets of scenario IDs.
+        self._by_id: dict[str, TestScenario] = {}
+        self._by_collection: dict[str, dict[str, None]] = {}
+        self._by_grader: dict[str, dict[str, None]] = {}
+        self._by_required: dict[bool, dict[str, None]] = {True: {}, False: {}}
+
+    @classmethod
+    def from_directory(cls, scenarios_dir: Path) -> ScenarioRegistry:
+        return cls(_scan_manifest(scenarios_dir))
+
+    @classmethod
+    def from_collections(cls, collections: dict[str, ScenarioCollection]) -> ScenarioRegistry:
+        """Build a fully loaded registry from already-validated collections.
+
+        ``collections`` is keyed like a directory manifest, by file stem; the
+        same filename and duplicate-ID checks as for lazily loaded files apply.
+        """
+        registry = cls({collection_id: Path(f"{collection_id}.json") for collection_id in collections})
+        for collection_id, collection in collections.items():
+            registry._check(collection_id, collection)
+            registry._index(collection_id, collection.scenarios)
+            registry._collections[collection_id] = collection
+        return registry
+
+    @property
+    def collection_ids(self) -> list[str]:
+        return list(self._manifest)
+
+    @property
+    def loaded_collection_ids(self) -> list[str]:
+        return list(self._collections)
+
+    def collection(self, collection_id: str) -> ScenarioCollection:
+        """Parse, validate and index a collection on first access."""
+        collection = self._collections.get(collection_id)
+        if collection is not None:
+            return collection
+        if collection_id not in self._manifest:
+            raise ValueError(
+                f"Unknown collection: {collection_id!r}. "
+                f"Available: {sorted(self._manifest.keys())}"
+            )
+        with self._lock:
+            if collection_id not in self._collections:
+                self._collections[collection_id] = self._load(collection_id)
+            return self._collections[collection_id]
+
+    def _load(self, collection_id: str) -> ScenarioCollection:
+        collection = read_json(ScenarioCollection, self._manifest[collection_id])
+        self._check(collection_id, collection)
+        self._index(collection_id, collection.scenarios)
+        return collection
+
+    def _check(self, collection_id: str, collection: ScenarioCollection) -> None:
+        """Reject a collection whose ID differs from its filename or that reuses a scenario ID.
+
+        Scenario IDs are only compared with collections loaded so far, so a
+        clash between two files surfaces once both are loaded (any full run,
+        or :meth:`from_collections` on a compiled bundle), not when a single
+        collection is read.
+        """
+        name = self._manifest[collection_id].name
+        if collection.collection_id != collection_id:
+            raise ValueError(
+                f"{name} declares collection_id={collection.collection_id!r}; "
+                f"expected {collection_id!r} to match the filename"
+            )
+        seen: set[str] = set()
+        for scenario in collection.scenarios:
+            if scenario.scenario_id in self._by_id or scenario.scenario_id in seen:
+                raise ValueError(f"Duplicate scenario_id {scenario.scenario_id!r} in {name}")
+            seen.add(scenario.scenario_id)
+
+    def _index(self, collection_id: str, scenarios: list[TestScenario]) -> None:
+        ids = self._by_collection.setdefault(collection_id, {})
+        for scenario in scenarios:
+            sid = scenario.scenario_id
+            self._by_id[sid] = scenario
+            ids[sid] = None
+            for grader_name in scenario.grader_names:
+                self._by_grader.setdefault(grader_name, {})[sid] = None
+            self._by_required[scenario.required][sid] = None
+
+    def load_all(self) -> list[ScenarioCollection]:
+        return [self.collection(collection_id) for collection_id in self._manifest]
+
+    def scenarios(self) -> list[TestScenario]:
+        return [scenario for collection in self.load_all() for scenario in collection.scenarios]
+
+    def scenario(self, scenario_id: str) -> TestScenario:
+        """Look up a scenario by ID, loading unread collections only until it is found."""
+        scenario = self._by_id.get(scenario_id)
+        if scenario is not None:
+            return scenario
+        for collection_id in self._manifest:
+            if collection_id not in self._collections:
+                self.collection(collection_id)
+                scenario = self._by_id.get(scenario_id)
+                if scenario is not None:
+                    return scenario
+        raise ValueError(f"Unknown scenario: {scenario_id!r}. Available: {sorted(self._by_id)}")
+
+    def query(
+        self,
+        *,
+        collection: str | None = None,
+        grader: str | None = None,
+        required: bool | None = None,
+    ) -> list[TestScenario]:
+        """Scenarios matching every given filter.
+
+        Filtering by collection alone only loads that collection. The result is
+        computed by walking the smallest matching index and probing the others.
+        """
+        if collection is not None:
+            self.collection(collection)
+        if grader is not None or required is not None or collection is None:
+            self.load_all()
+
+        candidates: list[dict[str, None]] = []
+        if collection is not None:
+            candidates.append(self._by_collection.get(collection, {}))
+        if grader is not None:
+            candidates.append(self._by_grader.get(grader, {}))
+        if required is not None:
+            candidates.append(self._by_required[required])
+        if not candidates:
+            return self.scenarios()
+
+        candidates.sort(key=len)
+        smallest, others = candidates[0], candidates[1:]
+        return [
+            self._by_id[sid] for sid in smallest if all(sid in other for other in others)
+        ]
+
+
+_REGISTRY = ScenarioRegistry.from_directory(_DATA_DIR / "scenarios")
+
+
+def data_dir() -> Path:
+    """The ``data/`` directory holding the bundled scenario collections and responses."""
+    return _DATA_DIR
+
+
+def use_collections(collections: dict[str, ScenarioCollection]) -> None:
+    """Serve all lookups from pre-validated collections, e.g. from a compiled bundle."""
+    global _REGISTRY
+    _REGISTRY = ScenarioRegistry.from_collections(collections)
+
+
+def get_collection_ids() -> list[str]:
+    """Return the IDs of all known collections without loading them."""
+    return _REGISTRY.collection_ids
 
 
 def get_all_collections() -> list[ScenarioCollection]:
     """Return all registered scenario collections."""
-    return list(_COLLECTIONS.values())
+    return _REGISTRY.load_all()
 
 
 def get_collection(collection_id: str) -> ScenarioCollection:
     """Return a specific scenario collection by ID."""
-    if collection_id not in _COLLECTIONS:
-        raise ValueError(
-            f"Unknown collection: {collection_id!r}. "
-            f"Available: {sorted(_COLLECTIONS.keys())}"
-        )
-    return _COLLECTIONS[collection_id]
+    return _REGISTRY.collection(collection_id)
 
 
 def get_all_scenarios() -> list[TestScenario]:
     """Return all scenarios across all collections."""
-    scenarios = []
-    for collection in _COLLECTIONS.values():
-        scenarios.extend(collection.scenarios)
-    return scenarios
+    return _REGISTRY.scenarios()
 
 
 def get_scenario(scenario_id: str) -> TestScenario:
     """Find a specific scenario by ID across all collections."""
-    for collection in _COLLECTIONS.values():
-        for scenario in collection.scenarios:
-            if scenario.scenario_id == scenario_id:
-                return scenario
-    raise ValueError(
-        f"Unknown scenario: {scenario_id!r}. "
-        f"Available: {sorted(s.scenario_id for s in get_all_scenarios())}"
-    )
+    return _REGISTRY.scenario(scenario_id)
+
+
+def query_scenarios(
+    *,
+    collection: str | None = None,
+    grader: str | None = None,
+    required: bool | None = None,
+) -> list[TestScenario]:
+    """Return scenarios matching all the given filters."""
+    return _REGISTRY.query(collection=collection, grader=grader, required=required)
@@ -0,0 +1,126 @@
+"""Streaming scenario source for large JSONL corpora.
+
+Each line of the file is one ``TestScenario`` JSON object. Lines are read and
+validated one at a time as the source is iterated, so memory use does not
+depend on corpus size. Files ending in ``.gz`` (or starting with the gzip magic
+bytes) are decompressed on the fly.
+"""
+
+from __future__ import annotations
+
+import gzip
+from collections.abc import Container, Iterable, Iterator
+from pathlib import Path
+from typing import IO
+
+from pydantic import ValidationError
+
+from eval_caregiver.schemas.ingest import validate_json
+from eval_caregiver.schemas.scenarios import TestScenario
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _open_for_writing(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "wt", encoding="utf-8")
+    return path.open("w", encoding="utf-8")
+
+
+def _open_for_reading(path: Path) -> IO[bytes]:
+    """Raw lines are validated as bytes, so there is no text decoding layer."""
+    with path.open("rb") as f:
+        compressed = f.read(2) == _GZIP_MAGIC
+    if compressed:
+        return gzip.open(path, "rb")
+    return path.open("rb")
+
+
+def scenario_matches(
+    scenario: TestScenario,
+    *,
+    collection: str | None = None,
+    grader: str | None = None,
+    required: bool | None = None,
+    scenario_ids: Container[str] | None = None,
+) -> bool:
+    """Whether ``scenario`` passes every given filter; ``None`` filters match anything."""
+    if collection is not None and scenario.collection != collection:
+        return False
+    if grader is not None and grader not in scenario.grader_names:
+        return False
+    if required is not None and scenario.required != required:
+        return False
+    if scenario_ids is not None and scenario.scenario_id not in scenario_ids:
+        return False
+    return True
+
+
+def filter_scenarios(
+    scenarios: Iterable[TestScenario],
+    *,
+    collection: str | None = None,
+    grader: str | None = None,
+    required: bool | None = None,
+    scenario_ids: Iterable[str] | None = None,
+) -> Iterator[TestScenario]:
+    """Lazily keep the scenarios of a stream that match every given filter."""
+    ids = set(scenario_ids) if scenario_ids is not None else None
+    for scenario in scenarios:
+        if scenario_matches(scenario, collection=collection, grader=grader, required=required, scenario_ids=ids):
+            yield scenario
+
+
+class JsonlScenarioSource:
+    """Re-iterable, lazily validated stream of scenarios from a JSONL file.
+
+    Optional filters mirror :func:`eval_caregiver.scenarios.loader.query_scenarios`
+    and are applied as records are read; ``scenario_ids`` keeps only the listed IDs.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        collection: str | None = None,
+        grader: str | None = None,
+        required: bool | None = None,
+        scenario_ids: Iterable[str] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.collection = collection
+        self.grader = grader
+        self.required = required
+        self.scenario_ids = set(scenario_ids) if scenario_ids is not None else None
+
+    def _matches(self, scenario: TestScenario) -> bool:
+        return scenario_matches(
+            scenario,
+            collection=self.collection,
+            grader=self.grader,
+            required=self.required,
+            scenario_ids=self.scenario_ids,
+        )
+
+    def __iter__(self) -> Iterator[TestScenario]:
+        with _open_for_reading(self.path) as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    scenario = validate_json(TestScenario, line)
+                except ValidationError as e:
+                    raise ValueError(f"{self.path.name}:{line_number}: invalid scenario: {e}") from e
+                if self._matches(scenario):
+                    yield scenario
+
+
+def write_jsonl(scenarios: Iterable[TestScenario], path: str | Path) -> int:
+    """Write scenarios as JSONL (gzip-compressed if ``path`` ends in ``.gz``); return the count."""
+    count = 0
+    with _open_for_writing(Path(path)) as f:
+        for scenario in scenarios:
+            f.write(scenario.model_dump_json())
+            f.write("\n")
+            count += 1
+    return count
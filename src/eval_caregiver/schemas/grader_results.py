@@ -12,6 +12,15 @@ class RubricCriterionScore(BaseModel):
     rationale: str = Field(default="", description="Explanation for the score")
 
 
+class JudgeUsage(BaseModel):
+    """Cost of one LLM judge call."""
+
+    model: str = Field(description="Judge model that scored the transcript")
+    input_tokens: int = Field(default=0, description="Prompt tokens billed for the call")
+    output_tokens: int = Field(default=0, description="Completion tokens billed for the call")
+    latency_s: float = Field(default=0.0, description="Wall-clock seconds spent waiting for the judge")
+
+
 class GraderResult(BaseModel):
     """Result from a single grader evaluation."""
 
@@ -22,6 +31,9 @@ class GraderResult(BaseModel):
     criterion_scores: list[RubricCriterionScore] = Field(
         default_factory=list, description="Per-criterion scores (for rubric-based graders)"
     )
+    judge_usage: JudgeUsage | None = Field(
+        default=None, description="Judge model, tokens and latency (for model-based graders)"
+    )
 
 
 class ScenarioResult(BaseModel):
@@ -0,0 +1,99 @@
+"""Validate JSON data files straight from bytes.
+
+Every loader (scenario collections, recorded responses, cassettes, review
+files, saved reports, duration history) goes through :func:`validate_json`,
+which hands the raw bytes to pydantic-core's JSON parser via a cached
+``TypeAdapter``. That skips decoding to ``str`` and building an intermediate
+tree of Python dicts and lists that ``model_validate`` would then walk again.
+
+``python -m eval_caregiver.schemas.ingest -n 5000`` compares this against
+``json.loads`` + ``model_validate`` on a generated corpus.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+@functools.cache
+def type_adapter(tp: Any) -> TypeAdapter:
+    """The shared ``TypeAdapter`` for ``tp``; building one compiles a validator, so reuse it."""
+    return TypeAdapter(tp)
+
+
+def validate_json(tp: type[T], data: bytes | bytearray | str) -> T:
+    """Parse and validate JSON ``data`` as ``tp`` in one pass."""
+    return type_adapter(tp).validate_json(data)
+
+
+def read_json(tp: type[T], path: Path) -> T:
+    """Validate a JSON file as ``tp`` from its raw bytes."""
+    return validate_json(tp, Path(path).read_bytes())
+
+
+def _best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv: list[str] | None = None) -> int:
+    # Imported here: only the benchmark needs the generator and response layout.
+    from eval_caregiver.agent.response_store import response_from_dict, response_from_json, response_to_dict
+    from eval_caregiver.scenarios.generator import ScenarioGenerator
+    from eval_caregiver.schemas.scenarios import ScenarioCollection
+
+    parser = argparse.ArgumentParser(description="Benchmark JSON ingestion: dict validation vs bytes validation")
+    parser.add_argument("-n", "--count", type=int, default=5000, help="Generated records (default: 5000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant; the best is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    cases = list(ScenarioGenerator(seed=args.seed).cases(args.count))
+    responses = [json.dumps(response_to_dict(case.response)).encode() for case in cases]
+    collection = json.dumps(
+        {
+            "collection_id": "generated",
+            "name": "Generated",
+            "description": "Benchmark corpus",
+            "scenarios": [case.scenario.model_dump(mode="json") for case in cases],
+        }
+    ).encode()
+
+    workloads = [
+        (
+            f"{args.count} responses",
+            sum(map(len, responses)),
+            lambda: [response_from_dict(json.loads(data)) for data in responses],
+            lambda: [response_from_json(data) for data in responses],
+        ),
+        (
+            f"collection of {args.count} scenarios",
+            len(collection),
+            lambda: ScenarioCollection.model_validate(json.loads(collection)),
+            lambda: validate_json(ScenarioCollection, collection),
+        ),
+    ]
+    print(f"{'workload':<36} {'MB':>7} {'loads+validate s':>17} {'validate_json s':>16} {'speedup':>8}")
+    for name, size, baseline, fast in workloads:
+        slow_s = _best_of(args.repeat, baseline)
+        fast_s = _best_of(args.repeat, fast)
+        print(f"{name:<36} {size / 1e6:>7.1f} {slow_s:>17.3f} {fast_s:>16.3f} {slow_s / fast_s:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
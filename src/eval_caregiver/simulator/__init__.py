@@ -0,0 +1,4 @@
+from eval_caregiver.simulator.caregiver import CaregiverSimulator
+from eval_caregiver.simulator.conversation import AgentSession, SimulatedConversationAgent
+
+__all__ = ["AgentSession", "CaregiverSimulator", "SimulatedConversationAgent"]
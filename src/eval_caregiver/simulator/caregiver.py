@@ -0,0 +1,175 @@
+"""Rule-driven caregiver that answers an agent from a scenario's ``caregiver_setup``.
+
+Each agent message is matched against a few topics (compliance items,
+scheduling, zones, pay and hours, wrapping up) with precompiled patterns, and
+every matched topic gets a scripted answer built from the setup fields. The
+wording is picked with a generator seeded by ``(seed, scenario_id)``, so a
+conversation with a deterministic agent is reproducible, and no model is
+called, so thousands of conversations run in seconds.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+
+from eval_caregiver.schemas.scenarios import TestScenario
+
+# Display names for ``<item>_status`` setup fields; other items use the field name.
+ITEM_NAMES = {
+    "cpr": "CPR certification",
+    "first_aid": "First Aid certification",
+    "background_check": "background check",
+    "tb_test": "TB test",
+    "flu_shot": "flu shot",
+    "covid_vaccine": "COVID vaccine",
+    "drivers_license": "driver's license",
+    "car_insurance": "car insurance",
+}
+
+# Extra words that identify an item in the agent's message, beyond its display name.
+_ITEM_ALIASES = {
+    "cpr": r"cpr",
+    "first_aid": r"first aid",
+    "background_check": r"background",
+    "tb_test": r"\btb\b|tuberculosis",
+    "flu_shot": r"\bflu\b",
+    "covid_vaccine": r"covid",
+    "drivers_license": r"licen[cs]e",
+    "car_insurance": r"insurance",
+}
+
+_STATUS_REPLIES = {
+    "valid": ("My {item} is current.", "I have a valid {item}."),
+    "expired": ("My {item} expired a while ago.", "I think my {item} has lapsed."),
+    "missing": ("I don't have a {item}.", "I never got a {item}."),
+    "unknown": ("I'm honestly not sure about my {item}.", "I'd have to check on my {item}."),
+}
+
+_ACKNOWLEDGEMENTS = ("Okay.", "Sounds good.", "Sure, go ahead.", "Got it, thanks.")
+_REPEAT_PREFIXES = ("Like I said, ", "As I mentioned, ", "Again, ")
+
+# Checked in this order; an agent message can match several topics.
+_TOPICS = (
+    ("scheduling", re.compile(r"\b(schedul\w*|book\w*|sign you up|enrol\w*|appointment|class)\b", re.I)),
+    (
+        "compliance",
+        re.compile(
+            r"\b(cpr|certif\w*|compliance|background|tb|first aid|flu|covid|vaccin\w*|"
+            r"licen[cs]e|insurance|records?|documents?)\b",
+            re.I,
+        ),
+    ),
+    ("geo", re.compile(r"\b(zones?|areas?|neighbou?rhoods?|travel|commute|location|where)\b", re.I)),
+    ("pay", re.compile(r"(\$|\b(pay|rate|wage|salary|hours|hourly)\b)", re.I)),
+    ("closing", re.compile(r"\b(anything else|all set|that's everything|that is everything|goodbye|bye)\b", re.I)),
+)
+
+
+class CaregiverSimulator:
+    """Scripted caregiver for one scenario; create a fresh one per conversation.
+
+    Reads these ``caregiver_setup`` fields when present: ``<item>_status``
+    (``valid``/``expired``/``missing``/``unknown``), ``preferred_zones``,
+    ``excluded_zones``, ``desired_hourly_rate``, ``minimum_weekly_hours``,
+    ``earliest_start_offset_days`` and ``delay_reason``. Once the agent wraps
+    up, :attr:`done` is set.
+    """
+
+    def __init__(self, scenario: TestScenario, *, seed: int = 0) -> None:
+        self.scenario_id = scenario.scenario_id
+        self.setup = dict(scenario.caregiver_setup)
+        self.done = False
+        self._rng = random.Random(f"{seed}:{scenario.scenario_id}")
+        self._answered: set[str] = set()
+        self.statuses = {
+            key[: -len("_status")]: str(value)
+            for key, value in self.setup.items()
+            if key.endswith("_status") and isinstance(value, str)
+        }
+
+    @property
+    def gaps(self) -> list[str]:
+        """Items whose status is anything but ``valid``."""
+        return [item for item, status in self.statuses.items() if status != "valid"]
+
+    def reply(self, agent_message: str) -> str:
+        """The caregiver's answer to one agent turn."""
+        topics = [topic for topic, pattern in _TOPICS if pattern.search(agent_message)]
+        if "closing" in topics:
+            self.done = True
+            return self._choice(("No, that's everything. Thanks!", "That's all from me, thank you."))
+
+        parts = []
+        for topic in topics:
+            answer = getattr(self, f"_{topic}")(agent_message)
+            if not answer:
+                continue
+            if topic in self._answered:
+                if not re.match(r"I\b", answer):
+                    answer = answer[0].lower() + answer[1:]
+                answer = self._choice(_REPEAT_PREFIXES) + answer
+            self._answered.add(topic)
+            parts.append(answer)
+        return " ".join(parts) or self._choice(_ACKNOWLEDGEMENTS)
+
+    def _choice(self, options: tuple[str, ...]) -> str:
+        return options[self._rng.randrange(len(options))]
+
+    def _items_mentioned(self, message: str) -> list[str]:
+        return [
+            item
+            for item in self.statuses
+            if re.search(_ITEM_ALIASES.get(item, re.escape(item.replace("_", " "))), message, re.I)
+        ]
+
+    def _compliance(self, message: str) -> str:
+        if not self.statuses:
+            return "I think all my paperwork is in order."
+        items = self._items_mentioned(message) or list(self.statuses)
+        return " ".join(
+            self._choice(_STATUS_REPLIES.get(self.statuses[item], _STATUS_REPLIES["unknown"])).format(
+                item=ITEM_NAMES.get(item, item.replace("_", " "))
+            )
+            for item in items
+        )
+
+    def _scheduling(self, message: str) -> str:
+        gaps = self._items_mentioned(message) or self.gaps
+        if not gaps:
+            return "I don't think I need anything scheduled."
+        answer = self._choice(
+            ("Yes, please book me for the earliest {item} slot.", "Sure, sign me up for {item}.")
+        ).format(item=" and ".join(ITEM_NAMES.get(item, item.replace("_", " ")) for item in gaps))
+        delay = self.setup.get("earliest_start_offset_days")
+        if delay:
+            reason = self.setup.get("delay_reason")
+            answer += f" I can't start for another {delay} days" + (f" because of {reason}." if reason else ".")
+        return answer
+
+    def _geo(self, message: str) -> str:
+        preferred = self.setup.get("preferred_zones") or []
+        excluded = self.setup.get("excluded_zones") or []
+        if not preferred and not excluded:
+            return "I'm flexible on location."
+        suggested = [zone for zone in excluded if zone in message]
+        if suggested:
+            return f"I'd still rather not work in {', '.join(suggested)}."
+        parts = []
+        if preferred:
+            parts.append(f"I'd like to stay in {', '.join(preferred)}.")
+        if excluded:
+            parts.append(f"I won't work in {', '.join(excluded)}.")
+        return " ".join(parts)
+
+    def _pay(self, message: str) -> str:
+        rate = self.setup.get("desired_hourly_rate")
+        hours = self.setup.get("minimum_weekly_hours")
+        if rate is None and hours is None:
+            return ""
+        demands = []
+        if rate is not None:
+            demands.append(f"${rate} an hour")
+        if hours is not None:
+            demands.append(f"{hours} hours a week")
+        return f"I need at least {' and '.join(demands)}."
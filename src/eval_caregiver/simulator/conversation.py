@@ -0,0 +1,93 @@
+"""Drive turn-by-turn agents through conversations with a simulated caregiver."""
+
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from eval_caregiver.agent.base import AgentOutput
+from eval_caregiver.agent.streaming import StreamingAgentBase, TurnStream
+from eval_caregiver.schemas.conversation import ConversationTranscript, ConversationTurn
+from eval_caregiver.schemas.scenarios import TestScenario
+from eval_caregiver.simulator.caregiver import CaregiverSimulator
+
+
+class AgentSession(ABC):
+    """One agent conversation, advanced one caregiver message at a time."""
+
+    @abstractmethod
+    def respond(self, caregiver_message: str | None) -> str | None:
+        """The agent's next message, or ``None`` to end the conversation.
+
+        ``caregiver_message`` is ``None`` for the opening turn.
+        """
+        ...
+
+    @abstractmethod
+    def finish(self, transcript: ConversationTranscript) -> AgentOutput:
+        """Build the intake record and action log once the conversation is over."""
+        ...
+
+
+class SimulatedConversationAgent(StreamingAgentBase):
+    """Runs each scenario as a live conversation between an agent session and a ``CaregiverSimulator``.
+
+    Turns alternate agent/caregiver, starting with the agent, until the agent
+    ends the session, the caregiver has wrapped up, or ``max_turns`` is
+    reached. Being a streaming agent, the executor can grade each turn as it
+    happens and stop a conversation whose outcome is already decided.
+
+    Args:
+        session_factory: Creates a fresh ``AgentSession`` for a scenario.
+        seed: Seed for the caregiver's wording.
+        max_turns: Upper bound on turns per conversation (both roles).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[TestScenario], AgentSession],
+        *,
+        seed: int = 0,
+        max_turns: int = 20,
+    ) -> None:
+        if max_turns < 1:
+            raise ValueError(f"max_turns must be >= 1, got {max_turns}")
+        self._session_factory = session_factory
+        self._seed = seed
+        self._max_turns = max_turns
+        # One event per in-flight conversation, keyed by id(scenario) so concurrent trials stay apart.
+        self._cancelled: dict[int, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def stream_scenario(self, scenario: TestScenario) -> TurnStream:
+        with self._lock:
+            cancelled = self._cancelled[id(scenario)] = threading.Event()
+        try:
+            session = self._session_factory(scenario)
+            caregiver = CaregiverSimulator(scenario, seed=self._seed)
+            turns: list[ConversationTurn] = []
+            message: str | None = None
+            while len(turns) < self._max_turns and not cancelled.is_set():
+                reply = session.respond(message)
+                if reply is None:
+                    break
+                turns.append(ConversationTurn(role="agent", content=reply, turn_number=len(turns) + 1))
+                yield turns[-1]
+                if len(turns) >= self._max_turns:
+                    break
+                message = caregiver.reply(reply)
+                turns.append(ConversationTurn(role="caregiver", content=message, turn_number=len(turns) + 1))
+                yield turns[-1]
+                if caregiver.done:
+                    break
+            return session.finish(ConversationTranscript(scenario_id=scenario.scenario_id, turns=turns))
+        finally:
+            with self._lock:
+                del self._cancelled[id(scenario)]
+
+    def cancel(self, scenario: TestScenario) -> None:
+        with self._lock:
+            event = self._cancelled.get(id(scenario))
+        if event is not None:
+            event.set()
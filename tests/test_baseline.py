@@ -0,0 +1,140 @@
+"""Tests for baseline loading and the changed-only run diff."""
+
+import io
+import json
+
+import pytest
+
+from eval_caregiver.reporting.json_report import generate_json_report
+from eval_caregiver.reporting.scorecard import print_baseline_diff
+from eval_caregiver.runner.baseline import (
+    _iter_members,
+    _JsonReader,
+    diff_against,
+    load_baseline_report,
+    load_baseline_run,
+)
+from eval_caregiver.runner.history import RunHistory
+from eval_caregiver.runner.quality_gates import QualityGate, QualityGateEvaluator
+from eval_caregiver.runner.records import GraderRecord, ScenarioRecord
+
+
+def _run(scores: dict[str, float]) -> list[ScenarioRecord]:
+    return [
+        ScenarioRecord(
+            scenario_id,
+            f"Scenario {scenario_id}",
+            (GraderRecord("compliance_gap_detection", score >= 0.5, score),),
+            passed=score >= 0.5,
+        )
+        for scenario_id, score in scores.items()
+    ]
+
+
+class TestJsonReader:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 4096])
+    def test_members_across_chunk_boundaries(self, chunk_size):
+        document = {
+            "summary": {"total": 12345, "ok": True},
+            "scenarios": [{"id": "a", "score": 0.1234}, {"id": "b\\u00e9", "score": 10}],
+            "empty": [],
+            "count": 98765,
+        }
+        reader = _JsonReader(io.StringIO(json.dumps(document, indent=2)), chunk_size)
+        assert list(_iter_members(reader)) == [
+            ("summary", {"total": 12345, "ok": True}),
+            ("scenarios", {"id": "a", "score": 0.1234}),
+            ("scenarios", {"id": "b\\u00e9", "score": 10}),
+            ("count", 98765),
+        ]
+
+    def test_empty_object(self):
+        assert list(_iter_members(_JsonReader(io.StringIO(" {} "), 1))) == []
+
+    def test_truncated_document(self):
+        reader = _JsonReader(io.StringIO('{"scenarios": [{"id": "a"'), 4)
+        with pytest.raises(ValueError):
+            list(_iter_members(reader))
+
+
+class TestRunDiff:
+    def setup_method(self):
+        self.gate = QualityGate(metric="compliance_gap_detection", threshold=0.75)
+        self.evaluator = QualityGateEvaluator(gates=[self.gate])
+
+    def _report(self, tmp_path, results):
+        return generate_json_report(results, self.evaluator.evaluate(results), str(tmp_path / "base.json"))
+
+    def test_report_round_trip(self, tmp_path):
+        base = _run({"a": 1.0, "b": 0.0})
+        baseline = load_baseline_report(self._report(tmp_path, base), chunk_size=16)
+        assert baseline.scenarios["a"].passed is True
+        assert baseline.scenarios["b"].scores == {"compliance_gap_detection": (0.0, False)}
+        assert baseline.gates == {"compliance_gap_detection": (0.5, False)}
+        assert [r.scenario_id for r in baseline.records()] == ["a", "b"]
+
+    def test_only_changes_are_reported(self, tmp_path):
+        base = _run({"same": 1.0, "fails": 1.0, "recovers": 0.0, "moves": 0.9, "noise": 0.8, "gone": 1.0})
+        current = _run({"same": 1.0, "fails": 0.0, "recovers": 1.0, "moves": 0.6, "noise": 0.80004, "new": 1.0})
+        baseline = load_baseline_report(self._report(tmp_path, base))
+        diff = diff_against(baseline, current, self.evaluator.evaluate(current), epsilon=1e-3)
+        assert [c.scenario_id for c in diff.newly_failing] == ["fails"]
+        assert [c.scenario_id for c in diff.newly_passing] == ["recovers"]
+        assert [c.scenario_id for c in diff.changed] == ["moves"]
+        assert diff.changed[0].graders[0].delta == pytest.approx(-0.3)
+        assert diff.added == ["new"]
+        assert diff.removed == ["gone"]
+        assert diff.compared == 5
+        gate = diff.gates[0]
+        assert gate.base_value == pytest.approx(0.7833, abs=1e-4)
+        assert gate.delta == pytest.approx(gate.value - gate.base_value)
+
+    def test_identical_runs_are_empty(self, tmp_path):
+        results = _run({"a": 1.0, "b": 0.25})
+        baseline = load_baseline_report(self._report(tmp_path, results))
+        diff = diff_against(baseline, results, self.evaluator.evaluate(results))
+        assert diff.empty
+        assert diff.gates[0].delta == 0.0
+
+    def test_grader_added_and_dropped(self, tmp_path):
+        base = [ScenarioRecord("a", "A", (GraderRecord("old", True, 1.0),), passed=True)]
+        current = [ScenarioRecord("a", "A", (GraderRecord("new", True, 1.0),), passed=True)]
+        baseline = load_baseline_report(self._report(tmp_path, base))
+        diff = diff_against(baseline, current, self.evaluator.evaluate(current))
+        graders = {g.grader_name: g for g in diff.changed[0].graders}
+        assert graders["old"].score is None
+        assert graders["new"].base_score is None
+
+    def test_history_baseline(self, tmp_path):
+        base = _run({"a": 1.0, "b": 1.0})
+        with RunHistory(tmp_path / "history.db") as history:
+            history.record_run(base, self.evaluator.evaluate(base))
+            baseline = load_baseline_run(history, "latest")
+        assert baseline.gates == {"compliance_gap_detection": (1.0, True)}
+        current = _run({"a": 1.0, "b": 0.0})
+        diff = diff_against(baseline, current, self.evaluator.evaluate(current))
+        assert [c.scenario_id for c in diff.newly_failing] == ["b"]
+        assert diff.gates[0].base_passed is True
+        assert diff.gates[0].passed is False
+
+    def test_json_report_section(self, tmp_path):
+        base = _run({"a": 1.0})
+        current = _run({"a": 0.0})
+        baseline = load_baseline_report(self._report(tmp_path, base))
+        report = self.evaluator.evaluate(current)
+        diff = diff_against(baseline, current, report)
+        path = generate_json_report(current, report, str(tmp_path / "current.json"), diff=diff)
+        section = json.loads(path.read_text())["baseline_diff"]
+        assert section["newly_failing"][0]["scenario_id"] == "a"
+        assert section["newly_failing"][0]["graders"][0]["delta"] == -1.0
+        assert section["gates"][0]["delta"] == -1.0
+
+    def test_printed_diff_is_compact(self, tmp_path, capsys):
+        base = _run({f"s{i}": 1.0 for i in range(50)})
+        current = _run({**{f"s{i}": 1.0 for i in range(50)}, "s7": 0.0})
+        baseline = load_baseline_report(self._report(tmp_path, base))
+        print_baseline_diff(diff_against(baseline, current, self.evaluator.evaluate(current)))
+        output = capsys.readouterr().out
+        assert "Newly failing (1):" in output
+        assert "compliance_gap_detection: 1.0000 -> 0.0000 (-1.0000)  PASS -> FAIL" in output
+        assert "s8" not in output
@@ -0,0 +1,148 @@
+"""Tests for bootstrap gate intervals and paired baseline comparisons."""
+
+import json
+
+import numpy as np
+import pytest
+
+from eval_caregiver.reporting.json_report import generate_json_report
+from eval_caregiver.runner.bootstrap import bootstrap_interval, bootstrap_means, paired_test
+from eval_caregiver.runner.quality_gates import QualityGate, QualityGateEvaluator
+from eval_caregiver.runner.score_matrix import ScoreMatrix
+from eval_caregiver.schemas.grader_results import GraderResult, ScenarioResult
+
+
+def _make_result(scenario_id: str, grader_name: str, score: float) -> ScenarioResult:
+    return ScenarioResult(
+        scenario_id=scenario_id,
+        scenario_name=f"Test {scenario_id}",
+        grader_results=[GraderResult(grader_name=grader_name, passed=score == 1.0, score=score)],
+        passed=score == 1.0,
+    )
+
+
+class TestBootstrap:
+    def test_means_shape_and_range(self):
+        rng = np.random.default_rng(0)
+        values = np.array([0.0, 0.5, 1.0])
+        means = bootstrap_means(values, 1000, rng)
+        assert means.shape == (1000,)
+        assert means.min() >= 0.0
+        assert means.max() <= 1.0
+
+    def test_interval_contains_mean(self):
+        rng = np.random.default_rng(1)
+        values = rng.random(200)
+        low, high = bootstrap_interval(values, resamples=2000, confidence=0.95, rng=rng)
+        assert low < values.mean() < high
+
+    def test_identical_scores_have_zero_width(self):
+        rng = np.random.default_rng(0)
+        assert bootstrap_interval(np.ones(15), resamples=500, confidence=0.95, rng=rng) == (1.0, 1.0)
+
+    def test_no_scores(self):
+        rng = np.random.default_rng(0)
+        assert bootstrap_interval(np.empty(0), resamples=500, confidence=0.95, rng=rng) == (0.0, 1.0)
+
+    def test_blocks_match_single_pass(self, monkeypatch):
+        values = np.linspace(0, 1, 50)
+        whole = bootstrap_means(values, 300, np.random.default_rng(5))
+        monkeypatch.setattr("eval_caregiver.runner.bootstrap._BLOCK_ELEMENTS", 120)
+        blocked = bootstrap_means(values, 300, np.random.default_rng(5))
+        assert whole.shape == blocked.shape
+        assert abs(whole.mean() - blocked.mean()) < 0.05
+
+
+class TestPairedTest:
+    def test_consistent_regression_is_significant(self):
+        rng = np.random.default_rng(0)
+        test = paired_test(np.zeros(30), np.ones(30), resamples=2000, confidence=0.95, rng=rng)
+        assert test.delta == -1.0
+        assert test.p_value < 0.05
+        assert test.pairs == 30
+
+    def test_noise_is_not_significant(self):
+        rng = np.random.default_rng(0)
+        current = np.array([1.0, 0.0] * 10)
+        baseline = np.array([0.0, 1.0] * 10)
+        test = paired_test(current, baseline, resamples=2000, confidence=0.95, rng=rng)
+        assert test.delta == 0.0
+        assert test.p_value > 0.5
+        assert test.ci_low < 0 < test.ci_high
+
+    def test_identical_runs(self):
+        rng = np.random.default_rng(0)
+        test = paired_test(np.ones(5), np.ones(5), resamples=100, confidence=0.95, rng=rng)
+        assert test.p_value == 1.0
+        assert (test.ci_low, test.ci_high) == (0.0, 0.0)
+
+
+class TestEvaluatorIntervals:
+    def setup_method(self):
+        self.gate = QualityGate(metric="compliance_gap_detection", threshold=0.75)
+        self.evaluator = QualityGateEvaluator(gates=[self.gate])
+
+    def test_bootstrap_interval_on_gates(self):
+        results = [_make_result(f"s{i}", "compliance_gap_detection", float(i % 2)) for i in range(16)]
+        report = self.evaluator.evaluate(results, bootstrap=2000, seed=3)
+        gr = report.gate_results[0]
+        assert gr.actual_value == 0.5
+        assert gr.passed is False
+        assert gr.ci_low < 0.5 < gr.ci_high
+        assert gr.sample_size == 16
+        assert report.bootstrap.resamples == 2000
+
+    def test_bootstrap_is_seeded(self):
+        results = [_make_result(f"s{i}", "compliance_gap_detection", float(i % 3 == 0)) for i in range(12)]
+        first = self.evaluator.evaluate(results, bootstrap=500, seed=9).gate_results[0]
+        second = self.evaluator.evaluate(results, bootstrap=500, seed=9).gate_results[0]
+        assert (first.ci_low, first.ci_high) == (second.ci_low, second.ci_high)
+
+    def test_no_bootstrap_by_default(self):
+        report = self.evaluator.evaluate([_make_result("s0", "compliance_gap_detection", 1.0)])
+        assert report.gate_results[0].ci_low is None
+        assert report.bootstrap is None
+
+    def test_negative_bootstrap_rejected(self):
+        with pytest.raises(ValueError, match="bootstrap must be >= 0"):
+            self.evaluator.evaluate([], bootstrap=-1)
+
+    def test_compare_pairs_by_scenario(self):
+        baseline = [_make_result(f"s{i}", "compliance_gap_detection", 1.0) for i in range(20)]
+        # Reversed order and an extra scenario: pairing is by ID, unpaired scenarios are ignored.
+        current = [_make_result(f"s{i}", "compliance_gap_detection", 0.0) for i in reversed(range(20))]
+        current.append(_make_result("extra", "compliance_gap_detection", 1.0))
+        comparison = self.evaluator.compare(current, baseline, source="main", resamples=1000)
+        c = comparison.gates[0]
+        assert c.pairs == 20
+        assert c.delta == -1.0
+        assert c.baseline_value == 1.0
+        assert c.significant is True
+        assert comparison.source == "main"
+
+    def test_paired_scores_alignment(self):
+        a = ScoreMatrix.from_results([
+            _make_result("x", "compliance_gap_detection", 0.25),
+            _make_result("y", "compliance_gap_detection", 0.5),
+        ])
+        b = ScoreMatrix.from_results([
+            _make_result("y", "compliance_gap_detection", 1.0),
+            _make_result("x", "compliance_gap_detection", 0.0),
+        ])
+        ours, theirs = a.paired_scores(b, "compliance_gap_detection")
+        assert ours.tolist() == [0.25, 0.5]
+        assert theirs.tolist() == [0.0, 1.0]
+        assert a.paired_scores(b, "missing")[0].size == 0
+
+    def test_json_report_includes_intervals_and_comparison(self, tmp_path):
+        results = [_make_result(f"s{i}", "compliance_gap_detection", 1.0) for i in range(5)]
+        report = self.evaluator.evaluate(results, bootstrap=200)
+        report.baseline = self.evaluator.compare(results, results, source="base.json", resamples=200)
+        path = generate_json_report(results, report, str(tmp_path / "report.json"))
+        data = json.loads(path.read_text())
+        assert data["quality_gates"][0]["ci"] == [1.0, 1.0]
+        assert data["bootstrap"]["resamples"] == 200
+        gate = data["baseline_comparison"]["gates"][0]
+        assert gate["delta"] == 0.0
+        assert gate["p_value"] == 1.0
+        assert gate["significant"] is False
@@ -0,0 +1,111 @@
+"""Tests for the compiled scenario/response bundle."""
+
+import os
+import shutil
+
+import pytest
+
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.scenarios import bundle as bundle_module
+from eval_caregiver.scenarios.bundle import load_bundle
+from eval_caregiver.scenarios.bundle import BundleResponseStore
+from eval_caregiver.scenarios.loader import ScenarioRegistry, data_dir as repo_data_dir
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    target = tmp_path / "data"
+    shutil.copytree(repo_data_dir() / "scenarios", target / "scenarios")
+    shutil.copytree(repo_data_dir() / "responses", target / "responses")
+    return target
+
+
+@pytest.fixture
+def build_calls(monkeypatch):
+    calls = []
+    real_build = bundle_module._build_bundle
+
+    def counting_build(*args, **kwargs):
+        calls.append(args)
+        return real_build(*args, **kwargs)
+
+    monkeypatch.setattr(bundle_module, "_build_bundle", counting_build)
+    return calls
+
+
+class TestBundle:
+    def test_contains_all_data(self, data_dir, tmp_path):
+        bundle = load_bundle(data_dir, tmp_path / "bundle.pickle")
+        assert set(bundle.collections) == {p.stem for p in (data_dir / "scenarios").glob("*.json")}
+        assert set(bundle.response_store()) == {p.stem for p in (data_dir / "responses").glob("*.json")}
+
+    def test_second_load_uses_cache(self, data_dir, tmp_path, build_calls):
+        cache = tmp_path / "bundle.pickle"
+        first = load_bundle(data_dir, cache)
+        second = load_bundle(data_dir, cache)
+        assert len(build_calls) == 1
+        assert second.collections == first.collections
+
+    def test_touch_without_change_does_not_rebuild(self, data_dir, tmp_path, build_calls):
+        cache = tmp_path / "bundle.pickle"
+        load_bundle(data_dir, cache)
+        path = next((data_dir / "responses").glob("*.json"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        load_bundle(data_dir, cache)
+        assert len(build_calls) == 1
+
+    def test_content_change_rebuilds(self, data_dir, tmp_path, build_calls):
+        cache = tmp_path / "bundle.pickle"
+        load_bundle(data_dir, cache)
+        path = data_dir / "scenarios" / "geo_over_restriction_cases.json"
+        path.write_text(path.read_text().replace('"Geo', '"Edited Geo', 1))
+        bundle = load_bundle(data_dir, cache)
+        assert len(build_calls) == 2
+        assert bundle.collections["geo_over_restriction_cases"].name.startswith("Edited")
+
+    def test_removed_file_rebuilds(self, data_dir, tmp_path, build_calls):
+        cache = tmp_path / "bundle.pickle"
+        load_bundle(data_dir, cache)
+        removed = next((data_dir / "responses").glob("*.json"))
+        removed.unlink()
+        bundle = load_bundle(data_dir, cache)
+        assert len(build_calls) == 2
+        assert removed.stem not in bundle.response_store()
+
+    def test_corrupt_cache_is_rebuilt(self, data_dir, tmp_path, build_calls):
+        cache = tmp_path / "bundle.pickle"
+        cache.write_bytes(b"not a pickle")
+        load_bundle(data_dir, cache)
+        assert len(build_calls) == 1
+
+    def test_feeds_registry_and_agent(self, data_dir, tmp_path):
+        bundle = load_bundle(data_dir, tmp_path / "bundle.pickle")
+        registry = ScenarioRegistry.from_collections(bundle.collections)
+        scenario = registry.scenario("geo_over_restricted")
+        output = MockAgent(responses=bundle.response_store()).run_scenario(scenario)
+        assert output.intake_record is not None
+
+    def test_collections_keyed_by_file_stem(self, data_dir, tmp_path):
+        path = data_dir / "scenarios" / "geo_over_restriction_cases.json"
+        path.rename(path.with_name("renamed.json"))
+        bundle = load_bundle(data_dir, tmp_path / "bundle.pickle")
+        assert "renamed" in bundle.collections
+        with pytest.raises(ValueError, match="renamed.json declares collection_id"):
+            ScenarioRegistry.from_collections(bundle.collections)
+
+    def test_duplicate_scenario_ids_rejected(self, data_dir, tmp_path):
+        source = data_dir / "scenarios" / "geo_over_restriction_cases.json"
+        copy = data_dir / "scenarios" / "geo_copy.json"
+        copy.write_text(source.read_text().replace('"geo_over_restriction_cases"', '"geo_copy"', 1))
+        bundle = load_bundle(data_dir, tmp_path / "bundle.pickle")
+        with pytest.raises(ValueError, match="Duplicate scenario_id"):
+            ScenarioRegistry.from_collections(bundle.collections)
+
+    def test_responses_are_lru_bounded(self, data_dir, tmp_path):
+        bundle = load_bundle(data_dir, tmp_path / "bundle.pickle")
+        store = bundle.response_store(max_cached=2)
+        assert isinstance(store, BundleResponseStore)
+        for scenario_id in list(store)[:3]:
+            store[scenario_id]
+        assert len(store.cached_ids) == 2
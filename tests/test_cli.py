@@ -0,0 +1,137 @@
+"""Tests for the eval-runner command line."""
+
+import json
+
+import pytest
+
+from eval_caregiver.agent.http_agent import HttpAgent
+from eval_caregiver.agent.stub_server import StubAgentServer
+from eval_caregiver.runner.cli import main
+
+
+@pytest.fixture(autouse=True)
+def _isolated(tmp_path, monkeypatch):
+    # Review files land under output/ in the working directory and the data bundle in the cache dir.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("EVAL_CAREGIVER_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def _argv(tmp_path, *args: str) -> list[str]:
+    """CLI arguments that keep every output file under ``tmp_path``; ``args`` can override them."""
+    return [
+        "--no-model-graders",
+        "-o", str(tmp_path / "report.json"),
+        "--durations", str(tmp_path / "durations.json"),
+        "--history", str(tmp_path / "history.db"),
+        *args,
+    ]
+
+
+class TestMain:
+    def test_agent_is_closed_when_the_run_fails(self, tmp_path, monkeypatch):
+        closed = []
+
+        def interrupted(self, scenario):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(HttpAgent, "run_scenario", interrupted)
+        monkeypatch.setattr(HttpAgent, "close", lambda self: closed.append(self))
+        with StubAgentServer() as server:
+            with pytest.raises(KeyboardInterrupt):
+                main(_argv(tmp_path, "--agent-url", server.url))
+        assert len(closed) == 1
+        assert not (tmp_path / "report.json").exists()
+
+    def test_fail_fast_on_a_filtered_generated_stream(self, tmp_path):
+        argv = _argv(tmp_path, "--generate", "30", "--fail-fast", "-g", "geo_restriction_detection", "--no-history")
+        assert main(argv) == 0
+        report = json.loads((tmp_path / "report.json").read_text())
+        assert report["summary"]["total_scenarios"] == 10
+        assert report["summary"]["stopped_early"] is False
+
+    def test_generate_with_error_rate(self, tmp_path):
+        argv = _argv(tmp_path, "--generate", "30", "--error-rate", "1.0", "--no-history")
+        assert main(argv) == 1
+        report = json.loads((tmp_path / "report.json").read_text())
+        assert report["summary"]["failed"] > 0
+
+    @pytest.mark.parametrize(
+        "args, message",
+        [
+            (("--error-rate", "0.5"), "--error-rate only applies to --generate"),
+            (("--generate", "10", "--error-rate", "1.5"), "error_rate must be in [0, 1]"),
+        ],
+    )
+    def test_invalid_error_rate_is_rejected(self, tmp_path, capsys, args, message):
+        with pytest.raises(SystemExit):
+            main(_argv(tmp_path, *args))
+        assert message in capsys.readouterr().err
+
+    def test_trials_with_bootstrap(self, tmp_path):
+        assert main(_argv(tmp_path, "-c", "compliance_missing_cases", "--trials", "3", "--bootstrap", "200")) == 0
+        report = json.loads((tmp_path / "report.json").read_text())
+        assert [t["trials"] for t in report["trials"]] == [3, 3, 3]
+        assert report["bootstrap"]["resamples"] == 200
+        assert all(gate["ci"] is not None for gate in report["quality_gates"])
+
+    def test_bootstrap_with_sample_is_rejected(self, tmp_path, capsys):
+        with pytest.raises(SystemExit):
+            main(_argv(tmp_path, "--sample", "0.5", "--bootstrap", "100"))
+        assert "--bootstrap cannot be combined with --sample" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        "args, message",
+        [
+            (("--sample", "1.5"), "--sample must be a fraction in (0, 1]"),
+            (("--sample", "0"), "--sample must be a fraction in (0, 1]"),
+            (("--trials", "0"), "--trials must be at least 1"),
+        ],
+    )
+    def test_out_of_range_sample_and_trials_are_rejected(self, tmp_path, capsys, args, message):
+        with pytest.raises(SystemExit):
+            main(_argv(tmp_path, *args))
+        assert message in capsys.readouterr().err
+        # Rejected while parsing, before any data is loaded or agent built.
+        assert not (tmp_path / "cache").exists()
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ("--agent-url", "http://127.0.0.1:9/intake", "--agent-command", "python -m my_agent"),
+            ("--generate", "10", "--agent-url", "http://127.0.0.1:9/intake"),
+            ("--generate", "10", "--agent-command", "python -m my_agent"),
+        ],
+    )
+    def test_agent_sources_are_mutually_exclusive(self, tmp_path, capsys, args):
+        with pytest.raises(SystemExit):
+            main(_argv(tmp_path, *args))
+        assert "not allowed with argument" in capsys.readouterr().err
+
+    def test_no_history(self, tmp_path):
+        assert main(_argv(tmp_path, "-s", "compliance_cpr_missing", "--no-history")) == 0
+        assert (tmp_path / "report.json").exists()
+        assert not (tmp_path / "history.db").exists()
+
+    def test_history_subcommand(self, tmp_path, capsys):
+        assert main(_argv(tmp_path, "-s", "compliance_cpr_missing", "--label", "first")) == 0
+        assert main(_argv(tmp_path, "-s", "compliance_cpr_missing", "--baseline-run", "latest")) == 0
+        capsys.readouterr()
+        assert main(["history", "--db", str(tmp_path / "history.db"), "runs"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert lines[1].endswith("first")
+
+    def test_baseline_report(self, tmp_path, capsys):
+        assert main(_argv(tmp_path, "-c", "compliance_missing_cases", "-o", str(tmp_path / "base.json"))) == 0
+        argv = _argv(tmp_path, "--baseline", str(tmp_path / "base.json"))
+        assert main(argv) == 0
+        report = json.loads((tmp_path / "report.json").read_text())
+        assert report["baseline_diff"]["newly_failing"] == []
+        assert len(report["baseline_diff"]["added"]) == len(report["scenarios"]) - 3
+        assert report["baseline_comparison"]["source"] == str(tmp_path / "base.json")
+        assert "CHANGES VS BASELINE" in capsys.readouterr().out
+
+    def test_missing_baseline_fails_before_running(self, tmp_path):
+        with pytest.raises(SystemExit):
+            main(_argv(tmp_path, "--baseline", str(tmp_path / "missing.json")))
+        assert not (tmp_path / "report.json").exists()
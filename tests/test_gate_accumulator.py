@@ -0,0 +1,143 @@
+"""Tests for streaming gate accumulation and the live status line."""
+
+import io
+import random
+import statistics
+
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.reporting.live_status import LiveStatus
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.runner.quality_gates import (
+    GateAccumulator,
+    QualityGate,
+    QualityGateEvaluator,
+    RunningStats,
+)
+from eval_caregiver.scenarios.loader import query_scenarios
+from eval_caregiver.schemas.grader_results import GraderResult, ScenarioResult
+
+
+def _make_result(scenario_id: str, grader_name: str, score: float) -> ScenarioResult:
+    return ScenarioResult(
+        scenario_id=scenario_id,
+        scenario_name=f"Test {scenario_id}",
+        grader_results=[GraderResult(grader_name=grader_name, passed=score == 1.0, score=score)],
+        passed=score == 1.0,
+    )
+
+
+class TestRunningStats:
+    def test_matches_batch_statistics(self):
+        rng = random.Random(7)
+        values = [rng.random() for _ in range(200)]
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+        assert stats.count == 200
+        assert abs(stats.mean - statistics.fmean(values)) < 1e-12
+        assert abs(stats.variance - statistics.variance(values)) < 1e-12
+
+    def test_empty_and_single(self):
+        stats = RunningStats()
+        assert stats.mean == 0.0
+        assert stats.variance == 0.0
+        stats.add(0.5)
+        assert stats.mean == 0.5
+        assert stats.variance == 0.0
+
+
+class TestGateAccumulator:
+    def test_report_matches_evaluator(self):
+        rng = random.Random(3)
+        graders = ["compliance_gap_detection", "compliance_remediation", "safe_area_suggestion_quality"]
+        results = [
+            _make_result(f"s{i}", rng.choice(graders), rng.choice([0.0, 0.5, 1.0]))
+            for i in range(60)
+        ]
+        accumulator = GateAccumulator()
+        accumulator.start()
+        for result in results:
+            accumulator.observe(result)
+        expected = QualityGateEvaluator().evaluate(results)
+        report = accumulator.report()
+        assert [g.actual_value for g in report.gate_results] == [g.actual_value for g in expected.gate_results]
+        assert report.all_passed == expected.all_passed
+
+    def test_projection(self):
+        gate = QualityGate(metric="compliance_gap_detection", threshold=0.75)
+        accumulator = GateAccumulator(gates=[gate])
+        accumulator.start({f"s{i}": ["compliance_gap_detection"] for i in range(4)})
+        assert accumulator.projection(gate) == "pending"
+        accumulator.observe(_make_result("s0", "compliance_gap_detection", 1.0))
+        assert accumulator.projection(gate) == "uncertain"
+        accumulator.observe(_make_result("s1", "compliance_gap_detection", 0.0))
+        accumulator.observe(_make_result("s2", "compliance_gap_detection", 0.0))
+        # Best case is now (1 + 0 + 0 + 1) / 4 = 0.5
+        assert accumulator.projection(gate) == "lost"
+        assert accumulator.should_stop() is False
+
+    def test_complete_run_is_decided(self):
+        gate = QualityGate(metric="compliance_gap_detection", threshold=0.75)
+        accumulator = GateAccumulator(gates=[gate])
+        accumulator.start({"s0": ["compliance_gap_detection"], "s1": ["compliance_gap_detection"]})
+        accumulator.observe(_make_result("s0", "compliance_gap_detection", 1.0))
+        accumulator.observe(_make_result("s1", "compliance_gap_detection", 1.0))
+        assert accumulator.projection(gate) == "pass"
+
+    def test_unknown_plan_is_never_lost(self):
+        gate = QualityGate(metric="compliance_gap_detection", threshold=0.75)
+        accumulator = GateAccumulator(gates=[gate])
+        accumulator.start()
+        accumulator.observe(_make_result("s0", "compliance_gap_detection", 0.0))
+        assert accumulator.best_case(gate) == 1.0
+        assert accumulator.projection(gate) != "lost"
+
+    def test_listener_called_per_result(self):
+        seen = []
+        accumulator = GateAccumulator(listener=lambda acc: seen.append(acc.completed))
+        accumulator.start()
+        for i in range(3):
+            accumulator.observe(_make_result(f"s{i}", "compliance_gap_detection", 1.0))
+        assert seen == [1, 2, 3]
+
+    def test_status_line(self):
+        accumulator = GateAccumulator()
+        accumulator.start()
+        accumulator.observe(_make_result("s0", "compliance_gap_detection", 0.5))
+        line = accumulator.status_line()
+        assert line.startswith("1 done")
+        assert "compliance_gap_detection_recall 0.500 (n=1" in line
+
+    def test_executor_observes_streamed_scenarios(self):
+        scenarios = query_scenarios(grader="compliance_gap_detection")
+        grader = ComplianceGapGrader()
+        executor = EvalExecutor(agent=MockAgent(), graders={grader.name: grader}, skip_model_graders=True)
+        accumulator = GateAccumulator()
+        results = executor.run_scenarios(iter(scenarios), tracker=accumulator)
+        assert len(results) == len(scenarios)
+        assert accumulator.completed == len(scenarios)
+        expected = QualityGateEvaluator().evaluate(results)
+        assert [g.actual_value for g in accumulator.report().gate_results] == [
+            g.actual_value for g in expected.gate_results
+        ]
+
+
+class TestLiveStatus:
+    def test_redraws_in_place_and_ends_line(self):
+        stream = io.StringIO()
+        live = LiveStatus(stream, interval=0.0)
+        accumulator = GateAccumulator(listener=live)
+        accumulator.start()
+        accumulator.observe(_make_result("s0", "compliance_gap_detection", 1.0))
+        accumulator.observe(_make_result("s1", "compliance_gap_detection", 1.0))
+        live.close()
+        output = stream.getvalue()
+        assert output.count("\r") == 3
+        assert output.endswith("\n")
+        assert "2 done" in output
+
+    def test_close_without_results_writes_nothing(self):
+        stream = io.StringIO()
+        LiveStatus(stream).close()
+        assert stream.getvalue() == ""
@@ -0,0 +1,82 @@
+"""Tests for the parametric scenario generator."""
+
+import json
+
+import pytest
+
+from eval_caregiver.agent.generated_agent import GeneratedAgent
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.graders.code_based.compliance_remediation import ComplianceRemediationGrader
+from eval_caregiver.graders.code_based.geo_restriction import GeoRestrictionGrader
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.scenarios.generator import ScenarioGenerator, main
+from eval_caregiver.scenarios.streaming import JsonlScenarioSource
+from eval_caregiver.simulator.caregiver import ITEM_NAMES, CaregiverSimulator
+
+
+def _build_executor(generator: ScenarioGenerator) -> EvalExecutor:
+    graders = [ComplianceGapGrader(), ComplianceRemediationGrader(), GeoRestrictionGrader()]
+    return EvalExecutor(
+        agent=GeneratedAgent(generator),
+        graders={g.name: g for g in graders},
+        skip_model_graders=True,
+        max_workers=4,
+    )
+
+
+class TestScenarioGenerator:
+    def test_deterministic(self):
+        first = list(ScenarioGenerator(seed=7).scenarios(50))
+        second = list(ScenarioGenerator(seed=7).scenarios(50))
+        assert first == second
+        assert first != list(ScenarioGenerator(seed=8).scenarios(50))
+
+    def test_random_access_matches_stream(self):
+        generator = ScenarioGenerator(seed=3)
+        streamed = list(generator.scenarios(20))
+        assert generator.case(13).scenario == streamed[13]
+        assert list(generator.scenarios(5, start=10)) == streamed[10:15]
+
+    def test_ids_are_unique_and_invertible(self):
+        generator = ScenarioGenerator(seed=1)
+        ids = [s.scenario_id for s in generator.scenarios(200)]
+        assert len(set(ids)) == 200
+        assert [generator.index_of(sid) for sid in ids] == list(range(200))
+
+    def test_expected_gaps_match_setup(self):
+        generator = ScenarioGenerator(seed=2, kinds=("compliance",))
+        for scenario in generator.scenarios(100):
+            non_valid = [key for key, status in scenario.caregiver_setup.items() if status != "valid"]
+            assert len(non_valid) == len(scenario.expected_compliance_gaps)
+
+    def test_setup_keys_are_known_to_the_simulator(self):
+        for scenario in ScenarioGenerator(seed=2, kinds=("compliance",)).scenarios(20):
+            caregiver = CaregiverSimulator(scenario)
+            assert set(caregiver.statuses) <= set(ITEM_NAMES)
+            assert len(caregiver.gaps) == len(scenario.expected_compliance_gaps)
+
+    def test_clean_responses_pass_code_graders(self):
+        generator = ScenarioGenerator(seed=5, kinds=("compliance", "geo"))
+        results = _build_executor(generator).run_scenarios(generator.scenarios(200))
+        assert all(r.passed for r in results)
+
+    def test_flawed_responses_fail(self):
+        generator = ScenarioGenerator(seed=5, kinds=("compliance", "geo"), error_rate=1.0)
+        results = _build_executor(generator).run_scenarios(generator.scenarios(200))
+        failing = [r for r in results if not r.passed]
+        assert 0 < len(failing) < 200
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="Unknown scenario kinds"):
+            ScenarioGenerator(kinds=("weather",))
+        with pytest.raises(ValueError, match="error_rate"):
+            ScenarioGenerator(error_rate=1.5)
+
+    def test_main_writes_corpus_and_responses(self, tmp_path, capsys):
+        output = tmp_path / "gen.jsonl.gz"
+        responses = tmp_path / "responses"
+        assert main(["-n", "30", "-o", str(output), "--seed", "4", "--responses-dir", str(responses)]) == 0
+        scenarios = list(JsonlScenarioSource(output))
+        assert scenarios == list(ScenarioGenerator(seed=4).scenarios(30))
+        raw = json.loads((responses / f"{scenarios[0].scenario_id}.json").read_text())
+        assert set(raw) == {"transcript", "intake_record", "action_log"}
@@ -0,0 +1,150 @@
+"""Tests for the SQLite run history store."""
+
+import pytest
+
+from eval_caregiver.runner.history import RunHistory, main
+from eval_caregiver.runner.quality_gates import QualityGateEvaluator
+from eval_caregiver.runner.records import GraderRecord, ScenarioRecord
+from eval_caregiver.schemas.grader_results import JudgeUsage, RubricCriterionScore
+
+
+def _run(scores: dict[str, float], *, judged: bool = False) -> list[ScenarioRecord]:
+    results = []
+    for scenario_id, score in scores.items():
+        graders = [GraderRecord("compliance_gap_detection", score == 1.0, score)]
+        if judged:
+            graders.append(
+                GraderRecord(
+                    "safe_area_suggestion_quality",
+                    True,
+                    0.75,
+                    "LLM judge score: 3/4",
+                    (RubricCriterionScore(criterion="clarity", score=1, rationale="ok"),),
+                    JudgeUsage(model="judge", input_tokens=100, output_tokens=20, latency_s=0.5),
+                )
+            )
+        results.append(
+            ScenarioRecord(
+                scenario_id,
+                f"Scenario {scenario_id}",
+                tuple(graders),
+                passed=score == 1.0,
+                review_reasons=("check",) if score < 1.0 else (),
+                collection="compliance",
+            )
+        )
+    return results
+
+
+class TestRunHistory:
+    def setup_method(self):
+        self.evaluator = QualityGateEvaluator()
+
+    def _record(self, history, results, **kwargs):
+        return history.record_run(results, self.evaluator.evaluate(results), **kwargs)
+
+    def test_record_and_list_runs(self, tmp_path):
+        with RunHistory(tmp_path / "history.db") as history:
+            first = self._record(history, _run({"a": 1.0, "b": 0.0}), git_commit="abc123", label="main")
+            second = self._record(history, _run({"a": 1.0, "b": 1.0}), git_commit="def456")
+            runs = history.runs()
+            assert [r.run_id for r in runs] == [second, first]
+            assert runs[1].total == 2
+            assert runs[1].passed == 1
+            assert runs[1].label == "main"
+            assert [r.run_id for r in history.runs(git_commit="abc")] == [first]
+
+    def test_load_run_round_trip(self, tmp_path):
+        results = _run({"b": 0.5, "a": 1.0}, judged=True)
+        with RunHistory(tmp_path / "history.db") as history:
+            run_id = self._record(history, results)
+            loaded = history.load_run(run_id)
+        assert [r.scenario_id for r in loaded] == ["a", "b"]
+        b = loaded[1]
+        assert b.review_reasons == ("check",)
+        assert b.collection == "compliance"
+        assert b.overall_score == results[0].overall_score
+        judged = b.grader_results[1]
+        assert judged.criterion_scores[0].criterion == "clarity"
+        assert judged.judge_usage.input_tokens == 100
+
+    def test_trend_oldest_first(self, tmp_path):
+        with RunHistory(tmp_path / "history.db") as history:
+            for score in (1.0, 0.5, 0.0):
+                self._record(history, _run({"a": score}))
+            trend = history.scenario_trend("a", grader="compliance_gap_detection")
+            assert [p.score for p in trend] == [1.0, 0.5, 0.0]
+            assert [p.score for p in history.scenario_trend("a", limit=2)] == [0.5, 0.0]
+            assert history.scenario_trend("missing") == []
+
+    def test_trend_limit_counts_runs(self, tmp_path):
+        with RunHistory(tmp_path / "history.db") as history:
+            for _ in range(3):
+                self._record(history, _run({"a": 0.5}, judged=True))
+            trend = history.scenario_trend("a", limit=2)
+        assert [(p.run_id, p.grader_name) for p in trend] == [
+            (2, "compliance_gap_detection"),
+            (2, "safe_area_suggestion_quality"),
+            (3, "compliance_gap_detection"),
+            (3, "safe_area_suggestion_quality"),
+        ]
+
+    def test_criterion_scores_are_keyed(self, tmp_path):
+        results = _run({"a": 1.0}, judged=True)
+        # A repeated scenario replaces the earlier one instead of duplicating its criteria.
+        with RunHistory(tmp_path / "history.db") as history:
+            run_id = self._record(history, results + results)
+            loaded = history.load_run(run_id)
+        assert len(loaded) == 1
+        assert len(loaded[0].grader_results[1].criterion_scores) == 1
+
+    def test_regressions_worst_first(self, tmp_path):
+        with RunHistory(tmp_path / "history.db") as history:
+            base = self._record(history, _run({"a": 1.0, "b": 1.0, "c": 0.5}))
+            run = self._record(history, _run({"a": 0.5, "b": 0.0, "c": 1.0}))
+            regressions = history.regressions(base, run)
+        assert [(r.scenario_id, r.delta) for r in regressions] == [("b", -1.0), ("a", -0.5)]
+        assert regressions[0].base_passed is True
+        assert regressions[0].passed is False
+
+    def test_judge_totals(self, tmp_path):
+        with RunHistory(tmp_path / "history.db") as history:
+            run_id = self._record(history, _run({"a": 1.0, "b": 1.0}, judged=True))
+            totals = history.judge_totals(run_id)
+        assert len(totals) == 1
+        assert totals[0].grader_name == "safe_area_suggestion_quality"
+        assert (totals[0].calls, totals[0].input_tokens, totals[0].output_tokens) == (2, 200, 40)
+        assert totals[0].latency_s == 1.0
+
+    def test_resolve(self, tmp_path):
+        with RunHistory(tmp_path / "history.db") as history:
+            first = self._record(history, _run({"a": 1.0}), git_commit="abc123")
+            second = self._record(history, _run({"a": 1.0}), git_commit="def456")
+            assert history.resolve("latest") == second
+            assert history.resolve("latest~1") == first
+            assert history.resolve(str(first)) == first
+            assert history.resolve("abc") == first
+            numeric = self._record(history, _run({"a": 1.0}), git_commit="1234abcd")
+            assert history.resolve("1234") == numeric
+            with pytest.raises(ValueError, match="Unknown run: latest~5"):
+                history.resolve("latest~5")
+
+
+class TestHistoryCommand:
+    def test_queries(self, tmp_path, capsys):
+        db = tmp_path / "history.db"
+        evaluator = QualityGateEvaluator()
+        with RunHistory(db) as history:
+            for scores in ({"a": 1.0}, {"a": 0.0}):
+                results = _run(scores)
+                history.record_run(results, evaluator.evaluate(results))
+        assert main(["--db", str(db), "runs"]) == 0
+        assert main(["--db", str(db), "trend", "a"]) == 0
+        assert main(["--db", str(db), "regressions"]) == 0
+        output = capsys.readouterr().out
+        assert "Run 2 vs run 1" in output
+        assert "a  compliance_gap_detection  1.0000 -> 0.0000 (-1.0000)  now failing" in output
+
+    def test_missing_database(self, tmp_path):
+        with pytest.raises(SystemExit):
+            main(["--db", str(tmp_path / "missing.db"), "runs"])
@@ -0,0 +1,98 @@
+"""Tests for the pooled HTTP agent adapter."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from eval_caregiver.agent.http_agent import AgentHTTPError, HttpAgent
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.agent.protocol import agent_request
+from eval_caregiver.agent.stub_server import StubAgentServer
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.scenarios.loader import get_all_scenarios, get_scenario
+from eval_caregiver.schemas.scenarios import TestScenario
+
+
+@pytest.fixture
+def server():
+    with StubAgentServer() as server:
+        yield server
+
+
+class TestAgentRequest:
+    def test_strips_grading_fields(self):
+        request = agent_request(get_scenario("compliance_cpr_missing"))
+        assert request == {"scenario_id": "compliance_cpr_missing", "caregiver_setup": {"cpr_status": "missing"}}
+
+
+class TestHttpAgent:
+    def test_returns_recorded_response(self, server):
+        scenario = get_scenario("geo_over_restricted")
+        output = HttpAgent(server.url).run_scenario(scenario)
+        assert output == MockAgent().run_scenario(scenario)
+
+    def test_reuses_connections(self, server):
+        agent = HttpAgent(server.url, max_connections=2)
+        for scenario in get_all_scenarios():
+            agent.run_scenario(scenario)
+        assert server.requests == len(get_all_scenarios())
+        assert server.connections == agent.connections_opened == 1
+
+    def test_concurrency_is_capped(self, server):
+        agent = HttpAgent(server.url, max_connections=3)
+        executor = EvalExecutor(
+            agent=agent,
+            graders={ComplianceGapGrader().name: ComplianceGapGrader()},
+            max_workers=8,
+        )
+        results = executor.run_scenarios(get_all_scenarios())
+        assert not any(reason.startswith("Agent error") for r in results for reason in r.review_reasons)
+        assert agent.connections_opened <= 3
+
+    def test_retries_unavailable(self, server):
+        server.fail_next = 2
+        agent = HttpAgent(server.url, retries=2, backoff=0.0)
+        assert agent.run_scenario(get_scenario("compliance_cpr_missing")).transcript.turns
+        assert server.requests == 3
+
+    def test_gives_up_after_retries(self, server):
+        server.fail_next = 5
+        agent = HttpAgent(server.url, retries=1, backoff=0.0)
+        with pytest.raises(AgentHTTPError, match="after 2 attempt"):
+            agent.run_scenario(get_scenario("compliance_cpr_missing"))
+
+    def test_timeout_is_not_retried(self, server):
+        server.delay = 0.5
+        agent = HttpAgent(server.url, timeout=0.1, retries=3, backoff=0.0)
+        started = time.perf_counter()
+        with pytest.raises(AgentHTTPError, match="timed out"):
+            agent.run_scenario(get_scenario("compliance_cpr_missing"))
+        assert time.perf_counter() - started < 0.4
+        assert server.requests == 1
+
+    def test_backoff_releases_the_connection_slot(self, server):
+        server.fail_next = 1
+        agent = HttpAgent(server.url, max_connections=1, retries=1, backoff=0.5)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            retried = pool.submit(agent.run_scenario, get_scenario("compliance_cpr_missing"))
+            while server.requests == 0:
+                time.sleep(0.01)
+            started = time.perf_counter()
+            pool.submit(agent.run_scenario, get_scenario("geo_over_restricted")).result()
+            assert time.perf_counter() - started < 0.4
+            assert retried.result().transcript.turns
+
+    def test_client_error_is_not_retried(self, server):
+        agent = HttpAgent(server.url, retries=3, backoff=0.0)
+        unknown = TestScenario(
+            scenario_id="nonexistent", name="x", description="x", collection="x", grader_names=[]
+        )
+        with pytest.raises(AgentHTTPError, match="HTTP 404"):
+            agent.run_scenario(unknown)
+        assert server.requests == 1
+
+    def test_rejects_bad_url(self):
+        with pytest.raises(ValueError, match="http"):
+            HttpAgent("ftp://example.com/agent")
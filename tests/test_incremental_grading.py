@@ -0,0 +1,191 @@
+"""Tests for turn-streaming agents and incremental graders."""
+
+from eval_caregiver.agent.base import AgentBase, AgentOutput
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.agent.streaming import ReplayStreamingAgent, StreamingAgentBase, TurnStream
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.graders.code_based.compliance_mention import ComplianceMentionGrader
+from eval_caregiver.graders.code_based.scheduling_offer import SchedulingOfferGrader
+from eval_caregiver.graders.incremental import IncrementalGrader, TurnState
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.scenarios.loader import get_scenario
+from eval_caregiver.schemas.conversation import ConversationTurn
+from eval_caregiver.schemas.grader_results import GraderResult
+
+
+def _incremental_scenario(scenario_id: str, *extra_graders: str):
+    scenario = get_scenario(scenario_id)
+    return scenario.model_copy(
+        update={"grader_names": ["compliance_gap_mentioned", "scheduling_offered_in_conversation", *extra_graders]}
+    )
+
+
+def _graders(*graders):
+    return {g.name: g for g in graders}
+
+
+class _NoSwearingGrader(IncrementalGrader):
+    """Fails as soon as the agent says a forbidden word."""
+
+    @property
+    def name(self) -> str:
+        return "no_forbidden_words"
+
+    def begin(self, scenario):
+        grader_name = self.name
+
+        class State(TurnState):
+            def __init__(self) -> None:
+                self.violation = None
+
+            def observe(self, turn: ConversationTurn) -> None:
+                if turn.role == "agent" and "compliance" in turn.content.lower():
+                    self.violation = self.violation or turn.turn_number
+
+            @property
+            def outcome(self):
+                return False if self.violation else None
+
+            def result(self) -> GraderResult:
+                return GraderResult(grader_name=grader_name, passed=self.violation is None, score=0.0)
+
+        return State()
+
+
+class _ClosableAgent(StreamingAgentBase):
+    def __init__(self) -> None:
+        self.closed = False
+        self.inner = MockAgent()
+
+    def stream_scenario(self, scenario) -> TurnStream:
+        output = self.inner.run_scenario(scenario)
+        try:
+            for turn in output.transcript.turns:
+                yield turn
+        except GeneratorExit:
+            self.closed = True
+            raise
+        return output
+
+
+class TestIncrementalGraders:
+    def test_batch_grade_matches_transcript(self):
+        scenario = get_scenario("compliance_cpr_missing")
+        output = MockAgent().run_scenario(scenario)
+        for grader in (ComplianceMentionGrader(), SchedulingOfferGrader()):
+            result = grader.grade(
+                scenario=scenario,
+                transcript=output.transcript,
+                intake_record=output.intake_record,
+                action_log=output.action_log,
+            )
+            assert result.passed, result.details
+
+    def test_missing_mention_fails(self):
+        scenario = get_scenario("compliance_cpr_missing").model_copy(
+            update={"expected_compliance_gaps": ["CPR Certification", "TB Test"]}
+        )
+        state = ComplianceMentionGrader().begin(scenario)
+        for turn in MockAgent().run_scenario(scenario).transcript.turns:
+            state.observe(turn)
+        assert state.outcome is None
+        result = state.result()
+        assert not result.passed and result.score == 0.5
+
+    def test_all_clear_with_unmentioned_gap_fails(self):
+        scenario = get_scenario("compliance_cpr_missing")
+        state = ComplianceMentionGrader().begin(scenario)
+        state.observe(ConversationTurn(role="agent", content="You're fully compliant, welcome aboard!", turn_number=1))
+        assert state.outcome is False
+        state.observe(ConversationTurn(role="agent", content="Actually, your CPR certification is missing.", turn_number=3))
+        result = state.result()
+        assert not result.passed
+        assert "Declared the caregiver compliant at turn 1" in result.details
+
+    def test_all_clear_after_every_gap_mentioned_passes(self):
+        scenario = get_scenario("compliance_cpr_missing")
+        state = ComplianceMentionGrader().begin(scenario)
+        for gap in scenario.expected_compliance_gaps:
+            state.observe(ConversationTurn(role="agent", content=f"Your {gap} is missing.", turn_number=1))
+        state.observe(ConversationTurn(role="agent", content="Once renewed you'll be fully compliant.", turn_number=3))
+        assert state.outcome is True
+        assert state.result().passed
+
+    def test_outcome_decided_at_first_mention(self):
+        scenario = get_scenario("compliance_cpr_missing")
+        state = SchedulingOfferGrader().begin(scenario)
+        turns = MockAgent().run_scenario(scenario).transcript.turns
+        for turn in turns:
+            state.observe(turn)
+            if state.outcome:
+                break
+        assert state.result().details == "Scheduling offered at turn 5"
+
+
+class TestStreamingExecution:
+    def test_streaming_agent_runs_like_batch(self):
+        scenario = get_scenario("compliance_cpr_missing")
+        graders = _graders(ComplianceGapGrader())
+        streamed = EvalExecutor(ReplayStreamingAgent(), graders).run_scenario(scenario)
+        batch = EvalExecutor(MockAgent(), graders).run_scenario(scenario)
+        assert streamed == batch
+
+    def test_ends_early_once_every_grader_passed(self):
+        agent = ReplayStreamingAgent()
+        executor = EvalExecutor(agent, _graders(ComplianceMentionGrader(), SchedulingOfferGrader()))
+        result = executor.run_scenario(_incremental_scenario("compliance_cpr_missing"))
+        assert result.passed
+        assert agent.turns_streamed == 5
+        assert len(MockAgent().run_scenario(get_scenario("compliance_cpr_missing")).transcript.turns) == 7
+
+    def test_decided_failure_closes_stream_and_skips_graders(self):
+        agent = _ClosableAgent()
+        executor = EvalExecutor(
+            agent, _graders(ComplianceMentionGrader(), SchedulingOfferGrader(), _NoSwearingGrader(), ComplianceGapGrader())
+        )
+        scenario = _incremental_scenario(
+            "compliance_cpr_missing", "no_forbidden_words", "compliance_gap_detection"
+        )
+        result = executor.run_scenario(scenario)
+        assert agent.closed
+        assert not result.passed
+        assert [r.grader_name for r in result.grader_results] == ["no_forbidden_words"]
+        assert (
+            "Ended early after turn 1; graders not run: ['compliance_gap_mentioned', "
+            "'scheduling_offered_in_conversation', 'compliance_gap_detection']"
+        ) in result.review_reasons
+
+    def test_mixed_graders_wait_for_full_output(self):
+        agent = ReplayStreamingAgent()
+        executor = EvalExecutor(agent, _graders(ComplianceMentionGrader(), SchedulingOfferGrader(), ComplianceGapGrader()))
+        result = executor.run_scenario(_incremental_scenario("compliance_cpr_missing", "compliance_gap_detection"))
+        assert result.passed
+        assert agent.turns_streamed == 7
+        assert len(result.grader_results) == 3
+
+    def test_end_early_can_be_disabled(self):
+        agent = ReplayStreamingAgent()
+        executor = EvalExecutor(
+            agent, _graders(ComplianceMentionGrader(), SchedulingOfferGrader()), end_early=False
+        )
+        executor.run_scenario(_incremental_scenario("compliance_cpr_missing"))
+        assert agent.turns_streamed == 7
+
+    def test_cancel_reaches_only_its_stream(self):
+        agent = ReplayStreamingAgent(turn_delay=0.01)
+        scenario = get_scenario("compliance_cpr_missing")
+        first, second = scenario.model_copy(), scenario.model_copy()
+        cancelled, finished = agent.stream_scenario(first), agent.stream_scenario(second)
+        next(cancelled)
+        next(finished)
+        agent.cancel(first)
+        assert list(cancelled) == []
+        assert len(list(finished)) == 6
+        assert agent._cancelled == {}
+
+    def test_closed_stream_forgets_its_cancel_event(self):
+        agent = ReplayStreamingAgent()
+        stream = agent.stream_scenario(get_scenario("compliance_cpr_missing"))
+        next(stream)
+        stream.close()
+        assert agent._cancelled == {}
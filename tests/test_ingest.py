@@ -0,0 +1,98 @@
+"""Tests for the shared JSON ingestion layer."""
+
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.agent.protocol import AgentProtocolError, parse_agent_reply
+from eval_caregiver.agent.response_store import (
+    load_response,
+    response_from_dict,
+    response_from_json,
+    response_to_dict,
+)
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.graders.code_based.geo_restriction import GeoRestrictionGrader
+from eval_caregiver.graders.manual.review_generator import ManualReviewGenerator
+from eval_caregiver.reporting.json_report import generate_json_report, load_json_report
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.runner.quality_gates import QualityGateEvaluator
+from eval_caregiver.scenarios.loader import get_all_scenarios, get_scenario
+from eval_caregiver.schemas.ingest import main, read_json, type_adapter, validate_json
+from eval_caregiver.schemas.scenarios import ScenarioCollection
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+class TestValidateJson:
+    def test_adapters_are_cached(self):
+        assert type_adapter(dict[str, float]) is type_adapter(dict[str, float])
+
+    def test_matches_dict_validation_for_every_data_file(self):
+        for path in sorted((DATA_DIR / "scenarios").glob("*.json")):
+            expected = ScenarioCollection.model_validate(json.loads(path.read_text()))
+            assert read_json(ScenarioCollection, path) == expected
+        for path in sorted((DATA_DIR / "responses").glob("*.json")):
+            assert load_response(path) == response_from_dict(json.loads(path.read_text()))
+
+    def test_invalid_input_raises_validation_error(self):
+        with pytest.raises(ValidationError):
+            validate_json(ScenarioCollection, b'{"collection_id": "x"}')
+        with pytest.raises(ValidationError):
+            validate_json(ScenarioCollection, b"{not json")
+
+    def test_response_extra_keys_are_ignored(self):
+        output = MockAgent().run_scenario(get_scenario("compliance_cpr_missing"))
+        raw = response_to_dict(output) | {"scenario_hash": "abc", "agent_version": "v1"}
+        assert response_from_json(json.dumps(raw).encode()) == output
+
+
+class TestAgentReplyBytes:
+    def test_bytes_reply_is_validated_directly(self):
+        output = MockAgent().run_scenario(get_scenario("geo_over_restricted"))
+        body = json.dumps(response_to_dict(output)).encode()
+        assert parse_agent_reply(body, "geo_over_restricted") == output
+
+    def test_invalid_bytes_reply(self):
+        with pytest.raises(AgentProtocolError, match="Invalid reply for 's1'"):
+            parse_agent_reply(b"[1, 2]", "s1")
+
+
+class TestReloading:
+    def setup_method(self):
+        graders = [ComplianceGapGrader(), GeoRestrictionGrader()]
+        self.graders = {g.name: g for g in graders}
+
+    def test_report_round_trip(self, tmp_path):
+        results = EvalExecutor(MockAgent(), self.graders).run_scenarios(get_all_scenarios())
+        path = generate_json_report(results, QualityGateEvaluator().evaluate(results), str(tmp_path / "r.json"))
+        reloaded = load_json_report(path)
+        assert [r.scenario_id for r in reloaded] == [r.scenario_id for r in results]
+        for original, loaded in zip(results, reloaded):
+            assert loaded.passed == original.passed
+            assert loaded.review_reasons == original.review_reasons
+            assert [g.grader_name for g in loaded.grader_results] == [
+                g.grader_name for g in original.grader_results
+            ]
+            assert loaded.overall_score == pytest.approx(original.overall_score, abs=1e-4)
+
+    def test_review_files_round_trip(self, tmp_path):
+        generator = ManualReviewGenerator(output_dir=str(tmp_path))
+        executor = EvalExecutor(MockAgent(), self.graders, review_generator=generator)
+        scenario = get_scenario("compliance_cpr_missing").model_copy(update={"expected_compliance_gaps": ["TB Test"]})
+        result = executor.run_scenario(scenario)
+        assert result.needs_manual_review
+        [review] = generator.load_reviews()
+        assert review.scenario_id == "compliance_cpr_missing"
+        assert review.human_label is None
+        assert review.transcript[0].turn == 1
+        assert [g.grader for g in review.grader_results] == [g.grader_name for g in result.grader_results]
+
+
+def test_benchmark_runs(capsys):
+    assert main(["-n", "20", "--repeat", "1"]) == 0
+    out = capsys.readouterr().out
+    assert "20 responses" in out and "speedup" in out
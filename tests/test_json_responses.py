@@ -8,7 +8,7 @@ from pathlib import Path
 import pytest
 
 from eval_caregiver.agent.base import AgentOutput
-from eval_caregiver.agent.mock_agent import MockAgent, _DATA_DIR, _LOADED_RESPONSES
+from eval_caregiver.agent.mock_agent import MockAgent, _DATA_DIR, default_store
 from eval_caregiver.schemas.caregiver import StructuredIntakeRecord
 from eval_caregiver.schemas.conversation import AgentActionLog, ConversationTranscript
 from eval_caregiver.schemas.scenarios import TestScenario
@@ -24,32 +24,35 @@ def _make_scenario(scenario_id: str) -> TestScenario:
     )
 
 
+_RESPONSES = default_store()
+
+
 class TestResponseLoading:
     """Verify responses are loaded correctly from JSON."""
 
     def test_loaded_responses_not_empty(self):
-        assert len(_LOADED_RESPONSES) >= 5
+        assert len(_RESPONSES) >= 5
 
     def test_all_responses_are_agent_output(self):
-        for scenario_id, output in _LOADED_RESPONSES.items():
+        for scenario_id, output in _RESPONSES.items():
             assert isinstance(output, AgentOutput), f"{scenario_id} is not AgentOutput"
 
     def test_response_keys_match_filenames(self):
         response_files = {p.stem for p in (_DATA_DIR / "responses").glob("*.json")}
-        assert set(_LOADED_RESPONSES.keys()) == response_files
+        assert set(_RESPONSES.keys()) == response_files
 
     def test_transcripts_are_valid(self):
-        for scenario_id, output in _LOADED_RESPONSES.items():
+        for scenario_id, output in _RESPONSES.items():
             assert isinstance(output.transcript, ConversationTranscript)
             assert output.transcript.scenario_id == scenario_id
 
     def test_intake_records_are_valid(self):
-        for scenario_id, output in _LOADED_RESPONSES.items():
+        for scenario_id, output in _RESPONSES.items():
             assert isinstance(output.intake_record, StructuredIntakeRecord)
             assert output.intake_record.caregiver.caregiver_id
 
     def test_action_logs_are_valid(self):
-        for scenario_id, output in _LOADED_RESPONSES.items():
+        for scenario_id, output in _RESPONSES.items():
             assert isinstance(output.action_log, AgentActionLog)
             assert output.action_log.scenario_id == scenario_id
 
@@ -62,7 +65,7 @@ class TestMockAgentJsonIntegration:
 
     def test_run_all_loaded_scenarios(self):
         """Every loaded response can be retrieved via run_scenario."""
-        for scenario_id in _LOADED_RESPONSES:
+        for scenario_id in _RESPONSES:
             output = self.agent.run_scenario(_make_scenario(scenario_id))
             assert output.transcript.scenario_id == scenario_id
 
@@ -90,7 +93,7 @@ class TestMockAgentJsonIntegration:
         for path in sorted((_DATA_DIR / "responses").glob("*.json")):
             raw = json.loads(path.read_text())
             scenario_id = path.stem
-            output = _LOADED_RESPONSES[scenario_id]
+            output = _RESPONSES[scenario_id]
 
             # Re-serialize and compare
             reserialized = {
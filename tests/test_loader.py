@@ -7,12 +7,16 @@ from pathlib import Path
 
 import pytest
 
+from eval_caregiver.scenarios import loader
 from eval_caregiver.scenarios.loader import (
     _DATA_DIR,
     get_all_collections,
     get_all_scenarios,
     get_collection,
+    ScenarioRegistry,
+    get_collection_ids,
     get_scenario,
+    query_scenarios,
 )
 from eval_caregiver.schemas.scenarios import ScenarioCollection, TestScenario
 
@@ -183,3 +187,91 @@ class TestGetScenario:
     def test_error_lists_available(self):
         with pytest.raises(ValueError, match="compliance_cpr_missing"):
             get_scenario("nonexistent_scenario")
+
+
+def _fresh_registry(monkeypatch) -> ScenarioRegistry:
+    registry = ScenarioRegistry.from_directory(_DATA_DIR / "scenarios")
+    monkeypatch.setattr(loader, "_REGISTRY", registry)
+    return registry
+
+
+class TestLazyLoading:
+    def test_collection_ids_match_files(self):
+        assert get_collection_ids() == sorted(p.stem for p in (_DATA_DIR / "scenarios").glob("*.json"))
+
+    def test_only_requested_collection_is_parsed(self, monkeypatch):
+        registry = _fresh_registry(monkeypatch)
+        get_collection("geo_over_restriction_cases")
+        assert registry.loaded_collection_ids == ["geo_over_restriction_cases"]
+
+    def test_collection_parsed_once(self, monkeypatch):
+        _fresh_registry(monkeypatch)
+        assert get_collection("compliance_missing_cases") is get_collection("compliance_missing_cases")
+
+    def test_get_scenario_stops_at_owning_collection(self, monkeypatch):
+        registry = _fresh_registry(monkeypatch)
+        get_scenario("compliance_cpr_missing")
+        assert registry.loaded_collection_ids == ["compliance_missing_cases"]
+
+
+class TestQueryScenarios:
+    def test_no_filters_returns_everything(self):
+        assert [s.scenario_id for s in query_scenarios()] == [s.scenario_id for s in get_all_scenarios()]
+
+    def test_by_collection_loads_only_that_collection(self, monkeypatch):
+        registry = _fresh_registry(monkeypatch)
+        result = query_scenarios(collection="compliance_missing_cases")
+        assert len(result) == 3
+        assert registry.loaded_collection_ids == ["compliance_missing_cases"]
+
+    def test_by_grader(self):
+        result = query_scenarios(grader="geo_restriction_detection")
+        assert result
+        assert all("geo_restriction_detection" in s.grader_names for s in result)
+
+    def test_combined_filters(self):
+        result = query_scenarios(grader="compliance_remediation", required=True)
+        expected = {
+            s.scenario_id
+            for s in get_all_scenarios()
+            if "compliance_remediation" in s.grader_names and s.required
+        }
+        assert {s.scenario_id for s in result} == expected
+
+    def test_required_false(self):
+        assert all(not s.required for s in query_scenarios(required=False))
+
+    def test_unknown_grader_matches_nothing(self):
+        assert query_scenarios(grader="no_such_grader") == []
+
+    def test_duplicate_ids_rejected(self, tmp_path):
+        scenario = {
+            "scenario_id": "dup",
+            "name": "Dup",
+            "description": "Dup",
+            "collection": "c1",
+            "grader_names": [],
+        }
+        (tmp_path / "c1.json").write_text(json.dumps(
+            {"collection_id": "c1", "name": "C1", "description": "C1", "scenarios": [scenario, scenario]}
+        ))
+        registry = ScenarioRegistry.from_directory(tmp_path)
+        with pytest.raises(ValueError, match="Duplicate scenario_id"):
+            registry.collection("c1")
+
+    def test_duplicate_ids_across_files_caught_once_both_load(self, tmp_path):
+        for collection_id in ("c1", "c2"):
+            scenario = {
+                "scenario_id": "dup",
+                "name": "Dup",
+                "description": "Dup",
+                "collection": collection_id,
+                "grader_names": [],
+            }
+            (tmp_path / f"{collection_id}.json").write_text(json.dumps(
+                {"collection_id": collection_id, "name": "C", "description": "C", "scenarios": [scenario]}
+            ))
+        registry = ScenarioRegistry.from_directory(tmp_path)
+        assert [s.scenario_id for s in registry.collection("c1").scenarios] == ["dup"]
+        with pytest.raises(ValueError, match=r"Duplicate scenario_id 'dup' in c2\.json"):
+            registry.load_all()
@@ -1,8 +1,11 @@
 """Tests for mock agent."""
 
+import shutil
+
 import pytest
 
-from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.agent.mock_agent import _DATA_DIR, MockAgent, default_store
+from eval_caregiver.agent.response_store import ResponseStore
 from eval_caregiver.schemas.scenarios import TestScenario
 
 
@@ -68,3 +71,40 @@ class TestMockAgent:
         self.agent.register("custom_scenario", custom_builder)
         output = self.agent.run_scenario(self._make_scenario("custom_scenario"))
         assert output.intake_record.caregiver.caregiver_id == "custom"
+
+
+class TestResponseStore:
+    def _store(self, tmp_path, **kwargs) -> ResponseStore:
+        responses_dir = tmp_path / "responses"
+        shutil.copytree(_DATA_DIR / "responses", responses_dir)
+        return ResponseStore(responses_dir, **kwargs)
+
+    def test_indexes_without_parsing(self, tmp_path):
+        store = self._store(tmp_path)
+        assert "compliance_cpr_missing" in store
+        assert len(store) == len(list((_DATA_DIR / "responses").glob("*.json")))
+        assert store.cached_ids == []
+
+    def test_parses_on_first_lookup_only(self, tmp_path):
+        store = self._store(tmp_path)
+        first = store["compliance_cpr_missing"]
+        assert store["compliance_cpr_missing"] is first
+        assert (store.misses, store.hits) == (1, 1)
+
+    def test_lru_bound(self, tmp_path):
+        store = self._store(tmp_path, max_cached=2)
+        store["compliance_cpr_missing"]
+        store["compliance_cpr_unknown"]
+        store["compliance_cpr_missing"]
+        store["geo_over_restricted"]
+        assert store.cached_ids == ["compliance_cpr_missing", "geo_over_restricted"]
+
+    def test_corrupt_file_only_fails_its_lookup(self, tmp_path):
+        store = self._store(tmp_path)
+        (tmp_path / "responses" / "geo_no_alternatives.json").write_text("{")
+        assert store["compliance_cpr_missing"].transcript.turns
+        with pytest.raises(ValueError):
+            store["geo_no_alternatives"]
+
+    def test_default_agents_share_one_store(self):
+        assert MockAgent()._responses is MockAgent()._responses is default_store()
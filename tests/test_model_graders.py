@@ -19,6 +19,8 @@ def _make_mock_response(scores: list[dict]) -> MagicMock:
     content_block.text = json.dumps({"scores": scores})
     response = MagicMock()
     response.content = [content_block]
+    response.usage.input_tokens = 120
+    response.usage.output_tokens = 40
     return response
 
 
@@ -56,6 +58,9 @@ class TestLLMJudgeEngine:
         assert result.passed is True
         assert result.score == 1.0
         assert len(result.criterion_scores) == 2
+        assert result.judge_usage.input_tokens == 120
+        assert result.judge_usage.output_tokens == 40
+        assert result.judge_usage.latency_s >= 0.0
 
     @patch("eval_caregiver.graders.model_based.llm_judge.anthropic.Anthropic")
     def test_evaluate_with_rubric_low_scores(self, mock_anthropic_cls):
@@ -100,6 +105,20 @@ class TestSchedulingHelpfulnessGrader:
         assert result.passed is True
         assert len(result.criterion_scores) == 3
 
+    @patch("eval_caregiver.graders.model_based.llm_judge.anthropic.Anthropic")
+    def test_client_reused_across_calls(self, mock_anthropic_cls):
+        mock_client = MagicMock()
+        mock_anthropic_cls.return_value = mock_client
+        mock_client.messages.create.return_value = _make_mock_response([
+            {"criterion": "clarity", "score": 2, "rationale": "Clear explanation"},
+        ])
+
+        grader = SchedulingHelpfulnessGrader()
+        grader.grade(transcript=_make_transcript())
+        grader.grade(transcript=_make_transcript())
+        assert mock_anthropic_cls.call_count == 1
+        assert mock_client.messages.create.call_count == 2
+
 
 class TestSafetyMapSuggestionsGrader:
     @patch("eval_caregiver.graders.model_based.llm_judge.anthropic.Anthropic")
@@ -119,3 +138,14 @@ class TestSafetyMapSuggestionsGrader:
         result = grader.grade(transcript=_make_transcript())
         assert result.grader_name == "safe_area_suggestion_quality"
         assert result.passed is True
+
+    @patch("eval_caregiver.graders.model_based.llm_judge.anthropic.Anthropic")
+    def test_timeout_forwarded_to_judge(self, mock_anthropic_cls):
+        mock_client = MagicMock()
+        mock_anthropic_cls.return_value = mock_client
+        mock_client.messages.create.return_value = _make_mock_response([
+            {"criterion": "map_referenced", "score": 2, "rationale": "Referenced safety map"},
+        ])
+
+        SafetyMapSuggestionsGrader().grade(transcript=_make_transcript(), timeout=12.5)
+        assert mock_client.messages.create.call_args.kwargs["timeout"] == 12.5
@@ -0,0 +1,71 @@
+"""Tests for the packed, memory-mapped response store."""
+
+import json
+import multiprocessing
+
+import pytest
+
+from eval_caregiver.agent.mock_agent import _DATA_DIR, MockAgent
+from eval_caregiver.agent.packed_store import PackedResponseStore, pack_responses
+from eval_caregiver.agent.response_store import load_response
+from eval_caregiver.schemas.scenarios import TestScenario
+
+_RESPONSES_DIR = _DATA_DIR / "responses"
+
+
+def _count_in_child(path) -> int:
+    with PackedResponseStore(path) as store:
+        return sum(1 for sid in store if store[sid].transcript.scenario_id == sid)
+
+
+@pytest.fixture
+def pack_path(tmp_path):
+    path = tmp_path / "responses.pack"
+    pack_responses(_RESPONSES_DIR, path)
+    return path
+
+
+class TestPackedResponseStore:
+    def test_pack_contains_every_response(self, pack_path):
+        with PackedResponseStore(pack_path) as store:
+            assert set(store) == {p.stem for p in _RESPONSES_DIR.glob("*.json")}
+
+    def test_raw_bytes_match_source(self, pack_path):
+        with PackedResponseStore(pack_path) as store:
+            view = store.raw("compliance_cpr_missing")
+            assert bytes(view) == (_RESPONSES_DIR / "compliance_cpr_missing.json").read_bytes()
+            view.release()
+
+    def test_decoded_record_matches_json_file(self, pack_path):
+        with PackedResponseStore(pack_path) as store:
+            for path in _RESPONSES_DIR.glob("*.json"):
+                assert store[path.stem] == load_response(path)
+            assert len(store.cached_ids) == len(store)
+
+    def test_only_requested_record_is_decoded(self, pack_path):
+        with PackedResponseStore(pack_path) as store:
+            store["geo_over_restricted"]
+            assert store.cached_ids == ["geo_over_restricted"]
+
+    def test_rejects_non_pack_file(self, tmp_path):
+        path = tmp_path / "bogus.pack"
+        path.write_bytes(json.dumps({"not": "a pack"}).encode().ljust(64))
+        with pytest.raises(ValueError, match="not a version 1 response pack"):
+            PackedResponseStore(path)
+
+    def test_mock_agent_serves_from_pack(self, pack_path):
+        with PackedResponseStore(pack_path) as store:
+            agent = MockAgent(responses=store)
+            scenario = TestScenario(
+                scenario_id="compliance_cpr_missing",
+                name="Test",
+                description="Test scenario",
+                collection="test",
+                grader_names=[],
+            )
+            assert "CPR Certification" in agent.run_scenario(scenario).intake_record.compliance_gaps
+
+    def test_shared_across_processes(self, pack_path):
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            counts = pool.map(_count_in_child, [pack_path, pack_path])
+        assert counts == [len(list(_RESPONSES_DIR.glob("*.json")))] * 2
@@ -2,8 +2,10 @@
 
 from eval_caregiver.runner.quality_gates import (
     DEFAULT_GATES,
+    FailFastTracker,
     QualityGate,
     QualityGateEvaluator,
+    mean_confidence_interval,
 )
 from eval_caregiver.schemas.grader_results import GraderResult, ScenarioResult
 
@@ -77,3 +79,70 @@ class TestQualityGateEvaluator:
         gap_gate = next(gr for gr in report.gate_results if gr.gate.metric == "compliance_gap_detection_recall")
         assert gap_gate.actual_value == 0.75
         assert gap_gate.passed is False  # 0.75 < 0.95
+
+
+class TestFailFastTracker:
+    def test_gate_still_reachable(self):
+        tracker = FailFastTracker(gates=[QualityGate(metric="compliance_gap_detection", threshold=0.75)])
+        tracker.start({"s1": ["compliance_gap_detection"], "s2": ["compliance_gap_detection"]})
+        tracker.observe(_make_result("s1", "compliance_gap_detection", 0.5, False))
+        # Best case: (0.5 + 1.0) / 2 = 0.75
+        assert tracker.should_stop() is False
+        assert tracker.early_stop is None
+
+    def test_gate_lost(self):
+        tracker = FailFastTracker()
+        tracker.start({
+            "s1": ["compliance_gap_detection"],
+            "s2": ["compliance_gap_detection"],
+            "s3": ["compliance_remediation"],
+        })
+        tracker.observe(_make_result("s1", "compliance_gap_detection", 0.0, False))
+        assert tracker.should_stop() is True
+        assert tracker.early_stop.lost_gates == ["compliance_gap_detection_recall"]
+        assert tracker.early_stop.completed_scenarios == 1
+        assert tracker.early_stop.skipped_scenario_ids == ["s2", "s3"]
+
+    def test_unplanned_gate_never_lost(self):
+        tracker = FailFastTracker()
+        tracker.start({"s1": ["compliance_remediation"]})
+        assert tracker.lost_gates() == []
+
+
+class TestSampledEvaluation:
+    def test_complete_sample_has_zero_width(self):
+        assert mean_confidence_interval([0.5, 1.0], 2, 1.96) == (0.75, 0.75)
+
+    def test_perfect_small_sample_is_not_certain(self):
+        low, high = mean_confidence_interval([1.0, 1.0, 1.0], 100, 1.96)
+        assert low < 0.95
+        assert high == 1.0
+
+    def test_interval_narrows_with_sample_size(self):
+        small = mean_confidence_interval([0.9] * 10, 1000, 1.96)
+        large = mean_confidence_interval([0.9] * 500, 1000, 1.96)
+        assert large[1] - large[0] < small[1] - small[0]
+
+    def test_inconclusive_gate(self):
+        evaluator = QualityGateEvaluator(gates=[QualityGate(metric="compliance_gap_detection", threshold=0.95)])
+        results = [_make_result("s1", "compliance_gap_detection", 1.0, True)]
+        report = evaluator.evaluate_sample(results, {"compliance_gap_detection": 50})
+        gate = report.gate_results[0]
+        assert gate.conclusive is False
+        assert gate.sample_size == 1
+
+    def test_conclusive_failure(self):
+        evaluator = QualityGateEvaluator(gates=[QualityGate(metric="compliance_gap_detection", threshold=0.95)])
+        results = [_make_result(f"s{i}", "compliance_gap_detection", 0.0, False) for i in range(10)]
+        report = evaluator.evaluate_sample(results, {"compliance_gap_detection": 50})
+        assert report.gate_results[0].conclusive is True
+        assert report.all_passed is False
+
+    def test_weights_reweight_the_estimate(self):
+        evaluator = QualityGateEvaluator(gates=[QualityGate(metric="compliance_gap_detection", threshold=0.5)])
+        results = [
+            _make_result("big", "compliance_gap_detection", 1.0, True),
+            _make_result("small", "compliance_gap_detection", 0.0, False),
+        ]
+        report = evaluator.evaluate_sample(results, {"compliance_gap_detection": 40}, weights=[30.0, 10.0])
+        assert report.gate_results[0].actual_value == 0.75
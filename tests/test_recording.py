@@ -0,0 +1,73 @@
+"""Tests for the record-and-replay agent wrapper."""
+
+import pytest
+
+from eval_caregiver.agent.base import AgentBase, AgentOutput
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.agent.recording import CassetteMissError, RecordingAgent, scenario_hash
+from eval_caregiver.agent.response_store import ResponseStore
+from eval_caregiver.scenarios.loader import get_scenario
+
+
+class CountingAgent(AgentBase):
+    def __init__(self) -> None:
+        self.inner = MockAgent()
+        self.calls = 0
+
+    def run_scenario(self, scenario) -> AgentOutput:
+        self.calls += 1
+        return self.inner.run_scenario(scenario)
+
+
+class TestRecordingAgent:
+    def setup_method(self):
+        self.scenario = get_scenario("compliance_cpr_missing")
+
+    def test_records_then_replays(self, tmp_path):
+        inner = CountingAgent()
+        agent = RecordingAgent(inner, tmp_path, agent_version="v1")
+        first = agent.run_scenario(self.scenario)
+        second = agent.run_scenario(self.scenario)
+        assert inner.calls == 1
+        assert (agent.recorded, agent.replayed) == (1, 1)
+        assert second == first
+
+    def test_cassettes_are_mock_agent_compatible(self, tmp_path):
+        RecordingAgent(MockAgent(), tmp_path, agent_version="v1").run_scenario(self.scenario)
+        replayer = MockAgent(responses=ResponseStore(tmp_path / "v1"))
+        assert replayer.run_scenario(self.scenario) == MockAgent().run_scenario(self.scenario)
+
+    def test_versions_are_separate(self, tmp_path):
+        RecordingAgent(MockAgent(), tmp_path, agent_version="v1").run_scenario(self.scenario)
+        inner = CountingAgent()
+        RecordingAgent(inner, tmp_path, agent_version="v2").run_scenario(self.scenario)
+        assert inner.calls == 1
+
+    def test_changed_scenario_is_rerecorded(self, tmp_path):
+        inner = CountingAgent()
+        agent = RecordingAgent(inner, tmp_path, agent_version="v1")
+        agent.run_scenario(self.scenario)
+        edited = self.scenario.model_copy(update={"description": "Edited"})
+        assert scenario_hash(edited) != scenario_hash(self.scenario)
+        agent.run_scenario(edited)
+        assert inner.calls == 2
+
+    def test_replay_mode_never_calls_agent(self, tmp_path):
+        RecordingAgent(MockAgent(), tmp_path, agent_version="v1").run_scenario(self.scenario)
+        replay = RecordingAgent(None, tmp_path, agent_version="v1", mode="replay")
+        assert replay.run_scenario(self.scenario).transcript.scenario_id == "compliance_cpr_missing"
+        with pytest.raises(CassetteMissError, match="geo_over_restricted"):
+            replay.run_scenario(get_scenario("geo_over_restricted"))
+
+    def test_record_mode_overwrites(self, tmp_path):
+        inner = CountingAgent()
+        agent = RecordingAgent(inner, tmp_path, agent_version="v1", mode="record")
+        agent.run_scenario(self.scenario)
+        agent.run_scenario(self.scenario)
+        assert inner.calls == 2
+
+    def test_invalid_configuration(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown cassette mode"):
+            RecordingAgent(MockAgent(), tmp_path, agent_version="v1", mode="rewind")
+        with pytest.raises(ValueError, match="required"):
+            RecordingAgent(None, tmp_path, agent_version="v1")
@@ -0,0 +1,90 @@
+"""Tests for the compact internal result records."""
+
+import dataclasses
+import json
+
+import pytest
+
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.graders.code_based.compliance_remediation import ComplianceRemediationGrader
+from eval_caregiver.reporting.json_report import generate_json_report
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.runner.quality_gates import QualityGateEvaluator
+from eval_caregiver.runner.records import GraderRecord, ScenarioRecord
+from eval_caregiver.scenarios.loader import get_collection
+from eval_caregiver.schemas.grader_results import GraderResult, RubricCriterionScore, ScenarioResult
+
+
+def _result() -> ScenarioResult:
+    return ScenarioResult(
+        scenario_id="s1",
+        scenario_name="S1",
+        grader_results=[
+            GraderResult(grader_name="g1", passed=True, score=1.0, details="ok"),
+            GraderResult(
+                grader_name="g2",
+                passed=False,
+                score=0.5,
+                criterion_scores=[RubricCriterionScore(criterion="clarity", score=1, rationale="vague")],
+            ),
+        ],
+        passed=False,
+        needs_manual_review=True,
+        review_reasons=["1 grader(s) failed: ['g2']"],
+    )
+
+
+class TestRecords:
+    def test_round_trip(self):
+        result = _result()
+        record = ScenarioRecord.from_result(result)
+        assert record.to_result() == result
+        assert record.to_result().model_dump() == result.model_dump()
+
+    def test_overall_score_computed_at_construction(self):
+        record = ScenarioRecord.from_result(_result())
+        assert record.overall_score == pytest.approx(0.75)
+        assert ScenarioRecord(scenario_id="s", scenario_name="S").overall_score == 0.0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.overall_score = 1.0
+
+    def test_records_have_no_instance_dict(self):
+        record = ScenarioRecord.from_result(_result())
+        assert not hasattr(record, "__dict__")
+        assert not hasattr(record.grader_results[0], "__dict__")
+
+    def test_grader_record_mirrors_model(self):
+        gr = GraderRecord("g", True, 0.9)
+        assert gr.to_result() == GraderResult(grader_name="g", passed=True, score=0.9)
+
+
+class TestExecutorRecords:
+    def setup_method(self):
+        graders = [ComplianceGapGrader(), ComplianceRemediationGrader()]
+        self.executor = EvalExecutor(agent=MockAgent(), graders={g.name: g for g in graders})
+        self.scenarios = get_collection("compliance_missing_cases").scenarios
+
+    def test_executor_yields_records(self):
+        results = self.executor.run_scenarios(self.scenarios)
+        assert all(isinstance(r, ScenarioRecord) for r in results)
+        assert all(isinstance(gr, GraderRecord) for r in results for gr in r.grader_results)
+
+    def test_reports_and_gates_match_pydantic_results(self, tmp_path):
+        records = self.executor.run_scenarios(self.scenarios)
+        models = [r.to_result() for r in records]
+        evaluator = QualityGateEvaluator()
+        gates_from_records = evaluator.evaluate(records)
+        gates_from_models = evaluator.evaluate(models)
+        assert [g.actual_value for g in gates_from_records.gate_results] == [
+            g.actual_value for g in gates_from_models.gate_results
+        ]
+        from_records = generate_json_report(records, gates_from_records, str(tmp_path / "a.json"))
+        from_models = generate_json_report(models, gates_from_models, str(tmp_path / "b.json"))
+        report_from_records = json.loads(from_records.read_text())
+        report_from_models = json.loads(from_models.read_text())
+        # Only records know their collection.
+        collections = report_from_records["breakdowns"].pop("collections")
+        assert collections["compliance_missing_cases"]["required"] == 2
+        assert report_from_models["breakdowns"].pop("collections")[""]["scenarios"] == 3
+        assert report_from_records == report_from_models
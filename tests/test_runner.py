@@ -1,10 +1,15 @@
 """Tests for the evaluation executor."""
 
+import threading
+
+from eval_caregiver.agent.base import AgentBase
 from eval_caregiver.agent.mock_agent import MockAgent
 from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
 from eval_caregiver.graders.code_based.compliance_remediation import ComplianceRemediationGrader
 from eval_caregiver.graders.code_based.geo_restriction import GeoRestrictionGrader
 from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.runner.quality_gates import FailFastTracker, QualityGate, QualityGateEvaluator
+from eval_caregiver.runner.timeouts import TimeoutConfig
 from eval_caregiver.scenarios.loader import get_all_scenarios, get_collection
 
 
@@ -13,6 +18,24 @@ def _build_graders():
     return {g.name: g for g in graders}
 
 
+class _HangingAgent(AgentBase):
+    """Agent that blocks until released, for timeout tests."""
+
+    def __init__(self, hang_on: set[str]) -> None:
+        self._mock = MockAgent()
+        self._hang_on = hang_on
+        self.release = threading.Event()
+        self.cancelled: list[str] = []
+
+    def run_scenario(self, scenario):
+        if scenario.scenario_id in self._hang_on:
+            self.release.wait(5)
+        return self._mock.run_scenario(scenario)
+
+    def cancel(self, scenario):
+        self.cancelled.append(scenario.scenario_id)
+
+
 class TestEvalExecutor:
     def test_run_single_scenario(self):
         agent = MockAgent()
@@ -82,3 +105,132 @@ class TestEvalExecutor:
         result = executor.run_scenario(negative_scenario)
         assert result.needs_manual_review is True
         assert len(result.review_reasons) > 0
+
+    def test_iter_results_streams_in_order(self):
+        agent = MockAgent()
+        executor = EvalExecutor(agent=agent, graders=_build_graders(), skip_model_graders=True)
+
+        scenarios = get_collection("compliance_missing_cases").scenarios
+        ids = [r.scenario_id for r in executor.iter_results(scenarios)]
+        assert ids == [s.scenario_id for s in scenarios]
+
+    def test_fail_fast_stops_when_gate_lost(self):
+        agent = MockAgent()
+        executor = EvalExecutor(agent=agent, graders=_build_graders(), skip_model_graders=True)
+
+        collection = get_collection("geo_over_restriction_cases")
+        # geo_no_alternatives scores 0.0, so a perfect-score gate is lost immediately
+        scenarios = [collection.scenarios[1], collection.scenarios[0]]
+        tracker = FailFastTracker(gates=[QualityGate(metric="geo_restriction_detection", threshold=1.0)])
+        results = executor.run_scenarios(scenarios, tracker=tracker)
+
+        assert [r.scenario_id for r in results] == ["geo_no_alternatives"]
+        assert tracker.early_stop is not None
+        assert tracker.early_stop.skipped_scenario_ids == ["geo_over_restricted"]
+
+    def test_fail_fast_runs_everything_when_gates_hold(self):
+        agent = MockAgent()
+        executor = EvalExecutor(agent=agent, graders=_build_graders(), skip_model_graders=True)
+
+        scenarios = get_collection("compliance_missing_cases").scenarios
+        tracker = FailFastTracker()
+        results = executor.run_scenarios(scenarios, tracker=tracker)
+        assert len(results) == len(scenarios)
+        assert tracker.early_stop is None
+
+    def test_worker_pool_preserves_input_order(self):
+        agent = MockAgent()
+        executor = EvalExecutor(agent=agent, graders=_build_graders(), skip_model_graders=True, max_workers=4)
+
+        scenarios = get_all_scenarios()
+        results = executor.run_scenarios(scenarios)
+        assert [r.scenario_id for r in results] == [s.scenario_id for s in scenarios]
+
+
+class TestTimeouts:
+    def test_agent_timeout_produces_failed_result(self):
+        agent = _HangingAgent(hang_on={"compliance_cpr_missing"})
+        executor = EvalExecutor(
+            agent=agent,
+            graders=_build_graders(),
+            skip_model_graders=True,
+            timeouts=TimeoutConfig(agent=0.05),
+        )
+        try:
+            result = executor.run_scenario(get_collection("compliance_missing_cases").scenarios[0])
+        finally:
+            agent.release.set()
+
+        assert result.passed is False
+        assert result.needs_manual_review is True
+        assert result.review_reasons[0].startswith("Timed out: agent")
+        assert agent.cancelled == ["compliance_cpr_missing"]
+
+    def test_hung_scenario_frees_worker_slot(self):
+        agent = _HangingAgent(hang_on={"compliance_cpr_missing"})
+        executor = EvalExecutor(
+            agent=agent,
+            graders=_build_graders(),
+            skip_model_graders=True,
+            timeouts=TimeoutConfig(scenario=0.1),
+        )
+        try:
+            results = executor.run_scenarios(get_collection("compliance_missing_cases").scenarios)
+        finally:
+            agent.release.set()
+
+        assert results[0].passed is False
+        assert all(r.passed for r in results[1:])
+
+    def test_grader_timeout_fails_only_that_grader(self):
+        class SlowGrader(ComplianceGapGrader):
+            def grade(self, **kwargs):
+                threading.Event().wait(1)
+                return super().grade(**kwargs)
+
+        graders = _build_graders()
+        graders["compliance_gap_detection"] = SlowGrader()
+        executor = EvalExecutor(
+            agent=MockAgent(),
+            graders=graders,
+            skip_model_graders=True,
+            timeouts=TimeoutConfig(grader=0.05),
+        )
+        result = executor.run_scenario(get_collection("compliance_missing_cases").scenarios[0])
+        assert result.passed is False
+        timed_out, remediation = result.grader_results
+        assert (timed_out.grader_name, timed_out.passed, timed_out.score) == ("compliance_gap_detection", False, 0.0)
+        assert remediation.grader_name == "compliance_remediation"
+        assert remediation.passed is True
+        assert "compliance_gap_detection" in result.review_reasons[0]
+
+    def test_aborted_scenarios_fail_the_gates(self):
+        agent = _HangingAgent(hang_on={"compliance_cpr_missing"})
+        executor = EvalExecutor(
+            agent=agent,
+            graders=_build_graders(),
+            skip_model_graders=True,
+            timeouts=TimeoutConfig(agent=0.05),
+        )
+        try:
+            result = executor.run_scenario(get_collection("compliance_missing_cases").scenarios[0])
+        finally:
+            agent.release.set()
+        assert [(gr.grader_name, gr.score) for gr in result.grader_results] == [
+            ("compliance_gap_detection", 0.0),
+            ("compliance_remediation", 0.0),
+        ]
+        assert result.grader_results[0].details.startswith("Not run: Timed out: agent")
+        report = QualityGateEvaluator().evaluate([result])
+        assert not report.all_passed
+
+    def test_exhausted_run_budget_skips_remaining_scenarios(self):
+        executor = EvalExecutor(
+            agent=MockAgent(),
+            graders=_build_graders(),
+            skip_model_graders=True,
+            timeouts=TimeoutConfig(run_budget=0.0),
+        )
+        results = executor.run_scenarios(get_collection("compliance_missing_cases").scenarios)
+        assert all(not r.passed for r in results)
+        assert all("run budget" in r.review_reasons[0] for r in results)
@@ -0,0 +1,73 @@
+"""Tests for stratified sampled runs."""
+
+import pytest
+
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.graders.code_based.compliance_remediation import ComplianceRemediationGrader
+from eval_caregiver.graders.code_based.geo_restriction import GeoRestrictionGrader
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.runner.quality_gates import QualityGate, QualityGateEvaluator
+from eval_caregiver.runner.sampling import run_sampled, stratify
+from eval_caregiver.scenarios.loader import get_all_scenarios
+
+
+def _build_executor() -> EvalExecutor:
+    graders = [ComplianceGapGrader(), ComplianceRemediationGrader(), GeoRestrictionGrader()]
+    return EvalExecutor(agent=MockAgent(), graders={g.name: g for g in graders}, skip_model_graders=True)
+
+
+class TestStratify:
+    def test_every_scenario_in_one_stratum(self):
+        scenarios = get_all_scenarios()
+        strata = stratify(scenarios, _build_executor())
+        assert sum(len(members) for members in strata.values()) == len(scenarios)
+        assert {key[0] for key in strata} == {s.collection for s in scenarios}
+
+
+class TestRunSampled:
+    def test_full_fraction_is_exact(self):
+        scenarios = get_all_scenarios()
+        results, report = run_sampled(_build_executor(), scenarios, fraction=1.0)
+        assert len(results) == len(scenarios)
+        assert report.sample.rounds == 1
+        for gr in report.gate_results:
+            assert gr.ci_low == gr.ci_high == gr.actual_value
+            assert gr.conclusive is True
+
+    def test_inconclusive_gate_escalates(self):
+        # geo scores are 1.0 and 0.0, so a single geo sample can't decide a 0.5 gate
+        evaluator = QualityGateEvaluator(gates=[QualityGate(metric="geo_restriction_detection", threshold=0.5)])
+        scenarios = get_all_scenarios()
+        results, report = run_sampled(_build_executor(), scenarios, fraction=0.1, evaluator=evaluator)
+        assert report.sample.rounds > 1
+        assert report.gate_results[0].conclusive is True
+        assert report.sample.sampled_scenarios == len(results)
+
+    def test_sampling_is_deterministic(self):
+        scenarios = get_all_scenarios()
+        first, _ = run_sampled(_build_executor(), scenarios, fraction=0.3, seed=7)
+        second, _ = run_sampled(_build_executor(), scenarios, fraction=0.3, seed=7)
+        assert [r.scenario_id for r in first] == [r.scenario_id for r in second]
+
+    def test_estimate_weights_strata_by_population(self):
+        gate = QualityGate(metric="compliance_gap_detection", threshold=0.0)
+        executor = _build_executor()
+        scenarios = get_all_scenarios()
+        results, report = run_sampled(
+            executor, scenarios, fraction=0.1, evaluator=QualityGateEvaluator(gates=[gate])
+        )
+        strata = stratify(scenarios, executor)
+        stratum_of = {s.scenario_id: key for key, members in strata.items() for s in members}
+        sampled: dict = {}
+        for result in results:
+            for gr in result.grader_results:
+                if gr.grader_name == "compliance_gap_detection":
+                    sampled.setdefault(stratum_of[result.scenario_id], []).append(gr.score)
+        population = {key: len(strata[key]) for key in sampled}
+        expected = sum(population[key] * sum(v) / len(v) for key, v in sampled.items()) / sum(population.values())
+        assert report.gate_results[0].actual_value == pytest.approx(expected)
+
+    def test_invalid_fraction(self):
+        with pytest.raises(ValueError, match="Sample fraction"):
+            run_sampled(_build_executor(), get_all_scenarios(), fraction=0.0)
@@ -0,0 +1,85 @@
+"""Tests for duration history and longest-first scheduling."""
+
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.graders.code_based.compliance_remediation import ComplianceRemediationGrader
+from eval_caregiver.graders.code_based.geo_restriction import GeoRestrictionGrader
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.runner.scheduling import DurationHistory, heuristic_cost
+from eval_caregiver.scenarios.loader import get_all_scenarios
+
+
+def _build_executor(history: DurationHistory | None) -> EvalExecutor:
+    graders = [ComplianceGapGrader(), ComplianceRemediationGrader(), GeoRestrictionGrader()]
+    return EvalExecutor(
+        agent=MockAgent(),
+        graders={g.name: g for g in graders},
+        skip_model_graders=True,
+        history=history,
+    )
+
+
+class TestDurationHistory:
+    def test_unknown_scenario(self):
+        assert DurationHistory().get("missing") is None
+
+    def test_smoothing(self):
+        history = DurationHistory(smoothing=0.5)
+        history.record("s1", 2.0)
+        history.record("s1", 4.0)
+        assert history.get("s1") == 3.0
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "durations.json"
+        history = DurationHistory(path)
+        history.record("s1", 1.5)
+        history.save()
+        assert DurationHistory(path).get("s1") == 1.5
+
+
+class TestScheduling:
+    def test_heuristic_weights_model_graders(self):
+        assert heuristic_cost(2, 1) > heuristic_cost(3, 0) > heuristic_cost(1, 0)
+
+    def test_multi_grader_scenarios_start_first_without_history(self):
+        executor = _build_executor(DurationHistory())
+        scenarios = get_all_scenarios()
+        first = scenarios[executor.schedule(scenarios)[0]]
+        # Only registered graders count, so the unregistered eligibility graders add nothing.
+        assert len(executor.active_grader_names(first)) == 2
+
+    def test_history_overrides_heuristic(self):
+        history = DurationHistory()
+        for scenario in get_all_scenarios():
+            history.record(scenario.scenario_id, 0.1)
+        history.record("geo_no_alternatives", 120.0)
+        executor = _build_executor(history)
+        scenarios = get_all_scenarios()
+        assert scenarios[executor.schedule(scenarios)[0]].scenario_id == "geo_no_alternatives"
+
+    def test_run_records_durations(self):
+        history = DurationHistory()
+        executor = _build_executor(history)
+        scenarios = get_all_scenarios()
+        executor.run_scenarios(scenarios)
+        assert all(history.get(s.scenario_id) is not None for s in scenarios)
+
+    def test_heuristic_counts_only_active_graders(self):
+        executor = _build_executor(DurationHistory())
+        scenario = get_all_scenarios()[0].model_copy(
+            update={"grader_names": ["compliance_gap_detection", "unregistered", "safe_area_suggestion_quality"]}
+        )
+        assert executor.expected_duration(scenario) == heuristic_cost(1, 0)
+
+    def test_heuristic_is_scaled_to_recorded_seconds(self):
+        scenarios = get_all_scenarios()
+        history = DurationHistory()
+        # Every recorded scenario is fast, so an unrecorded one should not jump ahead of them
+        # merely because heuristic units are larger than the recorded seconds.
+        for scenario in scenarios[1:]:
+            history.record(scenario.scenario_id, 0.001 * len(scenario.grader_names))
+        executor = _build_executor(history)
+        order = executor.schedule(scenarios)
+        assert order[0] != 0
+        scale = executor._seconds_per_unit(scenarios)
+        assert executor.expected_duration(scenarios[0], seconds_per_unit=scale) < 0.01
@@ -0,0 +1,103 @@
+"""Tests for the columnar score matrix."""
+
+import math
+
+import numpy as np
+import pytest
+
+from eval_caregiver.runner.quality_gates import QualityGateEvaluator
+from eval_caregiver.runner.records import GraderRecord, ScenarioRecord
+from eval_caregiver.runner.score_matrix import ScoreMatrix
+from eval_caregiver.schemas.grader_results import GraderResult, ScenarioResult
+
+
+def _record(sid, collection, graders, *, passed=True, required=True, review=False):
+    return ScenarioRecord(
+        scenario_id=sid,
+        scenario_name=sid.upper(),
+        grader_results=tuple(GraderRecord(name, score >= 0.5, score) for name, score in graders),
+        passed=passed,
+        needs_manual_review=review,
+        collection=collection,
+        required=required,
+    )
+
+
+RESULTS = [
+    _record("a", "compliance", [("gap", 1.0), ("remediation", 0.5)]),
+    _record("b", "compliance", [("gap", 0.0)], passed=False, review=True),
+    _record("c", "geo", [("geo", 0.75)], required=False),
+    _record("d", "geo", [], passed=True),
+]
+
+
+class TestScoreMatrix:
+    def setup_method(self):
+        self.matrix = ScoreMatrix.from_results(RESULTS)
+
+    def test_layout(self):
+        m = self.matrix
+        assert m.scenario_ids == ["a", "b", "c", "d"]
+        assert m.grader_names == ["gap", "remediation", "geo"]
+        assert m.scores.shape == (4, 3)
+        assert m.ran.sum() == 4
+        assert math.isnan(m.scores[3, 0])
+        assert m.passed[0].tolist() == [True, True, False]
+
+    def test_grader_scores_and_means(self):
+        assert self.matrix.grader_scores("gap").tolist() == [1.0, 0.0]
+        assert self.matrix.grader_mean("gap") == 0.5
+        assert self.matrix.grader_mean("missing") == 1.0
+        assert self.matrix.grader_scores("missing").size == 0
+
+    def test_totals(self):
+        assert self.matrix.totals() == {"total": 4, "passed": 3, "failed": 1, "needs_review": 1}
+
+    def test_by_collection(self):
+        breakdown = self.matrix.by_collection()
+        assert breakdown["compliance"] == {"scenarios": 2, "passed": 1, "required": 2, "mean_score": 0.375}
+        # "d" ran no graders, so only "c" counts towards the mean.
+        assert breakdown["geo"] == {"scenarios": 2, "passed": 2, "required": 1, "mean_score": 0.75}
+
+    def test_by_grader(self):
+        assert self.matrix.by_grader() == {
+            "gap": {"runs": 2, "passed": 1, "mean_score": 0.5},
+            "remediation": {"runs": 1, "passed": 1, "mean_score": 0.5},
+            "geo": {"runs": 1, "passed": 1, "mean_score": 0.75},
+        }
+
+    def test_empty(self):
+        m = ScoreMatrix.from_results([])
+        assert len(m) == 0
+        assert m.totals()["total"] == 0
+        assert m.by_collection() == {} and m.by_grader() == {}
+
+    def test_pydantic_results_have_no_collection(self):
+        result = ScenarioResult(
+            scenario_id="x",
+            scenario_name="X",
+            grader_results=[GraderResult(grader_name="gap", passed=True, score=1.0)],
+            passed=True,
+        )
+        assert list(ScoreMatrix.from_results([result]).by_collection()) == [""]
+
+
+class TestGatesOnMatrix:
+    def test_matrix_and_results_evaluate_identically(self):
+        evaluator = QualityGateEvaluator()
+        from_results = evaluator.evaluate(RESULTS)
+        from_matrix = evaluator.evaluate(ScoreMatrix.from_results(RESULTS))
+        assert [(g.actual_value, g.passed) for g in from_results.gate_results] == [
+            (g.actual_value, g.passed) for g in from_matrix.gate_results
+        ]
+
+    def test_large_matrix(self):
+        rng = np.random.default_rng(0)
+        scores = rng.random(20_000)
+        results = [
+            _record(f"s{i}", f"c{i % 7}", [("compliance_gap_detection", float(score))])
+            for i, score in enumerate(scores)
+        ]
+        report = QualityGateEvaluator().evaluate(results)
+        assert report.gate_results[0].actual_value == pytest.approx(scores.mean())
+        assert sum(row["scenarios"] for row in ScoreMatrix.from_results(results).by_collection().values()) == 20_000
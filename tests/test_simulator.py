@@ -0,0 +1,160 @@
+"""Tests for the rule-driven caregiver simulator."""
+
+import pytest
+
+from eval_caregiver.agent.base import AgentOutput
+from eval_caregiver.graders.code_based.compliance_mention import ComplianceMentionGrader
+from eval_caregiver.graders.code_based.scheduling_offer import SchedulingOfferGrader
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.scenarios.generator import ScenarioGenerator
+from eval_caregiver.scenarios.loader import get_all_scenarios, get_scenario
+from eval_caregiver.schemas.caregiver import CaregiverProfile, StructuredIntakeRecord
+from eval_caregiver.schemas.conversation import AgentActionLog, ConversationTranscript
+from eval_caregiver.simulator import AgentSession, CaregiverSimulator, SimulatedConversationAgent
+
+_CHECKLIST = [
+    "Welcome! Let me start with your compliance records.",
+    "Which areas or zones do you want to work in?",
+    "What pay rate and weekly hours are you looking for?",
+]
+
+
+class ChecklistSession(AgentSession):
+    """Asks a fixed list of questions, offers to schedule what the caregiver lacks, then wraps up."""
+
+    def __init__(self, scenario):
+        self.scenario = scenario
+        self.questions = list(_CHECKLIST)
+        self.heard: list[str] = []
+        self.offered = False
+
+    def respond(self, caregiver_message):
+        if caregiver_message is not None:
+            self.heard.append(caregiver_message)
+        if self.questions:
+            return self.questions.pop(0)
+        if not self.offered:
+            self.offered = True
+            gaps = self.scenario.expected_compliance_gaps
+            if gaps:
+                return f"I can schedule your {', '.join(gaps)} for you. Shall I book it?"
+        return "Is there anything else I can help with?"
+
+    def finish(self, transcript: ConversationTranscript) -> AgentOutput:
+        return AgentOutput(
+            transcript=transcript,
+            intake_record=StructuredIntakeRecord(
+                caregiver=CaregiverProfile(caregiver_id="cg", full_name="Simulated"),
+                compliance_gaps=list(self.scenario.expected_compliance_gaps),
+            ),
+            action_log=AgentActionLog(scenario_id=transcript.scenario_id, scheduling_offered=self.offered),
+        )
+
+
+class TestCaregiverSimulator:
+    def test_answers_from_compliance_status(self):
+        simulator = CaregiverSimulator(get_scenario("compliance_cpr_missing"))
+        reply = simulator.reply("Do you have a current CPR certification?")
+        assert "CPR certification" in reply
+        assert "don't have" in reply or "never got" in reply
+
+    def test_only_mentioned_items_are_answered(self):
+        scenario = get_scenario("compliance_cpr_missing").model_copy(
+            update={"caregiver_setup": {"cpr_status": "valid", "tb_test_status": "expired"}}
+        )
+        reply = CaregiverSimulator(scenario).reply("When was your TB test?")
+        assert "TB test" in reply and "CPR" not in reply
+        assert CaregiverSimulator(scenario).gaps == ["tb_test"]
+
+    def test_states_zone_restrictions_and_refuses_excluded_zones(self):
+        simulator = CaregiverSimulator(get_scenario("geo_over_restricted"))
+        reply = simulator.reply("Which zones would you like to work in?")
+        assert "zone-a" in reply and "won't work in zone-b" in reply
+        assert "rather not work in zone-c" in simulator.reply("Would you consider zone-c? It's a safe area.")
+
+    def test_states_pay_demands(self):
+        scenario = get_scenario("compliance_cpr_missing").model_copy(
+            update={"caregiver_setup": {"desired_hourly_rate": 32, "minimum_weekly_hours": 35}}
+        )
+        reply = CaregiverSimulator(scenario).reply("What hourly rate are you after?")
+        assert reply == "I need at least $32 an hour and 35 hours a week."
+
+    def test_accepts_scheduling_for_gaps(self):
+        reply = CaregiverSimulator(get_scenario("compliance_cpr_unknown")).reply("Shall I book a class?")
+        assert "CPR certification" in reply
+
+    def test_closing_ends_the_conversation(self):
+        simulator = CaregiverSimulator(get_scenario("compliance_cpr_present"))
+        simulator.reply("Thanks. Is there anything else I can help with?")
+        assert simulator.done
+
+    def test_unmatched_message_is_acknowledged(self):
+        simulator = CaregiverSimulator(get_scenario("compliance_cpr_present"))
+        assert simulator.reply("Great to meet you.") in ("Okay.", "Sounds good.", "Sure, go ahead.", "Got it, thanks.")
+
+    def test_same_seed_gives_same_wording(self):
+        scenario = get_scenario("compliance_cpr_unknown")
+        messages = ["Tell me about your certifications.", "And your CPR?", "Can I book that for you?"]
+
+        def replies(seed):
+            simulator = CaregiverSimulator(scenario, seed=seed)
+            return [simulator.reply(m) for m in messages]
+
+        assert replies(3) == replies(3)
+        assert len({tuple(replies(seed)) for seed in range(10)}) > 1
+
+    def test_repeat_questions_are_marked(self):
+        simulator = CaregiverSimulator(get_scenario("compliance_cpr_missing"))
+        simulator.reply("Do you have CPR?")
+        again = simulator.reply("Just to confirm, do you have CPR?")
+        assert again.startswith(("Like I said, ", "As I mentioned, ", "Again, "))
+
+
+class TestSimulatedConversationAgent:
+    def test_conversation_follows_the_session(self):
+        agent = SimulatedConversationAgent(ChecklistSession)
+        output = agent.run_scenario(get_scenario("compliance_cpr_missing"))
+        turns = output.transcript.turns
+        assert [t.role for t in turns] == ["agent", "caregiver"] * 5
+        assert [t.turn_number for t in turns] == list(range(1, 11))
+        assert "CPR" in turns[1].content
+        assert turns[-1].content in ("No, that's everything. Thanks!", "That's all from me, thank you.")
+        assert output.action_log.scheduling_offered
+
+    def test_max_turns_caps_the_conversation(self):
+        agent = SimulatedConversationAgent(ChecklistSession, max_turns=3)
+        output = agent.run_scenario(get_scenario("compliance_cpr_missing"))
+        assert [t.role for t in output.transcript.turns] == ["agent", "caregiver", "agent"]
+
+    def test_rejects_non_positive_max_turns(self):
+        with pytest.raises(ValueError, match="max_turns"):
+            SimulatedConversationAgent(ChecklistSession, max_turns=0)
+
+    def test_every_bundled_and_generated_scenario_runs(self):
+        agent = SimulatedConversationAgent(ChecklistSession, seed=1)
+        scenarios = get_all_scenarios() + list(ScenarioGenerator(seed=4).scenarios(300))
+        transcripts = [agent.run_scenario(s).transcript for s in scenarios]
+        assert all(len(t.turns) >= 8 for t in transcripts)
+        assert transcripts == [agent.run_scenario(s).transcript for s in scenarios]
+
+    def test_graded_turn_by_turn(self):
+        agent = SimulatedConversationAgent(ChecklistSession)
+        graders = [ComplianceMentionGrader(), SchedulingOfferGrader()]
+        executor = EvalExecutor(agent, {g.name: g for g in graders})
+        scenario = get_scenario("compliance_cpr_missing").model_copy(
+            update={"grader_names": [g.name for g in graders]}
+        )
+        result = executor.run_scenario(scenario)
+        assert result.passed, result.grader_results
+
+    def test_cancel_reaches_only_its_conversation(self):
+        agent = SimulatedConversationAgent(ChecklistSession)
+        scenario = get_scenario("compliance_cpr_missing")
+        first, second = scenario.model_copy(), scenario.model_copy()
+        cancelled, finished = agent.stream_scenario(first), agent.stream_scenario(second)
+        next(cancelled)
+        next(finished)
+        agent.cancel(first)
+        assert len(list(cancelled)) == 1
+        assert len(list(finished)) == 9
+        assert agent._cancelled == {}
@@ -0,0 +1,94 @@
+"""Tests for the streaming JSONL scenario source."""
+
+import tracemalloc
+
+import pytest
+
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.graders.code_based.compliance_remediation import ComplianceRemediationGrader
+from eval_caregiver.graders.code_based.geo_restriction import GeoRestrictionGrader
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.scenarios.generator import ScenarioGenerator
+from eval_caregiver.scenarios.loader import get_all_scenarios
+from eval_caregiver.scenarios.streaming import JsonlScenarioSource, filter_scenarios, write_jsonl
+from eval_caregiver.schemas.scenarios import TestScenario
+
+
+def _build_executor(max_workers: int = 1) -> EvalExecutor:
+    graders = [ComplianceGapGrader(), ComplianceRemediationGrader(), GeoRestrictionGrader()]
+    return EvalExecutor(
+        agent=MockAgent(),
+        graders={g.name: g for g in graders},
+        skip_model_graders=True,
+        max_workers=max_workers,
+    )
+
+
+class TestJsonlScenarioSource:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "scenarios.jsonl"
+        scenarios = get_all_scenarios()
+        assert write_jsonl(scenarios, path) == len(scenarios)
+        assert list(JsonlScenarioSource(path)) == scenarios
+
+    def test_gzip_round_trip(self, tmp_path):
+        path = tmp_path / "scenarios.jsonl.gz"
+        scenarios = get_all_scenarios()
+        write_jsonl(scenarios, path)
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+        assert list(JsonlScenarioSource(path)) == scenarios
+
+    def test_filters(self, tmp_path):
+        path = tmp_path / "scenarios.jsonl"
+        write_jsonl(get_all_scenarios(), path)
+        geo = list(JsonlScenarioSource(path, collection="geo_over_restriction_cases"))
+        assert geo and all(s.collection == "geo_over_restriction_cases" for s in geo)
+        picked = list(JsonlScenarioSource(path, scenario_ids=["geo_over_restricted"]))
+        assert [s.scenario_id for s in picked] == ["geo_over_restricted"]
+
+    def test_filter_generated_stream(self):
+        generated = ScenarioGenerator(seed=2).scenarios(30)
+        kept = list(filter_scenarios(generated, grader="geo_restriction_detection", required=True))
+        assert len(kept) == 10
+        assert all("geo_restriction_detection" in s.grader_names for s in kept)
+
+    def test_invalid_line_reports_position(self, tmp_path):
+        path = tmp_path / "scenarios.jsonl"
+        write_jsonl(get_all_scenarios()[:1], path)
+        with path.open("a") as f:
+            f.write("\n{\"scenario_id\": \"broken\"}\n")
+        with pytest.raises(ValueError, match=r"scenarios.jsonl:3"):
+            list(JsonlScenarioSource(path))
+
+    def test_lazy_validation(self, tmp_path):
+        path = tmp_path / "scenarios.jsonl"
+        write_jsonl(get_all_scenarios()[:1], path)
+        with path.open("a") as f:
+            f.write("not json\n")
+        first = next(iter(JsonlScenarioSource(path)))
+        assert isinstance(first, TestScenario)
+
+    def test_runs_through_executor(self, tmp_path):
+        path = tmp_path / "scenarios.jsonl.gz"
+        scenarios = get_all_scenarios()
+        write_jsonl(scenarios, path)
+        results = _build_executor(max_workers=4).run_scenarios(JsonlScenarioSource(path))
+        assert [r.scenario_id for r in results] == [s.scenario_id for s in scenarios]
+
+    def test_memory_is_flat(self, tmp_path):
+        path = tmp_path / "scenarios.jsonl.gz"
+        template = get_all_scenarios()[0]
+        copies = (
+            template.model_copy(update={"scenario_id": f"copy_{i}"}) for i in range(20_000)
+        )
+        write_jsonl(copies, path)
+
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in JsonlScenarioSource(path))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert count == 20_000
+        assert peak < 2_000_000
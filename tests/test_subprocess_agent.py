@@ -0,0 +1,122 @@
+"""Tests for the persistent subprocess agent pool."""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import eval_caregiver
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.agent.protocol import AgentProtocolError
+from eval_caregiver.agent.subprocess_agent import AgentWorkerError, SubprocessAgent
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.runner.timeouts import TimeoutConfig
+from eval_caregiver.scenarios.loader import get_all_scenarios, get_scenario
+from eval_caregiver.schemas.scenarios import TestScenario
+
+_WORKER = [sys.executable, "-m", "eval_caregiver.agent.stub_worker"]
+# Workers must import eval_caregiver even when it is not installed.
+_ENV = {**os.environ, "PYTHONPATH": str(Path(eval_caregiver.__file__).parents[1])}
+# Writes a bad line before its reply for the "noisy" and "stale" scenarios, then
+# answers every request with an error naming the scenario.
+_OUT_OF_STEP = [
+    sys.executable,
+    "-c",
+    "import json, sys\n"
+    "for line in sys.stdin:\n"
+    "    request = json.loads(line)\n"
+    "    sid = request['params']['scenario_id']\n"
+    "    if sid == 'noisy':\n"
+    "        print('not json')\n"
+    "    elif sid == 'stale':\n"
+    "        print(json.dumps({'jsonrpc': '2.0', 'id': -1, 'result': None}))\n"
+    "    reply = {'jsonrpc': '2.0', 'id': request['id'], 'error': {'code': -32000, 'message': 'served ' + sid}}\n"
+    "    print(json.dumps(reply), flush=True)\n",
+]
+
+
+def _scenario(scenario_id: str) -> TestScenario:
+    return TestScenario(scenario_id=scenario_id, name="x", description="x", collection="x", grader_names=[])
+
+
+class TestSubprocessAgent:
+    def test_returns_recorded_response(self):
+        scenario = get_scenario("geo_over_restricted")
+        with SubprocessAgent(_WORKER, workers=1, env=_ENV) as agent:
+            assert agent.run_scenario(scenario) == MockAgent().run_scenario(scenario)
+
+    def test_workers_start_once(self):
+        with SubprocessAgent(_WORKER + ["--startup-delay", "0.2"], workers=2, env=_ENV) as agent:
+            executor = EvalExecutor(
+                agent=agent,
+                graders={ComplianceGapGrader().name: ComplianceGapGrader()},
+                max_workers=2,
+            )
+            results = executor.run_scenarios(get_all_scenarios())
+            assert not any(reason.startswith("Agent error") for r in results for reason in r.review_reasons)
+            assert agent.started == 2
+            assert agent.restarts == 0
+
+    def test_crashed_worker_is_replaced(self):
+        command = _WORKER + ["--crash-on", "compliance_cpr_missing"]
+        with SubprocessAgent(command, workers=1, env=_ENV) as agent:
+            with pytest.raises(AgentWorkerError, match="exited"):
+                agent.run_scenario(get_scenario("compliance_cpr_missing"))
+            assert agent.run_scenario(get_scenario("geo_over_restricted")).transcript.turns
+            assert agent.restarts >= 1
+
+    def test_error_reply(self):
+        unknown = _scenario("nonexistent")
+        with SubprocessAgent(_WORKER, workers=1, env=_ENV) as agent:
+            with pytest.raises(AgentWorkerError, match="No response"):
+                agent.run_scenario(unknown)
+            assert agent.restarts == 0
+
+    def test_timeout_kills_hung_worker(self):
+        hang = [sys.executable, "-c", "import time; time.sleep(60)"]
+        with SubprocessAgent(hang, workers=1, env=_ENV) as agent:
+            executor = EvalExecutor(
+                agent=agent,
+                graders={ComplianceGapGrader().name: ComplianceGapGrader()},
+                timeouts=TimeoutConfig(agent=0.2),
+            )
+            started = time.perf_counter()
+            result = executor.run_scenario(get_scenario("compliance_cpr_missing"))
+            assert result.review_reasons[0].startswith("Timed out: agent")
+            deadline = time.perf_counter() + 5
+            while agent.restarts == 0 and time.perf_counter() < deadline:
+                time.sleep(0.01)
+            assert agent.restarts == 1
+            assert time.perf_counter() - started < 5
+
+    def test_cancel_reaches_only_its_trial(self):
+        scenario = get_scenario("geo_over_restricted")
+        first, second = scenario.model_copy(), scenario.model_copy()
+        with SubprocessAgent(_WORKER + ["--startup-delay", "0.5"], workers=2, env=_ENV) as agent:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                cancelled = pool.submit(agent.run_scenario, first)
+                finished = pool.submit(agent.run_scenario, second)
+                deadline = time.perf_counter() + 5
+                while len(agent._busy) < 2 and time.perf_counter() < deadline:
+                    time.sleep(0.01)
+                agent.cancel(first)
+                with pytest.raises(AgentWorkerError, match="cancelled"):
+                    cancelled.result()
+                assert finished.result().transcript.turns
+            assert agent._busy == {}
+            assert agent._cancelled == set()
+
+    @pytest.mark.parametrize("scenario_id, match", [("noisy", "non-JSON"), ("stale", "does not match")])
+    def test_protocol_error_retires_worker(self, scenario_id, match):
+        with SubprocessAgent(_OUT_OF_STEP, workers=1, env=_ENV) as agent:
+            with pytest.raises(AgentProtocolError, match=match):
+                agent.run_scenario(_scenario(scenario_id))
+            assert agent._busy == {}
+            assert agent.restarts == 1
+            # A fresh worker answers the next request, not the leftover line.
+            with pytest.raises(AgentWorkerError, match="served fine"):
+                agent.run_scenario(_scenario("fine"))
@@ -0,0 +1,120 @@
+"""Tests for the latency-injecting synthetic agent."""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from eval_caregiver.agent.synthetic import (
+    FixedLatency,
+    LognormalLatency,
+    ReplayedLatency,
+    SyntheticAgentError,
+    SyntheticLatencyAgent,
+    parse_latency,
+)
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.runner.scheduling import DurationHistory
+from eval_caregiver.scenarios.loader import get_all_scenarios, get_scenario
+
+
+class TestLatencyModels:
+    def test_lognormal_median(self):
+        model = LognormalLatency(median=0.2, sigma=0.5)
+        rng = random.Random(0)
+        samples = sorted(model.sample("s", rng) for _ in range(2001))
+        assert samples[1000] == pytest.approx(0.2, rel=0.1)
+
+    def test_replayed_falls_back(self, tmp_path):
+        path = tmp_path / "durations.json"
+        history = DurationHistory(path)
+        history.record("s1", 1.5)
+        history.save()
+        model = parse_latency(f"replay:{path}:0.25")
+        assert isinstance(model, ReplayedLatency)
+        assert model.sample("s1", random.Random()) == 1.5
+        assert model.sample("other", random.Random()) == 0.25
+
+    def test_parse_rejects_unknown(self):
+        with pytest.raises(ValueError, match="Unknown latency spec"):
+            parse_latency("uniform:1:2")
+
+
+class TestSyntheticLatencyAgent:
+    def setup_method(self):
+        self.scenario = get_scenario("compliance_cpr_missing")
+
+    def test_delays_and_returns_mock_response(self):
+        agent = SyntheticLatencyAgent(latency=FixedLatency(0.05))
+        started = time.perf_counter()
+        output = agent.run_scenario(self.scenario)
+        assert time.perf_counter() - started >= 0.05
+        assert "CPR Certification" in output.intake_record.compliance_gaps
+
+    def test_per_scenario_override(self):
+        agent = SyntheticLatencyAgent(
+            latency=FixedLatency(5.0), per_scenario={"compliance_cpr_missing": FixedLatency(0.0)}
+        )
+        started = time.perf_counter()
+        agent.run_scenario(self.scenario)
+        assert time.perf_counter() - started < 1.0
+
+    def test_failure_rate_is_reproducible(self):
+        def failures(seed):
+            agent = SyntheticLatencyAgent(failure_rate=0.3, seed=seed)
+            outcomes = []
+            for scenario in get_all_scenarios():
+                try:
+                    agent.run_scenario(scenario)
+                    outcomes.append(False)
+                except SyntheticAgentError:
+                    outcomes.append(True)
+            return outcomes
+
+        assert failures(1) == failures(1)
+        assert 0 < sum(failures(1)) < len(get_all_scenarios())
+
+    def test_cancel_interrupts_delay(self):
+        agent = SyntheticLatencyAgent(latency=FixedLatency(10.0))
+        errors = []
+
+        def run():
+            try:
+                agent.run_scenario(self.scenario)
+            except SyntheticAgentError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        time.sleep(0.05)
+        agent.cancel(self.scenario)
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+        assert errors
+        assert agent._cancelled == {}
+
+    def test_cancel_reaches_only_its_trial(self):
+        agent = SyntheticLatencyAgent(latency=FixedLatency(0.3))
+        first, second = self.scenario.model_copy(), self.scenario.model_copy()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            cancelled = pool.submit(agent.run_scenario, first)
+            finished = pool.submit(agent.run_scenario, second)
+            time.sleep(0.05)
+            agent.cancel(first)
+            with pytest.raises(SyntheticAgentError, match="Cancelled"):
+                cancelled.result()
+            assert finished.result().intake_record is not None
+        assert agent._cancelled == {}
+
+    def test_executor_records_injected_failures(self):
+        agent = SyntheticLatencyAgent(failure_rate=1.0)
+        executor = EvalExecutor(
+            agent=agent,
+            graders={ComplianceGapGrader().name: ComplianceGapGrader()},
+            max_workers=4,
+        )
+        results = executor.run_scenarios(get_all_scenarios())
+        assert all(not r.passed and r.review_reasons[0].startswith("Agent error") for r in results)
@@ -0,0 +1,92 @@
+"""Tests for repeated-trial runs and pass@k aggregation."""
+
+import itertools
+
+import pytest
+
+from eval_caregiver.agent.base import AgentBase
+from eval_caregiver.agent.mock_agent import MockAgent
+from eval_caregiver.graders.code_based.compliance_gap import ComplianceGapGrader
+from eval_caregiver.runner.executor import EvalExecutor
+from eval_caregiver.runner.trials import TrialSummary, pass_at_k
+from eval_caregiver.scenarios.loader import get_collection, get_scenario
+from eval_caregiver.schemas.grader_results import GraderResult, ScenarioResult
+
+
+def _trial(passed: bool, score: float) -> ScenarioResult:
+    return ScenarioResult(
+        scenario_id="s1",
+        scenario_name="S1",
+        grader_results=[GraderResult(grader_name="g1", passed=passed, score=score)],
+        passed=passed,
+    )
+
+
+class _FlakyAgent(AgentBase):
+    """Alternates between a good and a bad canned response."""
+
+    def __init__(self) -> None:
+        self._mock = MockAgent()
+        self._toggle = itertools.cycle([True, False])
+
+    def run_scenario(self, scenario):
+        if next(self._toggle):
+            return self._mock.run_scenario(scenario)
+        return self._mock.run_scenario(get_scenario("compliance_cpr_present"))
+
+
+class TestPassAtK:
+    def test_all_fail(self):
+        assert pass_at_k(5, 0, 3) == 0.0
+
+    def test_one_pass_in_k_equals_n(self):
+        assert pass_at_k(3, 1, 3) == 1.0
+
+    def test_pass_at_1_is_pass_rate(self):
+        assert pass_at_k(4, 1, 1) == pytest.approx(0.25)
+
+    def test_unbiased_estimate(self):
+        # 1 - C(2, 2) / C(4, 2)
+        assert pass_at_k(4, 2, 2) == pytest.approx(1 - 1 / 6)
+
+
+class TestTrialSummary:
+    def test_statistics(self):
+        summary = TrialSummary("s1", "S1", trials=[_trial(True, 1.0), _trial(False, 0.0), _trial(True, 1.0)])
+        assert summary.pass_rate == pytest.approx(2 / 3)
+        assert summary.pass_at_k() == 1.0
+        assert summary.score_mean == pytest.approx(2 / 3)
+        assert summary.score_variance == pytest.approx(1 / 3)
+
+    def test_aggregate_flags_inconsistency(self):
+        summary = TrialSummary("s1", "S1", trials=[_trial(True, 1.0), _trial(False, 0.5)])
+        result = summary.aggregate()
+        assert result.passed is False
+        assert result.grader_results[0].score == 0.75
+        assert result.needs_manual_review is True
+        assert "Inconsistent across trials: 1/2 passed" in result.review_reasons
+
+
+class TestRunTrials:
+    def test_groups_trials_per_scenario(self):
+        executor = EvalExecutor(
+            agent=MockAgent(), graders={"compliance_gap_detection": ComplianceGapGrader()}, max_workers=4
+        )
+        scenarios = get_collection("compliance_missing_cases").scenarios
+        summaries = executor.run_trials(scenarios, 3)
+        assert [s.scenario_id for s in summaries] == [s.scenario_id for s in scenarios]
+        assert all(len(s.trials) == 3 for s in summaries)
+        assert all(s.pass_rate == 1.0 for s in summaries)
+
+    def test_flaky_agent(self):
+        executor = EvalExecutor(agent=_FlakyAgent(), graders={"compliance_gap_detection": ComplianceGapGrader()})
+        scenario = get_scenario("compliance_cpr_missing")
+        summary = executor.run_trials([scenario], 4)[0]
+        assert summary.passes == 2
+        assert summary.pass_at_k(1) == 0.5
+        assert summary.aggregate().passed is False
+
+    def test_invalid_trial_count(self):
+        executor = EvalExecutor(agent=MockAgent(), graders={})
+        with pytest.raises(ValueError, match="trials must be >= 1"):
+            executor.run_trials([], 0)